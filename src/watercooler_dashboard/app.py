@@ -2,13 +2,14 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
 
-from watercooler_dashboard.thread_parser import ThreadParser
+from watercooler_dashboard.thread_parser import ThreadParser, ThreadView
 from watercooler_dashboard.blocks import build_dashboard_blocks
 
 # Load environment variables
@@ -25,6 +26,46 @@ logger = logging.getLogger(__name__)
 app = App(token=os.environ.get("SLACK_BOT_TOKEN"))
 
 
+@lru_cache(maxsize=4)
+def _get_parser(threads_base: str | None) -> ThreadParser:
+    """Return a shared ThreadParser per threads base instead of one per event."""
+    return ThreadParser(threads_base=threads_base)
+
+
+@lru_cache(maxsize=16)
+def _cached_threads(
+    threads_base: str | None, fingerprint: tuple[tuple[str, tuple[tuple[str, int, int], ...]], ...]
+) -> list[ThreadView]:
+    """Parse all threads once per distinct state of the thread files.
+
+    ``fingerprint`` is only part of the cache key: it carries every thread
+    file's ``(path, mtime_ns, size)``, so any edit (committed or not, in a git
+    checkout or not) produces a new key. Compact views are cached rather than
+    full records with entry bodies.
+    """
+    return _get_parser(threads_base).get_thread_views()
+
+
+@lru_cache(maxsize=16)
+def _cached_home_view(
+    threads_base: str | None, fingerprint: tuple[tuple[str, tuple[tuple[str, int, int], ...]], ...]
+) -> dict[str, Any]:
+    """Build the App Home view once per thread-data version.
+
+    The same view object is handed to every ``views_publish`` call, so it must
+    never be mutated by callers.
+    """
+    return {
+        "type": "home",
+        "blocks": build_dashboard_blocks(_cached_threads(threads_base, fingerprint)),
+    }
+
+
+def _home_view(threads_base: str | None = None) -> dict[str, Any]:
+    """Return the App Home view, rebuilding only when a thread file changed."""
+    return _cached_home_view(threads_base, _get_parser(threads_base).fingerprint())
+
+
 @app.event("app_home_opened")
 def update_home_tab(client, event, logger):
     """Update the App Home tab when a user opens it."""
@@ -32,22 +73,11 @@ def update_home_tab(client, event, logger):
         user_id = event["user"]
         logger.info(f"Home tab opened by user {user_id}")
 
-        # Parse threads from the current context
-        threads_base = os.getenv("WATERCOOLER_THREADS_BASE")
-        parser = ThreadParser(threads_base=threads_base)
-        threads_data = parser.get_all_threads()
-
-        # Build Block Kit view
-        blocks = build_dashboard_blocks(threads_data)
+        # Build (or reuse) the Block Kit view for the current thread state
+        view = _home_view(os.getenv("WATERCOOLER_THREADS_BASE"))
 
         # Publish the view
-        client.views_publish(
-            user_id=user_id,
-            view={
-                "type": "home",
-                "blocks": blocks,
-            },
-        )
+        client.views_publish(user_id=user_id, view=view)
         logger.info(f"Successfully updated home tab for user {user_id}")
 
     except Exception as e:
@@ -62,17 +92,8 @@ def handle_refresh_command(ack, respond, client, context):
         user_id = context["user_id"]
 
         # Trigger a home tab refresh by calling the event handler
-        parser = ThreadParser()
-        threads_data = parser.get_all_threads()
-        blocks = build_dashboard_blocks(threads_data)
-
-        client.views_publish(
-            user_id=user_id,
-            view={
-                "type": "home",
-                "blocks": blocks,
-            },
-        )
+        view = _home_view(os.getenv("WATERCOOLER_THREADS_BASE"))
+        client.views_publish(user_id=user_id, view=view)
 
         respond("Dashboard refreshed!")
     except Exception as e:
@@ -90,6 +111,9 @@ def main():
     if not bot_token:
         raise ValueError("SLACK_BOT_TOKEN environment variable is required")
 
+    # Socket Mode pulls in the websocket client stack; only import it when serving
+    from slack_bolt.adapter.socket_mode import SocketModeHandler
+
     logger.info("Starting Watercooler Dashboard...")
     handler = SocketModeHandler(app, app_token)
     handler.start()
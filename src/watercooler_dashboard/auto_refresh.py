@@ -25,10 +25,19 @@ class RefreshCoordinator:
 
     _instance: Optional[RefreshCoordinator] = None
 
+    # Seconds of quiet after the latest trigger before notifying subscribers
+    batch_window: float = 0.2
+    # Triggers buffered before subscribers are notified without waiting for quiet
+    max_batch_size: int = 32
+    # Maximum events buffered per subscriber before the oldest is dropped
+    queue_size: int = 8
+
     def __init__(self):
         self._subscribers: list[asyncio.Queue] = []
         self._last_refresh: Optional[datetime] = None
         self._refresh_count = 0
+        self._pending: list[dict] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     @classmethod
     def get_instance(cls) -> RefreshCoordinator:
@@ -43,7 +52,7 @@ class RefreshCoordinator:
         Yields:
             Event dictionaries with type, timestamp, and optional data.
         """
-        queue: asyncio.Queue = asyncio.Queue()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
         self._subscribers.append(queue)
 
         try:
@@ -65,6 +74,11 @@ class RefreshCoordinator:
     async def trigger_refresh(self, repo_path: str, reason: str = "update"):
         """Trigger a refresh event for all subscribers.
 
+        Delivery is debounced: each trigger restarts the ``batch_window`` timer,
+        so a burst (e.g. a pull touching many files) produces one notification
+        once it goes quiet. A burst of ``max_batch_size`` triggers is flushed
+        immediately so a steady stream cannot postpone notifications forever.
+
         Args:
             repo_path: Path to the repository that changed
             reason: Reason for refresh (e.g., "update", "fetch", "manual")
@@ -82,22 +96,45 @@ class RefreshCoordinator:
 
         logger.info(f"Refresh triggered: {reason} for {repo_path} (#{self._refresh_count})")
 
-        # Send to all subscribers
-        dead_queues = []
+        # Coalesce bursts (e.g. several repos updating at once) into one notification
+        self._pending.append(event)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        else:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+    def _flush(self):
+        """Notify subscribers once about every trigger since the last flush."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # Latest event wins; list every repo that changed within the window
+        event = dict(pending[-1])
+        event["repos"] = list(dict.fromkeys(item["repo"] for item in pending))
+        self._broadcast(event)
+
+    def _broadcast(self, event: dict):
+        """Send an event to all subscribers without blocking.
+
+        Queues are bounded; when a slow subscriber's queue is full its oldest
+        event is discarded, since clients only need the latest state.
+        """
         for queue in self._subscribers:
             try:
-                await asyncio.wait_for(queue.put(event), timeout=1.0)
-            except asyncio.TimeoutError:
-                logger.warning("Subscriber queue full, dropping event")
-                dead_queues.append(queue)
-            except Exception as e:
-                logger.error(f"Error sending to subscriber: {e}")
-                dead_queues.append(queue)
-
-        # Clean up dead queues
-        for queue in dead_queues:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                logger.debug("Subscriber queue full, dropped oldest event")
+                queue.put_nowait(event)
 
     def get_stats(self) -> dict:
         """Get coordinator statistics."""
@@ -184,10 +221,7 @@ class ThreadsPoller:
                 changed = await self._fetch_and_check()
 
                 if changed:
-                    await self.coordinator.trigger_refresh(
-                        str(self.repo_path),
-                        reason="git-update"
-                    )
+                    await self.coordinator.trigger_refresh(str(self.repo_path), reason="git-update")
 
             except asyncio.CancelledError:
                 break
@@ -208,13 +242,50 @@ class ThreadsPoller:
 
         try:
             # Get current HEAD commit
-            self._last_commit = self.repo.head.commit.hexsha
+            self._last_commit = self._read_head_sha()
         except Exception as e:
             logger.error(f"Error getting HEAD commit: {e}")
             self._last_commit = None
 
+    def _read_head_sha(self) -> Optional[str]:
+        """Resolve HEAD to a commit SHA by reading the git directory directly.
+
+        Avoids loading a full Commit object through GitPython on every poll tick.
+        Loose refs are preferred; ``packed-refs`` is only scanned when the loose
+        ref file is missing.
+
+        Returns:
+            The 40-character SHA, or None if HEAD points at an unborn branch.
+        """
+        if not self.repo:
+            return None
+
+        git_dir = Path(self.repo.git_dir)
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD stores the SHA directly
+
+        ref_name = head[5:].strip()
+        # Branch refs live in the common dir, which differs from git_dir for worktrees
+        common_dir = Path(self.repo.common_dir)
+        ref_path = common_dir / ref_name
+        if ref_path.is_file():
+            return ref_path.read_text(encoding="utf-8").strip()
+
+        packed_refs = common_dir / "packed-refs"
+        if packed_refs.is_file():
+            with packed_refs.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.startswith(("#", "^")):
+                        continue
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref_name:
+                        return sha
+
+        return None
+
     async def _fetch_and_check(self) -> bool:
-        """Fetch from remote and check if HEAD changed.
+        """Check the remote tip and fetch/pull only when it moved.
 
         Returns:
             True if repository was updated, False otherwise.
@@ -223,29 +294,28 @@ class ThreadsPoller:
             return False
 
         try:
-            # Run git fetch in a thread to avoid blocking
-            await asyncio.to_thread(self._do_fetch)
+            # Ask the remote for its branch tip first; this transfers no objects
+            remote_commit = await asyncio.to_thread(self._ls_remote_head)
 
             self._last_fetch = datetime.now()
-            self._fetch_count += 1
             self._error_count = 0  # Reset error count on success
             self._last_error = None
 
-            # Check if remote HEAD differs from cached commit
-            current_commit = self.repo.head.commit.hexsha
-
-            if current_commit != self._last_commit:
-                logger.info(
-                    f"Detected change: {self._last_commit[:7]} -> {current_commit[:7]}"
-                )
+            # Only fetch when the remote tip differs from the cached commit
+            if remote_commit is None or remote_commit == self._last_commit:
+                return False
 
-                # Pull changes
-                await asyncio.to_thread(self._do_pull)
+            logger.info(
+                f"Detected change: {(self._last_commit or 'none')[:7]} -> {remote_commit[:7]}"
+            )
 
-                self._last_commit = current_commit
-                return True
+            # Run git fetch and pull in a thread to avoid blocking
+            await asyncio.to_thread(self._do_fetch)
+            self._fetch_count += 1
+            await asyncio.to_thread(self._do_pull)
 
-            return False
+            self._last_commit = self._read_head_sha()
+            return True
 
         except GitCommandError as e:
             self._last_error = f"Git error: {e}"
@@ -258,6 +328,18 @@ class ThreadsPoller:
             logger.error(self._last_error)
             return False
 
+    def _ls_remote_head(self) -> Optional[str]:
+        """Return the remote tip of the active branch (blocking operation).
+
+        Uses ``git ls-remote`` so quiet repositories never download pack data.
+        """
+        if not self.repo or not self.repo.remotes:
+            return None
+
+        branch = self.repo.active_branch.name
+        output = self.repo.git.ls_remote("origin", f"refs/heads/{branch}")
+        return output.split(None, 1)[0] if output else None
+
     def _do_fetch(self):
         """Perform git fetch (blocking operation)."""
         if not self.repo or not self.repo.remotes:
@@ -291,3 +373,98 @@ class ThreadsPoller:
             "error_count": self._error_count,
             "last_error": self._last_error,
         }
+
+
+class MultiRepoPoller:
+    """Polls several threads repositories from a single background task.
+
+    Each tick checks every repository concurrently, with at most
+    ``max_concurrency`` git operations in flight, instead of running one
+    independently timed task per repository.
+    """
+
+    def __init__(
+        self,
+        repo_paths: list[Path],
+        interval: int = 20,
+        coordinator: Optional[RefreshCoordinator] = None,
+        max_concurrency: int = 4,
+    ):
+        """Initialize the poller.
+
+        Args:
+            repo_paths: Paths to the threads repositories to monitor
+            interval: Polling interval in seconds (default: 20)
+            coordinator: RefreshCoordinator instance (creates one if None)
+            max_concurrency: Maximum number of repositories checked at once
+        """
+        self.interval = interval
+        self.coordinator = coordinator or RefreshCoordinator.get_instance()
+        self.max_concurrency = max_concurrency
+        self.pollers = [
+            ThreadsPoller(repo_path=path, interval=interval, coordinator=self.coordinator)
+            for path in repo_paths
+        ]
+
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def start(self):
+        """Start the polling loop."""
+        if self._running:
+            logger.warning("Multi-repo poller already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._poll_loop())
+        logger.info(f"Started polling {len(self.pollers)} repo(s) every {self.interval}s")
+
+    async def stop(self):
+        """Stop the polling loop."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info(f"Stopped polling {len(self.pollers)} repo(s)")
+
+    async def _poll_loop(self):
+        """Main polling loop."""
+        for poller in self.pollers:
+            poller._update_last_commit()
+
+        while self._running:
+            try:
+                await asyncio.sleep(self.interval)
+
+                if not self._running:
+                    break
+
+                await self.poll_once()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in multi-repo poll loop: {e}")
+
+    async def poll_once(self):
+        """Check every repository once, bounded by ``max_concurrency``."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _poll_one(poller: ThreadsPoller):
+            async with semaphore:
+                changed = await poller._fetch_and_check()
+            if changed:
+                await self.coordinator.trigger_refresh(str(poller.repo_path), reason="git-update")
+
+        await asyncio.gather(*(_poll_one(poller) for poller in self.pollers))
+
+    def get_stats(self) -> list[dict]:
+        """Get per-repository poller statistics."""
+        return [{**poller.get_stats(), "running": self._running} for poller in self.pollers]
@@ -1,48 +1,108 @@
 """Build Slack Block Kit components for the dashboard."""
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
 from datetime import datetime
 
+from watercooler_dashboard.thread_parser import ThreadData, ThreadView
+
+# Static fragments for per-thread text, joined rather than formatted on the hot path
+_NEW_MARK = " :sparkles: *NEW*"
+_BALL_MARK = " :tennis:"
+_CTX_PREFIX = "Ball: *"
+_CTX_MID = "* | Entries: "
+_CTX_LAST = " | Last: "
+
+# Characters Slack requires escaping in mrkdwn text
+_MRKDWN_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+_STATUS_EMOJI = {
+    "OPEN": ":large_green_circle:",
+    "IN_REVIEW": ":large_yellow_circle:",
+    "BLOCKED": ":red_circle:",
+    "CLOSED": ":white_check_mark:",
+}
+
+# Blocks that never vary between renders. They are shared by reference across
+# every payload, so they must never be mutated.
+_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Watercooler Dashboard",
+        "emoji": True,
+    },
+}
+_EMPTY_SECTION = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "_No threads found. Start a conversation in your Watercooler threads repository._",
+    },
+}
+_DIVIDER = {"type": "divider"}
+_REFRESH_BUTTON = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "Refresh Dashboard",
+                "emoji": True,
+            },
+            "action_id": "refresh_dashboard",
+        }
+    ],
+}
+_STATUS_HEADERS = {
+    status: {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": f"*{_STATUS_EMOJI.get(status, ':question:')} {status}*",
+        },
+    }
+    for status in (*_STATUS_EMOJI, "OTHER")
+}
 
-def build_dashboard_blocks(threads_data: list[dict[str, Any]]) -> list[dict]:
+
+def build_dashboard_blocks(threads_data: Sequence[ThreadView | ThreadData]) -> list[dict]:
     """Build Slack Block Kit blocks for the dashboard view.
 
     Args:
-        threads_data: List of thread metadata dictionaries.
+        threads_data: Thread views, or thread metadata dictionaries which are
+            converted to views first.
 
     Returns:
         List of Block Kit block dictionaries.
     """
-    blocks = []
-
-    # Header
-    blocks.append(
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "Watercooler Dashboard",
-                "emoji": True,
-            },
-        }
-    )
+    blocks = [_HEADER_BLOCK]
 
     if not threads_data:
-        blocks.append(
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "_No threads found. Start a conversation in your Watercooler threads repository._",
-                },
-            }
-        )
+        blocks.append(_EMPTY_SECTION)
         return blocks
 
-    # Summary stats
-    active_count = sum(1 for t in threads_data if t["status"] == "OPEN")
-    review_count = sum(1 for t in threads_data if t["status"] == "IN_REVIEW")
-    blocked_count = sum(1 for t in threads_data if t["status"] == "BLOCKED")
+    # Group threads by status in a single pass; counts derive from the groups
+    status_groups: dict[str, list[ThreadView]] = {
+        "OPEN": [],
+        "IN_REVIEW": [],
+        "BLOCKED": [],
+        "CLOSED": [],
+    }
+    other: list[ThreadView] = []
+
+    for thread in threads_data:
+        if not isinstance(thread, ThreadView):
+            thread = ThreadView.from_thread(thread)
+        status_groups.get(thread.status, other).append(thread)
+
+    if other:
+        status_groups["OTHER"] = other
+
+    active_count = len(status_groups["OPEN"])
+    review_count = len(status_groups["IN_REVIEW"])
+    blocked_count = len(status_groups["BLOCKED"])
 
     blocks.append(
         {
@@ -54,23 +114,7 @@ def build_dashboard_blocks(threads_data: list[dict[str, Any]]) -> list[dict]:
         }
     )
 
-    blocks.append({"type": "divider"})
-
-    # Group threads by status
-    status_groups = {
-        "OPEN": [],
-        "IN_REVIEW": [],
-        "BLOCKED": [],
-        "CLOSED": [],
-    }
-
-    for thread in threads_data:
-        status = thread["status"]
-        if status not in status_groups:
-            status_groups["OTHER"] = []
-            status_groups["OTHER"].append(thread)
-        else:
-            status_groups[status].append(thread)
+    blocks.append(_DIVIDER)
 
     # Render each status group
     for status, threads in status_groups.items():
@@ -78,49 +122,25 @@ def build_dashboard_blocks(threads_data: list[dict[str, Any]]) -> list[dict]:
             continue
 
         # Status header
-        emoji = _get_status_emoji(status)
-        blocks.append(
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{emoji} {status}*",
-                },
-            }
-        )
+        blocks.append(_STATUS_HEADERS[status])
 
         # Thread cards
         for thread in threads:
             blocks.extend(_build_thread_blocks(thread))
 
-        blocks.append({"type": "divider"})
+        blocks.append(_DIVIDER)
 
     # Refresh button
-    blocks.append(
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Refresh Dashboard",
-                        "emoji": True,
-                    },
-                    "action_id": "refresh_dashboard",
-                }
-            ],
-        }
-    )
+    blocks.append(_REFRESH_BUTTON)
 
     return blocks
 
 
-def _build_thread_blocks(thread: dict[str, Any]) -> list[dict]:
+def _build_thread_blocks(thread: ThreadView) -> list[dict]:
     """Build blocks for a single thread.
 
     Args:
-        thread: Thread metadata dictionary.
+        thread: Thread view.
 
     Returns:
         List of Block Kit blocks for the thread.
@@ -128,19 +148,19 @@ def _build_thread_blocks(thread: dict[str, Any]) -> list[dict]:
     blocks = []
 
     # Thread name with NEW marker
-    new_marker = " :sparkles: *NEW*" if thread["has_new"] else ""
-    ball_marker = " :tennis:" if thread.get("has_ball") else ""
-    topic_text = _escape_mrkdwn(thread.get("topic"))
+    new_marker = _NEW_MARK if thread.has_new else ""
+    ball_marker = _BALL_MARK if thread.has_ball else ""
+    topic_text = _escape_mrkdwn(thread.topic)
 
     blocks.append(
         {
             "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{topic_text}*{new_marker}{ball_marker}",
-                },
-            }
-        )
+            "text": {
+                "type": "mrkdwn",
+                "text": "".join(("*", topic_text, "*", new_marker, ball_marker)),
+            },
+        }
+    )
 
     # Thread details
     blocks.append(
@@ -149,9 +169,15 @@ def _build_thread_blocks(thread: dict[str, Any]) -> list[dict]:
             "elements": [
                 {
                     "type": "mrkdwn",
-                    "text": (
-                        f"Ball: *{_escape_mrkdwn(thread.get('ball_owner'))}* | "
-                        f"Entries: {thread['entry_count']} | Last: {_format_timestamp(thread['last_update'])}"
+                    "text": "".join(
+                        (
+                            _CTX_PREFIX,
+                            _escape_mrkdwn(thread.ball_owner),
+                            _CTX_MID,
+                            str(thread.entry_count),
+                            _CTX_LAST,
+                            _format_timestamp(thread.last_update),
+                        )
                     ),
                 }
             ],
@@ -170,15 +196,10 @@ def _get_status_emoji(status: str) -> str:
     Returns:
         Emoji string.
     """
-    emoji_map = {
-        "OPEN": ":large_green_circle:",
-        "IN_REVIEW": ":large_yellow_circle:",
-        "BLOCKED": ":red_circle:",
-        "CLOSED": ":white_check_mark:",
-    }
-    return emoji_map.get(status, ":question:")
+    return _STATUS_EMOJI.get(status, ":question:")
 
 
+@lru_cache(maxsize=4096)
 def _format_timestamp(timestamp: str | None) -> str:
     """Format a timestamp for display.
 
@@ -199,9 +220,4 @@ def _format_timestamp(timestamp: str | None) -> str:
 
 
 def _escape_mrkdwn(value: Any) -> str:
-    text = str(value or "")
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+    return str(value or "").translate(_MRKDWN_TABLE)
@@ -5,20 +5,23 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (`speedups` extra); fall back to stdlib json.
+    orjson = None
 
 
 CONFIG_ENV_VAR = "WATERCOOLER_DASHBOARD_CONFIG"
-DEFAULT_CONFIG_PATH = (
-    Path.home() / ".config" / "watercooler-dashboard" / "config.json"
-)
+DEFAULT_CONFIG_PATH = Path.home() / ".config" / "watercooler-dashboard" / "config.json"
 
 
-def _candidate_roots() -> List[Path]:
+def _candidate_roots(cwd: Path) -> List[Path]:
     """Return potential directories that may contain `*-threads` repos."""
 
-    cwd = Path.cwd().resolve()
     module_root = Path(__file__).resolve().parents[2]
 
     candidates: List[Path] = [cwd, cwd.parent, module_root, module_root.parent]
@@ -36,17 +39,27 @@ def _candidate_roots() -> List[Path]:
 def _contains_thread_repos(path: Path) -> bool:
     """Return True if the directory contains at least one `*-threads` folder."""
 
-    if not path.exists():
-        return False
-
     try:
-        for child in path.iterdir():
-            if child.is_dir() and child.name.endswith("-threads"):
-                return True
-    except (OSError, PermissionError):
+        # scandir entries carry their file type, avoiding a stat per child
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith("-threads") and entry.is_dir() for entry in entries)
+    except OSError:
         return False
 
-    return False
+
+@lru_cache(maxsize=None)
+def _detect_threads_base(cwd: str) -> str:
+    """Scan candidate roots for `*-threads` repos, memoized per working directory.
+
+    Call `_detect_threads_base.cache_clear()` to force re-detection after the
+    filesystem layout changes.
+    """
+
+    for candidate in _candidate_roots(Path(cwd)):
+        if _contains_thread_repos(candidate):
+            return str(candidate.resolve())
+
+    return cwd
 
 
 def default_threads_base() -> str:
@@ -56,11 +69,7 @@ def default_threads_base() -> str:
     if env_value:
         return str(Path(env_value).expanduser().resolve())
 
-    for candidate in _candidate_roots():
-        if _contains_thread_repos(candidate):
-            return str(candidate.resolve())
-
-    return str(Path.cwd().resolve())
+    return _detect_threads_base(str(Path.cwd().resolve()))
 
 
 @dataclass
@@ -81,19 +90,44 @@ class DashboardConfig:
     def ensure_repo_order(self, repos: List[str]) -> None:
         """Ensure repo order contains all repositories once."""
 
-        existing = [repo for repo in self.repo_order if repo in repos]
-        missing = [repo for repo in repos if repo not in existing]
+        available = frozenset(repos)
+        if len(self.repo_order) == len(available) and frozenset(self.repo_order) == available:
+            return  # Already a permutation of the discovered repos; nothing to reconcile.
+        existing = [repo for repo in self.repo_order if repo in available]
+        kept = frozenset(existing)
+        missing = [repo for repo in repos if repo not in kept]
         self.repo_order = existing + missing
 
     def apply_thread_order(self, repo: str, threads: List[str]) -> None:
         """Ensure stored thread order matches available threads."""
 
-        stored = self.thread_order.get(repo, [])
-        existing = [thread for thread in stored if thread in threads]
-        missing = [thread for thread in threads if thread not in existing]
+        stored = self.thread_order.get(repo)
+        available = frozenset(threads)
+        if stored is not None and len(stored) == len(available) and frozenset(stored) == available:
+            return  # Already a permutation of the discovered threads; nothing to reconcile.
+        existing = [thread for thread in stored or () if thread in available]
+        kept = frozenset(existing)
+        missing = [thread for thread in threads if thread not in kept]
         self.thread_order[repo] = existing + missing
 
 
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config data as indented UTF-8 JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # orjson writes non-ASCII as raw UTF-8; match it so the bytes don't depend on the extra
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON config bytes."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def config_path() -> Path:
     """Return the filesystem path where config is stored."""
 
@@ -104,35 +138,69 @@ def config_path() -> Path:
     return DEFAULT_CONFIG_PATH
 
 
+# Last parsed config file, keyed by (path, inode, mtime_ns, size)
+_config_cache: Dict[str, Any] = {}
+
+
 def load_config() -> DashboardConfig:
-    """Load configuration from disk, falling back to defaults."""
+    """Load configuration from disk, falling back to defaults.
 
-    path = config_path()
-    if not path.exists():
-        return DashboardConfig()
+    The parsed file is cached until its inode, mtime or size changes; each call
+    still returns a fresh ``DashboardConfig`` that callers may mutate.
+    """
 
+    path = config_path()
     try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError:
-        # Malformed config; fall back to defaults but keep original file for inspection.
+        stat = path.stat()
+    except OSError:
         return DashboardConfig()
 
-    config = DashboardConfig()
-    threads_base = data.get("threads_base")
-    if threads_base:
-        config.threads_base = str(Path(threads_base).expanduser().resolve())
+    # save_config swaps files in with os.replace, so the inode changes on every
+    # write even when mtime granularity is coarse.
+    key = (str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get("entry")
+    if cached is not None and cached[0] == key:
+        threads_base, repo_order, thread_order = cached[1]
     else:
-        config.threads_base = default_threads_base()
-    config.repo_order = list(data.get("repo_order", []))
-    config.thread_order = {
-        repo: list(order) for repo, order in data.get("thread_order", {}).items()
-    }
-    return config
+        try:
+            data = _loads(path.read_bytes())
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
+            # Malformed config; fall back to defaults but keep original file for inspection.
+            return DashboardConfig()
 
+        threads_base = data.get("threads_base")
+        if threads_base:
+            threads_base = str(Path(threads_base).expanduser().resolve())
+        repo_order = tuple(data.get("repo_order", []))
+        thread_order = {repo: tuple(order) for repo, order in data.get("thread_order", {}).items()}
+        _config_cache["entry"] = (key, (threads_base, repo_order, thread_order))
 
-def save_config(config: DashboardConfig) -> None:
-    """Persist configuration to disk."""
+    return DashboardConfig(
+        threads_base=threads_base or default_threads_base(),
+        repo_order=list(repo_order),
+        thread_order={repo: list(order) for repo, order in thread_order.items()},
+    )
+
+
+def save_config(config: DashboardConfig, path: Path | None = None) -> None:
+    """Persist configuration to disk atomically, skipping no-op writes.
+
+    Args:
+        config: Configuration to write.
+        path: Destination file. Defaults to ``config_path()``.
+    """
+
+    path = path or config_path()
+    data = _dumps(config.to_dict())
+
+    try:
+        if path.read_bytes() == data:
+            return  # Nothing changed; skip the write entirely.
+    except OSError:
+        pass
 
-    path = config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(config.to_dict(), indent=2))
+    # Write to a sibling temp file and swap it in so readers never see a torn file.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import os
+import asyncio
+import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
-from git import Repo, InvalidGitRepositoryError, GitCommandError, Actor
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUTHOR_EMAIL = "dashboard@watercooler.dev"
+PUSH_ATTEMPTS = 3
+PUSH_RETRY_DELAY = 2.0  # seconds, multiplied by the attempt number
 
 
 class GitHelper:
@@ -19,12 +25,22 @@ class GitHelper:
             repo_path: Path to the git repository (threads repo).
         """
         self.repo_path = repo_path
-        print(f"[GitHelper] Initializing for repo_path: {repo_path}")
+        # Serializes index/ref updates between request threads
+        self._lock = threading.Lock()
+        # Serializes pushes only, so a slow remote never holds up local commits;
+        # git locks the refs a push reads while it runs
+        self._push_lock = threading.Lock()
+        self._push_task: Optional[asyncio.Task] = None
+        self._push_requested = False
+
+        # GitPython pulls in gitdb/smmap; import on first use rather than at module load
+        from git import InvalidGitRepositoryError, Repo
+
         try:
             self.repo = Repo(repo_path, search_parent_directories=False)
-            print(f"[GitHelper] Successfully initialized repo at {self.repo.working_dir}")
+            logger.debug(f"GitHelper initialized for {self.repo.working_dir}")
         except InvalidGitRepositoryError as e:
-            print(f"[GitHelper] Failed to initialize - not a git repository: {e}")
+            logger.warning(f"GitHelper unavailable - not a git repository: {e}")
             self.repo = None
 
     def is_available(self) -> bool:
@@ -40,6 +56,35 @@ class GitHelper:
     ) -> tuple[bool, Optional[str]]:
         """Commit and push a file change.
 
+        Args:
+            file_path: Path to the file to commit.
+            message: Commit message.
+            author_name: Override author name (defaults to git config).
+            author_email: Override author email (defaults to git config).
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        success, error = self.commit(file_path, message, author_name, author_email)
+        if not success:
+            return success, error
+
+        pushed, push_error = self.push()
+        if not pushed:
+            # Push failed, but commit succeeded
+            return True, f"Committed but push failed: {push_error}"
+
+        return True, None
+
+    def commit(
+        self,
+        file_path: Path,
+        message: str,
+        author_name: Optional[str] = None,
+        author_email: Optional[str] = None,
+    ) -> tuple[bool, Optional[str]]:
+        """Commit a file change locally without pushing.
+
         Args:
             file_path: Path to the file to commit.
             message: Commit message.
@@ -50,55 +95,34 @@ class GitHelper:
             Tuple of (success: bool, error_message: Optional[str])
         """
         if not self.repo:
-            print(f"[GitHelper] commit_and_push called but repo not initialized")
             return False, "Git repository not initialized"
 
-        print(f"[GitHelper] commit_and_push called for {file_path}")
-        print(f"[GitHelper] Message: {message}")
+        from git import Actor, GitCommandError
+
+        logger.debug(f"commit for {file_path}: {message}")
 
         try:
             # Make path relative to repo root
             try:
-                relative_path = file_path.relative_to(self.repo.working_dir)
-                print(f"[GitHelper] Relative path: {relative_path}")
-            except ValueError as e:
-                print(f"[GitHelper] File not in repository: {e}")
+                relative_path = str(file_path.relative_to(self.repo.working_dir))
+            except ValueError:
                 return False, f"File {file_path} is not in repository {self.repo.working_dir}"
 
-            # Stage the file
-            self.repo.index.add([str(relative_path)])
-            print(f"[GitHelper] File staged successfully")
-
-            # Check if there are changes to commit
-            diffs = list(self.repo.index.diff("HEAD"))
-            print(f"[GitHelper] Diffs found: {len(diffs)}")
-            if not diffs:
-                print(f"[GitHelper] No changes to commit")
-                return True, None  # No changes, but not an error
-
-            # Configure author if provided
-            if author_name:
-                author = Actor(author_name, author_email or 'dashboard@watercooler.dev')
-                print(f"[GitHelper] Using author: {author.name} <{author.email}>")
-                commit = self.repo.index.commit(message, author=author)
-            else:
-                commit = self.repo.index.commit(message)
-            print(f"[GitHelper] Committed successfully: {commit.hexsha[:7]}")
-
-            # Push to remote (if available)
-            if self.repo.remotes:
-                print(f"[GitHelper] Found {len(self.repo.remotes)} remote(s)")
-                try:
-                    origin = self.repo.remotes.origin
-                    print(f"[GitHelper] Pushing to origin...")
-                    push_info = origin.push()
-                    print(f"[GitHelper] Push completed: {push_info}")
-                except GitCommandError as e:
-                    # Push failed, but commit succeeded
-                    print(f"[GitHelper] Push failed: {e}")
-                    return True, f"Committed but push failed: {str(e)}"
-            else:
-                print(f"[GitHelper] No remotes configured")
+            with self._lock:
+                # Stage the file
+                self.repo.index.add([relative_path])
+
+                # Check if there are changes to commit
+                if not self._has_staged_changes(relative_path):
+                    return True, None  # No changes, but not an error
+
+                # Configure author if provided
+                if author_name:
+                    author = Actor(author_name, author_email or DEFAULT_AUTHOR_EMAIL)
+                    commit = self.repo.index.commit(message, author=author)
+                else:
+                    commit = self.repo.index.commit(message)
+            logger.debug(f"Committed {commit.hexsha[:7]}")
 
             return True, None
 
@@ -107,6 +131,82 @@ class GitHelper:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
+    def push(self) -> tuple[bool, Optional[str]]:
+        """Push the current branch to origin (blocking).
+
+        A push sends every unpushed commit, so one call covers any number of
+        local commits made since the last push.
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        if not self.repo:
+            return False, "Git repository not initialized"
+        if not self.repo.remotes:
+            return True, None  # Nothing to push to
+
+        from git import GitCommandError
+
+        try:
+            with self._push_lock:
+                push_info = self.repo.remotes.origin.push()
+            logger.debug(f"Push completed: {push_info}")
+            return True, None
+        except GitCommandError as e:
+            logger.warning(f"Push failed: {e}")
+            return False, str(e)
+
+    def schedule_push(self) -> bool:
+        """Push in a background task so callers can return immediately.
+
+        Requests made while a push is queued or running are coalesced into a
+        single follow-up push. Must be called from the event loop.
+
+        Returns:
+            True if a push was scheduled, False if there is no remote.
+        """
+        if not self.repo or not self.repo.remotes:
+            return False
+
+        self._push_requested = True
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.create_task(self._push_worker())
+        return True
+
+    async def wait_for_push(self) -> None:
+        """Wait for any queued background push to finish."""
+        if self._push_task is not None:
+            await self._push_task
+
+    async def _push_worker(self) -> None:
+        """Drain push requests, retrying failed pushes a bounded number of times."""
+        while self._push_requested:
+            self._push_requested = False
+            for attempt in range(1, PUSH_ATTEMPTS + 1):
+                success, error = await asyncio.to_thread(self.push)
+                if success:
+                    break
+                if attempt < PUSH_ATTEMPTS:
+                    await asyncio.sleep(PUSH_RETRY_DELAY * attempt)
+            else:
+                logger.error(f"Giving up on push for {self.repo_path}: {error}")
+
+    def _has_staged_changes(self, relative_path: str) -> bool:
+        """Return True if the staged copy of a path differs from HEAD.
+
+        Relies on the exit status of ``git diff-index --quiet`` (0 = clean,
+        1 = changed) instead of materializing diff objects in Python.
+        """
+        from git import GitCommandError
+
+        try:
+            self.repo.git.diff_index("--cached", "--quiet", "HEAD", "--", relative_path)
+        except GitCommandError as e:
+            if e.status == 1:
+                return True
+            raise
+        return False
+
 
 def get_repo_root(file_path: Path) -> Optional[Path]:
     """Find the git repository root for a file.
@@ -117,6 +217,8 @@ def get_repo_root(file_path: Path) -> Optional[Path]:
     Returns:
         Path to repository root, or None if not in a git repo.
     """
+    from git import InvalidGitRepositoryError, Repo
+
     try:
         repo = Repo(file_path, search_parent_directories=True)
         return Path(repo.working_dir) if repo.working_dir else None
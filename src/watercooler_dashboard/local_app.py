@@ -3,43 +3,238 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import gzip
+import hashlib
+import hmac
+import html
 import json
 import logging
+import os
 import secrets
+import stat
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Set
-from urllib.parse import urlparse
+from string import Template
+from typing import Any, AsyncGenerator, Callable, Dict, List
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
-
-from watercooler_dashboard.config import load_config, save_config
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, field_validator
+from starlette.types import Scope
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (`speedups` extra); fall back to stdlib json.
+    orjson = None
+
+from watercooler_dashboard.config import DashboardConfig, config_path, load_config, save_config
 from watercooler_dashboard.thread_parser import ThreadParser
 from watercooler_dashboard.git_helper import GitHelper, get_repo_root
-from watercooler_dashboard.auto_refresh import ThreadsPoller, RefreshCoordinator
+from watercooler_dashboard.auto_refresh import MultiRepoPoller, RefreshCoordinator
 
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Watercooler Dashboard (Local)")
 
+STATIC_DIR = Path(__file__).parent / "static"
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that marks content-versioned URLs as immutable.
+
+    The index page links assets as ``/static/<name>?v=<content hash>``, so a
+    changed file always gets a new URL and the browser can cache it forever.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and b"v=" in scope.get("query_string", b""):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+app.mount("/static", VersionedStaticFiles(directory=STATIC_DIR), name="static")
+
 # Cache GitHelper instances per repository
 _git_helpers: Dict[str, GitHelper] = {}
+# Helpers are created from worker threads; one per repo keeps its git lock unique
+_git_helpers_lock = threading.Lock()
+
+# Thread metadata writes (file rewrite plus git commit) allowed to run at once
+METADATA_WRITE_CONCURRENCY = 4
+_metadata_write_slots = threading.BoundedSemaphore(METADATA_WRITE_CONCURRENCY)
+
+
+def _json_bytes(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON, using orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(content)
+    text = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson when it is installed.
+
+    FastAPI's own ORJSONResponse is deprecated and hard-requires orjson, so
+    this keeps the stdlib fallback used elsewhere in the package.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _json_bytes(content)
+
+
+# Seconds between file-change checks on /api/data/stream
+DATA_STREAM_INTERVAL = 1.0
+
+# Seconds of silence on /api/data/stream before a keepalive comment is sent
+DATA_STREAM_KEEPALIVE = 15.0
+
+# Frames buffered per /api/data/stream client before the oldest is dropped
+DATA_STREAM_QUEUE_SIZE = 4
+
+# Pre-encoded SSE framing, so frames are assembled from bytes without formatting
+_SSE_ID = b"id: "
+_SSE_CHANGE_DATA = b"\nevent: change\ndata: "
+_SSE_DATA = b"data: "
+_SSE_END = b"\n\n"
+_SSE_KEEPALIVE = b": keepalive\n\n"
+
+# Encoded /api/data/stream change frames keyed by (from version, to version)
+CHANGE_FRAME_CACHE_SIZE = 16
+_change_frames: OrderedDict[tuple[str | None, str], bytes] = OrderedDict()
+_change_frames_lock = threading.Lock()
+
+# Serializes config load/modify/save cycles, which now run in worker threads
+_config_lock = threading.RLock()
+
+# Ordering changes are written at most once per CONFIG_SAVE_DELAY seconds. Until
+# then the (path, config) waiting to be written is what handlers load.
+CONFIG_SAVE_DELAY = 0.1
+_pending_config: tuple[Path, DashboardConfig] | None = None
+_config_save_timer: threading.Timer | None = None
+
+# The config handlers load and mutate in place, keyed by the config file's
+# (path, inode, mtime_ns, size) so an edit made outside the app is picked up
+_live_config: tuple[tuple, DashboardConfig] | None = None
+
+# Last /api/data payload and its encoded body, keyed by threads base, file
+# fingerprint and ordering
+_payload_cache: Dict[str, Any] = {}
+
+# Serialized threads keyed by (repo, file path), holding the (mtime_ns, size)
+# they were built from; least recently used entries are evicted first
+THREAD_CACHE_SIZE = 2048
+_thread_cache: OrderedDict[tuple[str, str], tuple[tuple[int, int], Dict[str, Any]]] = OrderedDict()
+
+# File that parsed threads are saved to on shutdown and loaded from on startup,
+# so a restart does not re-parse every thread. Persistence is off when unset.
+PARSE_CACHE_ENV_VAR = "WATERCOOLER_PARSE_CACHE"
+
+# /api/data bodies smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 512
+# gzip of the last /api/data body sent compressed, as (ETag, compressed bytes)
+_gzip_payload: Dict[str, tuple[str, bytes]] = {}
+
+# Bumped by every write a later /api/data response must reflect
+_payload_generation = 0
+# The /api/data build currently running and the generation it started in;
+# concurrent requests join it only while that generation is still current
+_inflight_payload: tuple[int, asyncio.Future] | None = None
+
+# Per-repo (key, entry, JSON fragment), so an unchanged repo is neither
+# re-serialized nor re-encoded when another repo changes
+_repo_fragments: Dict[str, tuple[tuple, Dict[str, Any], bytes]] = {}
 
 # Auto-refresh service instances
-_pollers: List[ThreadsPoller] = []
+_poller: MultiRepoPoller | None = None
 _coordinator: RefreshCoordinator = RefreshCoordinator.get_instance()
 
 PRIORITY_LEVELS = ("P0", "P1", "P2", "P3", "P4", "P5")
+_PRIORITY_RANK = {level: rank for rank, level in enumerate(PRIORITY_LEVELS)}
+STATUS_CACHE_SIZE = 128
+_STATUS_FORMS: Dict[str | None, tuple[str, str]] = {}
 CSRF_HEADER = "X-Watercooler-CSRF"
 CSRF_TOKEN = secrets.token_urlsafe(32)
-ALLOWED_HOSTS = {"127.0.0.1:8080", "localhost:8080", "testserver"}
+_CSRF_TOKEN_BYTES = CSRF_TOKEN.encode("ascii")
+ALLOWED_HOSTS = frozenset({"127.0.0.1:8080", "localhost:8080", "testserver"})
+# Origins accepted for every POST; only the request's own host is added per call
+_BASE_ORIGINS = frozenset(
+    f"{scheme}://{host}" for host in ALLOWED_HOSTS for scheme in ("http", "https")
+)
+
+
+class ThreadsBaseBody(BaseModel):
+    """Body of ``POST /api/config/threads-base``."""
+
+    threadsBase: str = ""
+
+
+def _stringify_order(value: Any) -> Any:
+    """Coerce the items of an order list to strings, leaving other values to validation."""
+
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return value
+
+
+class RepoOrderBody(BaseModel):
+    """Body of ``POST /api/repo-order``."""
+
+    order: List[str] | None = None
+
+    stringify_order = field_validator("order", mode="before")(_stringify_order)
+
+
+class ThreadOrderBody(BaseModel):
+    """Body of ``POST /api/thread-order``."""
+
+    repo: str = ""
+    order: List[str] | None = None
+
+    stringify_order = field_validator("order", mode="before")(_stringify_order)
+
+
+class ThreadMetadataBody(BaseModel):
+    """Body of ``POST /api/thread-metadata``."""
+
+    filePath: str = ""
+    updates: Dict[str, Any] | None = None
+    repo: str | None = None
+    originalTopic: str | None = None
+
 
+@lru_cache(maxsize=4)
+def _get_parser(threads_base: str) -> ThreadParser:
+    """Return the shared parser for ``threads_base``.
+
+    Reusing one instance lets the parser keep per-path state across requests.
+    Cleared when the threads base is changed through the API.
+    """
 
-def _get_parser(threads_base: str | None = None) -> ThreadParser:
     return ThreadParser(threads_base=threads_base)
 
 
+@lru_cache(maxsize=4096)
+def _cached_repo_root(directory: str) -> Path | None:
+    """Return the git repository root containing ``directory``, or None.
+
+    ``get_repo_root`` walks up the tree probing for ``.git`` on every call, so
+    results (including misses) are remembered per directory. Cleared when the
+    threads base is changed through the API.
+    """
+
+    return get_repo_root(Path(directory))
+
+
 def _get_git_helper(file_path: Path) -> GitHelper | None:
     """Get or create a GitHelper for the repository containing the file.
 
@@ -49,22 +244,358 @@ def _get_git_helper(file_path: Path) -> GitHelper | None:
     Returns:
         GitHelper instance, or None if not in a git repo.
     """
-    repo_root = get_repo_root(file_path)
+    repo_root = _cached_repo_root(str(file_path.parent))
     if not repo_root:
         return None
 
     repo_key = str(repo_root)
-    if repo_key not in _git_helpers:
-        _git_helpers[repo_key] = GitHelper(repo_root)
+    with _git_helpers_lock:
+        if repo_key not in _git_helpers:
+            _git_helpers[repo_key] = GitHelper(repo_root)
+        return _git_helpers[repo_key]
 
-    return _git_helpers[repo_key]
 
+def _write_thread_metadata(
+    parser: ThreadParser, resolved_path: Path, updates: Dict[str, Any]
+) -> tuple[Dict[str, Any] | None, GitHelper | None]:
+    """Rewrite a thread's metadata and commit it, returning the thread and git helper.
+
+    Runs in a worker thread: finding the repository (and opening it on first use)
+    and the commit are blocking. At most ``METADATA_WRITE_CONCURRENCY`` writes
+    run at once; pushing is left to the caller.
+    """
+
+    with _metadata_write_slots:
+        git_helper = _get_git_helper(resolved_path)
+        updated_thread = parser.update_thread_metadata(
+            resolved_path, updates, git_helper=git_helper, push=False
+        )
+    _bump_payload_generation()
+    return updated_thread, git_helper
+
+
+def _bump_payload_generation() -> None:
+    """Stop later /api/data requests from joining builds started before a write."""
+
+    global _payload_generation
+    _payload_generation += 1
+
+
+def _order_key(config: DashboardConfig) -> tuple:
+    """Return a hashable snapshot of the config fields that shape the payload."""
+
+    return (
+        tuple(config.repo_order),
+        tuple((repo, tuple(order)) for repo, order in sorted(config.thread_order.items())),
+    )
+
+
+def _load_config() -> DashboardConfig:
+    """Return the config, including changes that are still waiting to be written.
+
+    The same object is returned while the config file is unchanged on disk, so
+    handlers mutate it in place instead of rebuilding it from the file on every
+    request. Callers must hold ``_config_lock``. A pending config is returned
+    as is, so edits to it are part of the next scheduled write.
+    """
+
+    global _live_config
+
+    path = config_path()
+    if _pending_config is not None and _pending_config[0] == path:
+        return _pending_config[1]
+
+    try:
+        stat_result = path.stat()
+    except OSError:
+        # No file yet: defaults depend on the environment, so don't keep them
+        _live_config = None
+        return load_config()
+
+    key = (str(path), stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+    if _live_config is not None and _live_config[0] == key:
+        return _live_config[1]
 
-def _build_payload() -> Dict[str, Any]:
     config = load_config()
-    base_path = Path(config.threads_base)
+    _live_config = (key, config)
+    return config
+
+
+def _current_threads_base() -> str:
+    """Return the configured threads base, including a change not yet written."""
+
+    with _config_lock:
+        return _load_config().threads_base
+
+
+def _schedule_config_save(config: DashboardConfig) -> None:
+    """Write ``config`` within ``CONFIG_SAVE_DELAY``, merging saves made meanwhile.
+
+    Callers must hold ``_config_lock``.
+    """
+
+    global _pending_config, _config_save_timer
+
+    path = config_path()
+    if _pending_config is not None and _pending_config[0] != path:
+        _flush_config()
+    _pending_config = (path, config)
+    if _config_save_timer is None:
+        _config_save_timer = threading.Timer(CONFIG_SAVE_DELAY, _flush_config)
+        _config_save_timer.daemon = True
+        _config_save_timer.start()
+
+
+def _parse_cache_path() -> Path | None:
+    """Return the file parsed threads persist to between runs, if enabled."""
+
+    override = os.getenv(PARSE_CACHE_ENV_VAR)
+    return Path(override).expanduser() if override else None
+
+
+def _load_parse_cache(parser: ThreadParser) -> None:
+    """Warm ``parser`` from the persisted parse cache, when one is configured."""
+
+    cache_file = _parse_cache_path()
+    if cache_file is not None:
+        loaded = parser.load_cache(cache_file)
+        logger.info(f"Loaded {loaded} parsed thread(s) from {cache_file}")
+
+
+def _save_parse_cache() -> None:
+    """Persist the current parser's parsed threads, when a cache file is configured."""
+
+    cache_file = _parse_cache_path()
+    if cache_file is None:
+        return
+    parser = _get_parser(_current_threads_base())
+    try:
+        saved = parser.save_cache(cache_file)
+    except OSError as e:
+        logger.error(f"Failed to save parse cache to {cache_file}: {e}")
+        return
+    logger.info(f"Saved {saved} parsed thread(s) to {cache_file}")
+
+
+def _flush_config() -> None:
+    """Write the pending config, if any, right away."""
 
-    if not base_path.exists():
+    global _pending_config, _config_save_timer
+
+    with _config_lock:
+        if _config_save_timer is not None:
+            _config_save_timer.cancel()
+            _config_save_timer = None
+        pending, _pending_config = _pending_config, None
+        if pending is not None:
+            path, config = pending
+            try:
+                save_config(config, path)
+            except OSError as e:
+                logger.error(f"Failed to save config to {path}: {e}")
+
+
+# Daemon timers do not outlive the interpreter; write anything still pending
+atexit.register(_flush_config)
+
+
+def _update_config(mutate: Callable[[DashboardConfig], bool], defer: bool = False) -> None:
+    """Load, mutate and save the config under the config lock.
+
+    Args:
+        mutate: Callback that edits the config in place and returns True if it
+            changed anything worth saving.
+        defer: Batch the write with other changes made within
+            ``CONFIG_SAVE_DELAY`` instead of writing immediately.
+    """
+
+    with _config_lock:
+        config = _load_config()
+        if mutate(config):
+            if defer:
+                _schedule_config_save(config)
+            else:
+                _cancel_config_save()
+                save_config(config)
+            _bump_payload_generation()
+
+
+def _cancel_config_save() -> None:
+    """Drop the scheduled write before saving a config loaded with ``_load_config``.
+
+    That config already carries the pending changes. A write pending for another
+    config path is flushed instead. Callers must hold ``_config_lock``.
+    """
+
+    global _pending_config, _config_save_timer
+
+    if _pending_config is not None and _pending_config[0] != config_path():
+        _flush_config()
+        return
+    if _config_save_timer is not None:
+        _config_save_timer.cancel()
+        _config_save_timer = None
+    _pending_config = None
+
+
+def _build_payload() -> Dict[str, Any]:
+    # Builds run in worker threads and may write the reconciled ordering back,
+    # so hold the config lock to keep that from racing a POST handler's save.
+    with _config_lock:
+        return _build_payload_locked()
+
+
+def _build_payload_body() -> tuple[str, bytes]:
+    """Return the /api/data payload as an ETag and encoded JSON bytes."""
+
+    with _config_lock:
+        payload = _build_payload_locked()
+        if _payload_cache.get("payload") is payload:
+            return _payload_cache["etag"], _payload_cache["body"]
+        body = _json_bytes(payload)
+        return _etag(body), body
+
+
+def _build_payload_version() -> tuple[Dict[str, Any], str]:
+    """Return the /api/data payload together with its ETag."""
+
+    with _config_lock:
+        payload = _build_payload_locked()
+        if _payload_cache.get("payload") is payload:
+            return payload, _payload_cache["etag"]
+        return payload, _etag(_json_bytes(payload))
+
+
+async def _shared_payload_body() -> tuple[str, bytes]:
+    """Return ``_build_payload_body()``, joining a build that is already running.
+
+    Requests arriving together (several tabs reacting to one change event) share
+    one worker-thread build instead of queueing on the config lock to each walk
+    the thread files again. A build that started before the latest write is not
+    joined, so a request made after a write always sees it.
+    """
+
+    global _inflight_payload
+
+    inflight = _inflight_payload
+    if (
+        inflight is None
+        or inflight[0] != _payload_generation
+        or inflight[1].done()
+        or inflight[1].get_loop() is not asyncio.get_running_loop()
+    ):
+        future = asyncio.ensure_future(asyncio.to_thread(_build_payload_body))
+        inflight = _inflight_payload = (_payload_generation, future)
+    # Shielded so one client disconnecting does not cancel the others' build
+    return await asyncio.shield(inflight[1])
+
+
+def _payload_delta(previous: Dict[str, Any] | None, current: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe ``current`` relative to ``previous`` for the data stream.
+
+    Unchanged repos keep the same entry object across builds (see
+    ``_repo_entry``), so an identity check is enough to skip them. ``order``
+    always lists every repo, which also conveys additions and removals.
+    """
+
+    before = {repo["name"]: repo for repo in previous["repos"]} if previous else {}
+    return {
+        "threadsBase": current["threadsBase"],
+        "error": current["error"],
+        "order": [repo["name"] for repo in current["repos"]],
+        "repos": [repo for repo in current["repos"] if before.get(repo["name"]) is not repo],
+    }
+
+
+def _etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an ``Accept-Encoding`` header allows a gzip response.
+
+    An explicit ``gzip`` entry decides on its own; otherwise ``*`` does. Either
+    is refused by ``q=0`` (or a q-value that does not parse).
+    """
+
+    wildcard: bool | None = None
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        accepted = True
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    accepted = float(value) > 0
+                except ValueError:
+                    accepted = False
+        if coding == "*":
+            wildcard = accepted
+        else:
+            return accepted
+    return bool(wildcard)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Return True if an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 7232 prescribes for this header, so a tag that
+    a proxy marked weak (``W/"..."``) still revalidates, and ``*`` matches.
+    """
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _repo_entry(
+    repo_name: str,
+    threads: List[Dict[str, Any]],
+    ordered_topics: List[str],
+    stamps: tuple[tuple[str, int, int], ...] | None,
+    key: tuple,
+) -> tuple[Dict[str, Any], bytes]:
+    """Return the serialized entry and JSON fragment for one repo, reusing the cache.
+
+    Args:
+        repo_name: Display name of the repository.
+        threads: Parsed threads of the repository.
+        ordered_topics: Saved thread order for the repository.
+        stamps: The repo's ``(path, mtime_ns, size)`` fingerprint entries.
+        key: Cache key for the whole repo entry.
+
+    Returns:
+        The serialized repo entry and its encoded JSON fragment.
+    """
+
+    cached = _repo_fragments.get(repo_name)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    file_stamps = {path: (mtime_ns, size) for path, mtime_ns, size in stamps or ()}
+    ordered_threads = _order_threads(threads, ordered_topics)
+    entry = {
+        "name": repo_name,
+        "threads": [
+            _serialize_thread_cached(thread, repo_name, file_stamps) for thread in ordered_threads
+        ],
+    }
+    fragment = _json_bytes(entry)
+    _repo_fragments[repo_name] = (key, entry, fragment)
+    return entry, fragment
+
+
+def _build_payload_locked() -> Dict[str, Any]:
+    config = _load_config()
+
+    if not os.path.isdir(config.threads_base):
         return {
             "threadsBase": config.threads_base,
             "repos": [],
@@ -72,76 +603,177 @@ def _build_payload() -> Dict[str, Any]:
         }
 
     parser = _get_parser(config.threads_base)
-    grouped = parser.get_threads_by_repo()
+
+    # Reuse the last payload while thread files and ordering are unchanged;
+    # statting files is far cheaper than reading and parsing them.
+    fingerprint = parser.fingerprint()
+    loaded_order = _order_key(config)
+    if _payload_cache.get("key") == (config.threads_base, fingerprint, loaded_order):
+        return _payload_cache["payload"]
+
+    grouped = parser.get_threads_by_repo(fingerprint)
 
     repos = list(grouped.keys())
     config.ensure_repo_order(repos)
 
     repo_entries: List[Dict[str, Any]] = []
+    fragments: List[bytes] = []
+    repo_stamps = dict(fingerprint)
 
     for repo_name in config.repo_order:
-        threads = grouped.get(repo_name, [])
+        threads = grouped.get(repo_name)
+        if not threads:
+            # Still reconcile so a stale saved order is cleared, but there is
+            # nothing to order, serialize or cache for an empty repo
+            config.apply_thread_order(repo_name, [])
+            entry = {"name": repo_name, "threads": []}
+            repo_entries.append(entry)
+            fragments.append(_json_bytes(entry))
+            continue
+
         thread_topics = [thread["topic"] for thread in threads]
         config.apply_thread_order(repo_name, thread_topics)
 
         ordered_topics = config.thread_order.get(repo_name, thread_topics)
-        ordered_threads = _order_threads(threads, ordered_topics)
-
-        serialized_threads = [_serialize_thread(thread, repo_name) for thread in ordered_threads]
-
-        repo_entries.append(
-            {
-                "name": repo_name,
-                "threads": serialized_threads,
-            }
-        )
-
-    save_config(config)
+        stamps = repo_stamps.get(repo_name)
+        key = (config.threads_base, stamps, tuple(ordered_topics))
+        entry, fragment = _repo_entry(repo_name, threads, ordered_topics, stamps, key)
+        repo_entries.append(entry)
+        fragments.append(fragment)
+
+    for stale in _repo_fragments.keys() - set(config.repo_order):
+        del _repo_fragments[stale]
+
+    # Only write back when reconciling with the repos on disk changed the ordering
+    final_order = _order_key(config)
+    if final_order != loaded_order:
+        _cancel_config_save()
+        save_config(config)
 
     error_message = None
     if not repo_entries:
         error_message = "No thread repositories found in the selected directory."
 
-    return {
+    payload = {
         "threadsBase": config.threads_base,
         "repos": repo_entries,
         "error": error_message,
     }
+    # Key on the ordering as saved, which is what the next _load_config() returns
+    _payload_cache["key"] = (config.threads_base, fingerprint, final_order)
+    _payload_cache["payload"] = payload
+    _payload_cache["body"] = b"".join(
+        (
+            b'{"threadsBase":',
+            _json_bytes(config.threads_base),
+            b',"repos":[',
+            b",".join(fragments),
+            b'],"error":',
+            _json_bytes(error_message),
+            b"}",
+        )
+    )
+    _payload_cache["etag"] = _etag(_payload_cache["body"])
+    return payload
 
 
 def _order_threads(threads: List[Dict[str, Any]], order: List[str]) -> List[Dict[str, Any]]:
     lookup = {thread["topic"]: thread for thread in threads}
-    ordered = [lookup[topic] for topic in order if topic in lookup]
+    ordered = [thread for thread in map(lookup.get, order) if thread is not None]
 
-    # Include any new threads not yet present in ordering at the end.
-    remaining = [thread for topic, thread in lookup.items() if topic not in order]
+    # Include any new threads not yet present in ordering at the end. A set keeps
+    # the membership test O(1) instead of scanning the order list per thread.
+    order_set = frozenset(order)
+    remaining = [thread for topic, thread in lookup.items() if topic not in order_set]
     ordered.extend(sorted(remaining, key=lambda thread: thread["topic"].lower()))
     return ordered
 
 
+def _serialize_thread_cached(
+    thread: Dict[str, Any], repo: str, file_stamps: Dict[str, tuple[int, int]]
+) -> Dict[str, Any]:
+    """Serialize a thread, reusing the previous result while its file is unchanged.
+
+    When one thread in a repo changes, the rest of the repo's threads are served
+    from this cache instead of being serialized again.
+    """
+
+    file_path = thread.get("file_path")
+    stamp = file_stamps.get(file_path) if file_path else None
+    if stamp is None:
+        return _serialize_thread(thread, repo)
+
+    cache_key = (repo, file_path)
+    cached = _thread_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        _thread_cache.move_to_end(cache_key)
+        return cached[1]
+
+    serialized = _serialize_thread(thread, repo)
+    _thread_cache[cache_key] = (stamp, serialized)
+    if len(_thread_cache) > THREAD_CACHE_SIZE:
+        _thread_cache.popitem(last=False)
+    return serialized
+
+
+def _normalize_status(raw: str | None) -> tuple[str, str]:
+    """Return the display status and its normalized key, e.g. ``("IN REVIEW", "in_review")``.
+
+    A repo only ever uses a handful of distinct statuses, so results are
+    memoized; the table is capped to keep odd input from growing it unbounded.
+    """
+
+    cached = _STATUS_FORMS.get(raw)
+    if cached is not None:
+        return cached
+    status = (raw or "UNKNOWN").upper()
+    forms = (status, status.lower().replace(" ", "_"))
+    if len(_STATUS_FORMS) < STATUS_CACHE_SIZE:
+        _STATUS_FORMS[raw] = forms
+    return forms
+
+
+def _entry_preview(body: str, max_lines: int = 3) -> str:
+    """Return the first ``max_lines`` non-blank lines of ``body``, stripped.
+
+    Walks the body line by line and stops early, so long entries are not split
+    in full just to keep a few lines. Bodies come from the thread parser, whose
+    ``_split_header_and_body`` has already normalized line endings to ``\\n``.
+    """
+
+    lines: List[str] = []
+    start = 0
+    length = len(body)
+    while start < length and len(lines) < max_lines:
+        newline = body.find("\n", start)
+        end = length if newline == -1 else newline
+        line = body[start:end].strip()
+        if line:
+            lines.append(line)
+        start = end + 1
+    return "\n".join(lines)
+
+
 def _serialize_thread(thread: Dict[str, Any], repo: str) -> Dict[str, Any]:
     """Normalize thread data for the frontend."""
 
-    status = (thread.get("status") or "UNKNOWN").upper()
+    status, status_normalized = _normalize_status(thread.get("status"))
     priority = (thread.get("priority") or "P2").upper()
-    if priority not in PRIORITY_LEVELS:
+    priority_rank = _PRIORITY_RANK.get(priority)
+    if priority_rank is None:
         priority = "P2"
+        priority_rank = _PRIORITY_RANK[priority]
 
-    status_normalized = status.lower().replace(" ", "_")
-    priority_rank = PRIORITY_LEVELS.index(priority) if priority in PRIORITY_LEVELS else len(PRIORITY_LEVELS)
-
-    file_path = thread.get("file_path")
-    is_archived = False
-    if file_path:
-        try:
-            is_archived = "_archive" in Path(file_path).parts
-        except Exception:
-            is_archived = "_archive" in str(file_path)
+    # The parser records this while it still holds the Path; only fall back to
+    # splitting the string for thread dicts built elsewhere.
+    is_archived = thread.get("is_archived")
+    if is_archived is None:
+        file_path = thread.get("file_path")
+        is_archived = bool(file_path) and "_archive" in Path(file_path).parts
 
     def _serialize_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
         body = entry.get("body") or ""
-        preview_lines = [line.strip() for line in body.splitlines() if line.strip()]
-        preview = "\n".join(preview_lines[:3])
+        preview = _entry_preview(body)
         return {
             "title": entry.get("title"),
             "role": entry.get("role"),
@@ -182,30 +814,38 @@ def _serialize_thread(thread: Dict[str, Any], repo: str) -> Dict[str, Any]:
 
 
 def _origin_from_url(value: str | None) -> str | None:
+    # Only scheme and authority are needed, so split them out directly rather
+    # than running a full urlparse on every Origin/Referer header.
     if not value:
         return None
-    try:
-        parsed = urlparse(value)
-    except ValueError:
+    scheme, sep, rest = value.partition("://")
+    if not sep or not scheme:
         return None
-    if not parsed.scheme or not parsed.netloc:
+    end = len(rest)
+    for delimiter in "/?#":
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    if not end:
         return None
-    return f"{parsed.scheme}://{parsed.netloc}"
+    return f"{scheme.lower()}://{rest[:end]}"
 
 
-def _expected_origins(request: Request) -> Set[str]:
+def _expected_origins(request: Request) -> frozenset[str]:
     host = request.headers.get("host")
-    allowed_hosts = set(ALLOWED_HOSTS)
-    if host:
-        allowed_hosts.add(host)
-    origins: Set[str] = set()
-    for entry in allowed_hosts:
-        origins.add(f"http://{entry}")
-        origins.add(f"https://{entry}")
-    return origins
+    if not host or host in ALLOWED_HOSTS:
+        return _BASE_ORIGINS
+    return _BASE_ORIGINS | {f"http://{host}", f"https://{host}"}
 
 
 def _require_authorized_post(request: Request) -> None:
+    # Check the token first: it is the cheapest test and fails fast for forged
+    # requests. compare_digest keeps the comparison constant-time; bytes avoid
+    # its TypeError on non-ASCII header values.
+    token = request.headers.get(CSRF_HEADER, "")
+    if not hmac.compare_digest(token.encode("utf-8"), _CSRF_TOKEN_BYTES):
+        raise HTTPException(status_code=403, detail="Invalid or missing CSRF token")
+
     allowed_origins = _expected_origins(request)
 
     origin = _origin_from_url(request.headers.get("origin"))
@@ -216,2087 +856,140 @@ def _require_authorized_post(request: Request) -> None:
     if referer and referer not in allowed_origins:
         raise HTTPException(status_code=403, detail="Cross-site POST blocked")
 
-    token = request.headers.get(CSRF_HEADER)
-    if token != CSRF_TOKEN:
-        raise HTTPException(status_code=403, detail="Invalid or missing CSRF token")
 
+# Page shell; the stylesheet and script are served separately from STATIC_DIR
+INDEX_HTML = (TEMPLATE_DIR / "index.html").read_text(encoding="utf-8")
 
-INDEX_HTML = """<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8" />
-    <meta name="viewport" content="width=device-width, initial-scale=1" />
-    <meta name="watercooler-csrf" content="__CSRF_TOKEN__" />
-    <title>Watercooler Dashboard (Local)</title>
-    <style>
-      :root {
-        color-scheme: light;
-        font-family: "Inter", system-ui, -apple-system, "Segoe UI", Roboto, sans-serif;
-        --surface: #ffffff;
-        --surface-alt: #f2f5fb;
-        --border: #d6dae5;
-        --border-strong: #c0c6d4;
-        --accent: #2563eb;
-        --accent-soft: rgba(37, 99, 235, 0.14);
-        --text: #1f2933;
-        --text-muted: #52606d;
-        --success: #047857;
-        --danger: #b91c1c;
-        background: linear-gradient(180deg, #f8fafc 0%, #eff3f9 100%);
-      }
-
-      @media (prefers-color-scheme: dark) {
-        :root {
-          color-scheme: dark;
-          --surface: #1e1e1e;
-          --surface-alt: #2d2d2d;
-          --border: #3a3a3a;
-          --border-strong: #4a4a4a;
-          --accent: #60a5fa;
-          --accent-soft: rgba(96, 165, 250, 0.18);
-          --text: #e5e7eb;
-          --text-muted: #9ca3af;
-          --success: #10b981;
-          --danger: #ef4444;
-          background: linear-gradient(180deg, #111111 0%, #1a1a1a 100%);
-        }
-      }
-
-      body {
-        margin: 0;
-        color: var(--text);
-      }
-      .app-header {
-        padding: 2rem clamp(1.5rem, 2vw + 1rem, 3.5rem) 1.25rem;
-      }
-      .app-header h1 {
-        margin: 0;
-        font-size: clamp(1.8rem, 2vw + 1.2rem, 2.6rem);
-      }
-      .app-header p {
-        margin: 0.5rem 0 0;
-        max-width: 60ch;
-        color: var(--text-muted);
-      }
-      .config-panel {
-        margin: 0 clamp(1.5rem, 2vw + 1rem, 3.5rem) 1.5rem;
-        padding: 1.1rem 1.3rem;
-        border-radius: 1rem;
-        background: var(--surface);
-        border: 1px solid rgba(15, 23, 42, 0.07);
-        box-shadow: 0 12px 32px rgba(15, 23, 42, 0.08);
-      }
-      .config-form {
-        display: grid;
-        gap: 0.6rem;
-      }
-      .config-form label {
-        font-weight: 600;
-        font-size: 0.95rem;
-      }
-      .input-row {
-        display: flex;
-        gap: 0.8rem;
-        flex-wrap: wrap;
-      }
-      .input-row input {
-        flex: 1 1 260px;
-        padding: 0.55rem 0.8rem;
-        border-radius: 0.65rem;
-        border: 1px solid var(--border);
-        font-size: 0.95rem;
-        background: var(--surface);
-        color: var(--text);
-      }
-      .input-row input::placeholder {
-        color: var(--text-muted);
-      }
-      .input-row button {
-        padding: 0.55rem 1.1rem;
-        border-radius: 0.65rem;
-        border: 1px solid transparent;
-        background: var(--accent);
-        color: #fff;
-        font-weight: 600;
-        cursor: pointer;
-        box-shadow: 0 10px 20px rgba(37, 99, 235, 0.25);
-      }
-      .input-row button:hover {
-        background: #1d4ed8;
-      }
-      #configStatus {
-        font-size: 0.85rem;
-        color: var(--success);
-      }
-      .layout {
-        padding: 0 clamp(1.5rem, 2vw + 1rem, 3.5rem) 3rem;
-        display: grid;
-        grid-template-columns: 260px 1fr;
-        gap: 1.5rem;
-        align-items: flex-start;
-      }
-      .repo-pane {
-        display: grid;
-        gap: 1rem;
-      }
-      .repo-heading {
-        margin: 0;
-        font-size: 1.05rem;
-        font-weight: 600;
-        color: var(--text-muted);
-        letter-spacing: 0.02em;
-      }
-      .repo-list {
-        display: grid;
-        gap: 0.75rem;
-      }
-      .repo-card {
-        position: relative;
-        display: grid;
-        grid-template-columns: 1fr auto;
-        row-gap: 0.55rem;
-        align-items: center;
-        border-radius: 1rem;
-        padding: 0.95rem 1rem;
-        background: var(--surface);
-        border: 1px solid rgba(15, 23, 42, 0.1);
-        box-shadow: 0 12px 28px rgba(15, 23, 42, 0.1);
-        cursor: pointer;
-        transition: transform 0.18s ease, box-shadow 0.18s ease, border 0.18s ease, background 0.18s ease;
-        overflow: hidden;
-      }
-      .repo-card::before {
-        content: "";
-        position: absolute;
-        inset: 0;
-        border-radius: inherit;
-        background: linear-gradient(135deg, rgba(37, 99, 235, 0.15), rgba(37, 99, 235, 0));
-        opacity: 0;
-        transition: opacity 0.18s ease;
-      }
-      .repo-card.active::before {
-        opacity: 1;
-      }
-      .repo-card.active {
-        border-color: rgba(37, 99, 235, 0.55);
-        box-shadow: 0 18px 40px rgba(37, 99, 235, 0.2);
-        transform: translateY(-2px);
-      }
-      .repo-card:not(.active):hover {
-        border-color: rgba(37, 99, 235, 0.25);
-        box-shadow: 0 16px 34px rgba(37, 99, 235, 0.15);
-      }
-      .repo-card strong {
-        position: relative;
-        z-index: 1;
-        grid-column: 1 / span 2;
-        font-size: 1.02rem;
-        font-weight: 650;
-        color: var(--text);
-        letter-spacing: 0.01em;
-      }
-      .repo-card:not(.active) strong {
-        color: var(--text);
-      }
-      .repo-controls {
-        position: relative;
-        z-index: 1;
-        justify-self: end;
-        display: inline-flex;
-        gap: 0.4rem;
-      }
-      .repo-controls button {
-        border-radius: 0.55rem;
-        border: 1px solid rgba(37, 99, 235, 0.4);
-        padding: 0.28rem 0.52rem;
-        font-size: 0.78rem;
-        font-weight: 600;
-        color: var(--accent);
-        background: rgba(37, 99, 235, 0.12);
-        cursor: pointer;
-        transition: background 0.16s ease, color 0.16s ease, border 0.16s ease;
-      }
-      .repo-card:not(.active) .repo-controls button {
-        border-color: rgba(15, 23, 42, 0.08);
-        color: var(--text-muted);
-        background: rgba(15, 23, 42, 0.05);
-      }
-      .repo-controls button:hover:not(:disabled) {
-        background: rgba(37, 99, 235, 0.2);
-        color: #1d4ed8;
-      }
-      .content {
-        display: grid;
-        gap: 1.25rem;
-      }
-      .toolbar {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 1rem 1.5rem;
-        align-items: center;
-        padding: 1rem 1.2rem;
-        border-radius: 1rem;
-        background: var(--surface);
-        border: 1px solid rgba(15, 23, 42, 0.07);
-        box-shadow: 0 12px 25px rgba(15, 23, 42, 0.07);
-      }
-      .toolbar label {
-        display: flex;
-        gap: 0.55rem;
-        align-items: center;
-        color: var(--text-muted);
-        font-size: 0.9rem;
-      }
-      .toolbar label input[type="checkbox"] {
-        accent-color: var(--accent);
-      }
-      .toolbar select,
-      .toolbar input[type="search"] {
-        border-radius: 0.6rem;
-        border: 1px solid var(--border);
-        padding: 0.45rem 0.7rem;
-        font-size: 0.92rem;
-        background: var(--surface);
-        min-width: 160px;
-        color: var(--text);
-      }
-      .toolbar input[type="search"] {
-        min-width: 200px;
-      }
-      .toolbar input::placeholder {
-        color: var(--text-muted);
-      }
-      .toolbar-note {
-        color: var(--text-muted);
-        font-size: 0.85rem;
-        flex-basis: 100%;
-      }
-      .connection-indicator {
-        flex-basis: 100%;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.4rem;
-        font-size: 0.82rem;
-        font-weight: 600;
-        color: var(--text-muted);
-        padding: 0.35rem 0.6rem;
-        border-radius: 999px;
-        background: rgba(15, 23, 42, 0.04);
-        transition: color 0.18s ease, background 0.18s ease;
-      }
-      .connection-indicator::before {
-        content: "";
-        width: 0.55rem;
-        height: 0.55rem;
-        border-radius: 50%;
-        background: var(--border);
-        box-shadow: 0 0 0 2px rgba(15, 23, 42, 0.08);
-        transition: background 0.18s ease, box-shadow 0.18s ease;
-      }
-      .connection-indicator[data-state="connected"] {
-        color: #047857;
-        background: rgba(5, 150, 105, 0.12);
-      }
-      .connection-indicator[data-state="connected"]::before {
-        background: #22c55e;
-        box-shadow: 0 0 0 2px rgba(34, 197, 94, 0.2);
-      }
-      .connection-indicator[data-state="reconnecting"],
-      .connection-indicator[data-state="connecting"] {
-        color: #ea580c;
-        background: rgba(234, 88, 12, 0.12);
-      }
-      .connection-indicator[data-state="reconnecting"]::before,
-      .connection-indicator[data-state="connecting"]::before {
-        background: #f97316;
-        box-shadow: 0 0 0 2px rgba(249, 115, 22, 0.2);
-      }
-      .connection-indicator[data-state="offline"],
-      .connection-indicator[data-state="unsupported"] {
-        color: #b91c1c;
-        background: rgba(185, 28, 28, 0.12);
-      }
-      .connection-indicator[data-state="offline"]::before,
-      .connection-indicator[data-state="unsupported"]::before {
-        background: #ef4444;
-        box-shadow: 0 0 0 2px rgba(239, 68, 68, 0.2);
-      }
-      .thread-list {
-        display: grid;
-        gap: 1.1rem;
-      }
-      details.thread-card {
-        border-radius: 1rem;
-        border: 1px solid rgba(15, 23, 42, 0.08);
-        background: var(--surface);
-        box-shadow: 0 16px 36px rgba(15, 23, 42, 0.11);
-        transition: transform 0.15s ease, box-shadow 0.15s ease;
-        overflow: hidden;
-      }
-      details.thread-card[open] {
-        transform: translateY(-2px);
-        box-shadow: 0 22px 40px rgba(15, 23, 42, 0.18);
-      }
-      summary.thread-summary {
-        list-style: none;
-        display: grid;
-        grid-template-columns: auto auto 1fr auto;
-        gap: 0.75rem 1rem;
-        align-items: center;
-        padding: 1.15rem 1.3rem;
-        position: relative;
-      }
-      summary.thread-summary::-webkit-details-marker {
-        display: none;
-      }
-      .thread-chevron {
-        width: 1.3rem;
-        height: 1.3rem;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        cursor: pointer;
-        color: var(--text-muted);
-        font-size: 1rem;
-        transition: transform 0.2s ease, color 0.15s ease;
-        user-select: none;
-      }
-      .thread-chevron:hover {
-        color: var(--accent);
-      }
-      details.thread-card[open] .thread-chevron,
-      details.thread-card[open] summary .thread-chevron {
-        transform: rotate(90deg);
-      }
-      .thread-summary-content {
-        display: grid;
-        grid-template-columns: 1fr auto;
-        gap: 0.75rem 1rem;
-        align-items: center;
-      }
-      .thread-meta-editable {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem 0.9rem;
-        font-size: 0.85rem;
-        color: var(--text-muted);
-      }
-      .badge-editable {
-        border-radius: 999px;
-        padding: 0.2rem 0.6rem;
-        font-size: 0.72rem;
-        font-weight: 600;
-        letter-spacing: 0.05em;
-        text-transform: uppercase;
-        cursor: pointer;
-        transition: background 0.15s ease, border 0.15s ease;
-        border: 1px solid transparent;
-      }
-      .badge-editable:hover {
-        border-color: var(--accent);
-        background: var(--accent-soft);
-      }
-      .badge-editable-status {
-        position: relative;
-      }
-      .badge-editable-status select {
-        position: absolute;
-        inset: 0;
-        opacity: 0;
-        cursor: pointer;
-        font-size: 0.72rem;
-      }
-      .summary-badge {
-        width: 2.2rem;
-        height: 2.2rem;
-        border-radius: 0.8rem;
-        background: var(--accent-soft);
-        color: var(--accent);
-        display: grid;
-        place-items: center;
-        font-weight: 600;
-        font-size: 1rem;
-      }
-      .thread-heading {
-        display: grid;
-        gap: 0.35rem;
-      }
-      .thread-heading h2 {
-        margin: 0;
-        font-size: 1.1rem;
-      }
-      .thread-actions {
-        display: inline-flex;
-        gap: 0.4rem;
-        align-items: center;
-      }
-      .thread-actions button {
-        border-radius: 0.55rem;
-        border: 1px solid rgba(37, 99, 235, 0.3);
-        background: rgba(37, 99, 235, 0.12);
-        padding: 0.32rem 0.55rem;
-        font-size: 0.82rem;
-        font-weight: 600;
-        color: var(--accent);
-        cursor: pointer;
-        transition: background 0.15s ease, border 0.15s ease;
-      }
-      .thread-actions button:hover:not(:disabled) {
-        background: rgba(37, 99, 235, 0.2);
-        border-color: rgba(37, 99, 235, 0.5);
-      }
-      .thread-actions button:disabled {
-        opacity: 0.5;
-        cursor: not-allowed;
-        background: rgba(148, 163, 184, 0.3);
-        border-color: rgba(148, 163, 184, 0.4);
-        color: #475569;
-      }
-      .thread-meta {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem 0.9rem;
-        font-size: 0.85rem;
-        color: var(--text-muted);
-      }
-      .badge {
-        border-radius: 999px;
-        padding: 0.2rem 0.6rem;
-        font-size: 0.72rem;
-        font-weight: 600;
-        letter-spacing: 0.05em;
-        text-transform: uppercase;
-      }
-      .badge-status-open { background: rgba(16, 185, 129, 0.16); color: #047857; }
-      .badge-status-blocked { background: rgba(248, 113, 113, 0.18); color: #b91c1c; }
-      .badge-status-in_review { background: rgba(251, 191, 36, 0.2); color: #92400e; }
-      .badge-status-closed { background: rgba(148, 163, 184, 0.24); color: #475569; }
-      .badge-priority { background: rgba(37, 99, 235, 0.16); color: var(--accent); }
-      .badge-new { background: rgba(225, 29, 72, 0.18); color: #be123c; }
-      .thread-detail {
-        border-top: 1px solid rgba(15, 23, 42, 0.08);
-        padding: 1.3rem 1.3rem 1.6rem;
-        display: grid;
-        gap: 1.15rem;
-      }
-      .editor {
-        background: var(--surface);
-        border-radius: 0.8rem;
-        border: 1px dashed rgba(37, 99, 235, 0.35);
-        padding: 1rem 1.15rem;
-        display: grid;
-        gap: 0.75rem;
-      }
-      .editor-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        gap: 0.75rem;
-      }
-      .editor-controls {
-        display: grid;
-        gap: 0.75rem;
-      }
-      .field-row {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(190px, 1fr));
-        gap: 0.75rem;
-      }
-      .field-row label {
-        display: grid;
-        gap: 0.35rem;
-        font-size: 0.84rem;
-        color: var(--text-muted);
-      }
-      .field-row input,
-      .field-row select {
-        border-radius: 0.55rem;
-        border: 1px solid var(--border);
-        background: var(--surface);
-        padding: 0.45rem 0.6rem;
-        font-size: 0.9rem;
-        color: var(--text);
-        box-shadow: inset 0 1px 2px rgba(15, 23, 42, 0.08);
-      }
-      .field-row input:focus,
-      .field-row select:focus {
-        outline: none;
-        border-color: rgba(37, 99, 235, 0.5);
-        box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.18);
-      }
-      .field-row input::placeholder {
-        color: var(--text-muted);
-      }
-      .editor-actions {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.6rem;
-        align-items: center;
-      }
-      .editor-actions button {
-        border-radius: 0.55rem;
-        padding: 0.45rem 0.9rem;
-        font-size: 0.88rem;
-        font-weight: 600;
-        border: 1px solid transparent;
-        cursor: pointer;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.4rem;
-      }
-      .editor-actions button.primary {
-        background: var(--accent);
-        color: #fff;
-        box-shadow: 0 10px 22px rgba(37, 99, 235, 0.25);
-      }
-      .editor-actions button.secondary {
-        background: rgba(15, 23, 42, 0.06);
-        color: var(--text);
-      }
-      .editor-actions button:disabled {
-        opacity: 0.6;
-        cursor: not-allowed;
-        box-shadow: none;
-      }
-      .editor-message {
-        font-size: 0.82rem;
-        color: var(--success);
-      }
-      #updateToast {
-        position: fixed;
-        bottom: 2.2rem;
-        right: 2.2rem;
-        padding: 0.75rem 1rem;
-        border-radius: 0.9rem;
-        background: var(--accent);
-        color: #fff;
-        font-size: 0.9rem;
-        font-weight: 600;
-        box-shadow: 0 14px 32px rgba(37, 99, 235, 0.35);
-        opacity: 0;
-        transform: translateY(8px);
-        pointer-events: none;
-        transition: opacity 0.2s ease, transform 0.2s ease;
-        z-index: 1000;
-      }
-      #updateToast.visible {
-        opacity: 1;
-        transform: translateY(0);
-      }
-      .entries {
-        display: grid;
-        gap: 0.85rem;
-      }
-      .entries h3 {
-        margin: 0;
-        font-size: 1.08rem;
-        font-weight: 650;
-        color: var(--text);
-      }
-      details.entry {
-        border: 1px solid rgba(15, 23, 42, 0.08);
-        border-radius: 0.7rem;
-        background: var(--surface);
-      }
-      summary.entry-summary {
-        padding: 0.75rem 0.9rem;
-        display: flex;
-        flex-direction: column;
-        gap: 0.5rem;
-        font-size: 1rem;
-        font-weight: 560;
-        background: var(--surface-alt);
-        border-radius: 0.6rem;
-        transition: background 0.15s ease;
-        position: relative;
-      }
-      summary.entry-summary:hover {
-        background: rgba(15, 23, 42, 0.05);
-      }
-      summary.entry-summary::-webkit-details-marker { display: none; }
-      .entry-chevron {
-        position: absolute;
-        left: 0.9rem;
-        top: 0.75rem;
-        width: 1.2rem;
-        height: 1.2rem;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        cursor: pointer;
-        color: var(--text-muted);
-        font-size: 0.9rem;
-        transition: transform 0.2s ease, color 0.15s ease;
-        user-select: none;
-        z-index: 1;
-      }
-      .entry-chevron:hover {
-        color: var(--accent);
-      }
-      details.entry[open] .entry-chevron,
-      details.entry[open] summary .entry-chevron {
-        transform: rotate(90deg);
-      }
-      .entry-summary-content {
-        margin-left: 1.6rem;
-        display: flex;
-        flex-direction: column;
-        gap: 0.5rem;
-      }
-      .entry-meta {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.45rem 0.9rem;
-        color: var(--text-muted);
-        font-size: 0.88rem;
-        letter-spacing: 0.01em;
-      }
-      .entry-line {
-        font-weight: 680;
-        color: var(--text);
-      }
-      .entry-body {
-        padding: 0 0.85rem 0.95rem;
-        font-size: 0.9rem;
-        line-height: 1.5;
-        color: var(--text);
-      }
-      /* Markdown content styling */
-      .entry-body h1, .entry-body h2, .entry-body h3,
-      .entry-body h4, .entry-body h5, .entry-body h6 {
-        margin: 1.2em 0 0.6em;
-        font-weight: 600;
-        line-height: 1.3;
-        color: var(--text);
-      }
-      .entry-body h1:first-child, .entry-body h2:first-child,
-      .entry-body h3:first-child { margin-top: 0; }
-      .entry-body h1 { font-size: 1.6em; }
-      .entry-body h2 { font-size: 1.4em; }
-      .entry-body h3 { font-size: 1.2em; }
-      .entry-body h4 { font-size: 1.1em; }
-      .entry-body p { margin: 0.8em 0; }
-      .entry-body ul, .entry-body ol {
-        margin: 0.8em 0;
-        padding-left: 2em;
-      }
-      .entry-body li { margin: 0.4em 0; }
-      .entry-body code {
-        background: var(--surface-alt);
-        padding: 0.15em 0.4em;
-        border-radius: 0.3em;
-        font-size: 0.9em;
-        font-family: "Monaco", "Consolas", "Courier New", monospace;
-        color: var(--text);
-        border: 1px solid var(--border);
-      }
-      .entry-body pre {
-        background: var(--surface-alt);
-        padding: 1em;
-        border-radius: 0.6em;
-        overflow-x: auto;
-        margin: 1em 0;
-        border: 1px solid var(--border);
-      }
-      .entry-body pre code {
-        background: transparent;
-        padding: 0;
-        border: none;
-        font-size: 0.85em;
-        line-height: 1.5;
-      }
-      .entry-body blockquote {
-        margin: 1em 0;
-        padding-left: 1em;
-        border-left: 3px solid var(--accent);
-        color: var(--text-muted);
-        font-style: italic;
-      }
-      .entry-body a {
-        color: var(--accent);
-        text-decoration: none;
-      }
-      .entry-body a:hover {
-        text-decoration: underline;
-      }
-      .entry-body hr {
-        border: none;
-        border-top: 1px solid var(--border);
-        margin: 1.5em 0;
-      }
-      .entry-body table {
-        border-collapse: collapse;
-        width: 100%;
-        margin: 1em 0;
-      }
-      .entry-body th, .entry-body td {
-        border: 1px solid var(--border);
-        padding: 0.6em 0.8em;
-        text-align: left;
-      }
-      .entry-body th {
-        background: var(--surface-alt);
-        font-weight: 600;
-      }
-      .empty-state {
-        padding: 2rem;
-        text-align: center;
-        border-radius: 1rem;
-        border: 1px dashed rgba(15, 23, 42, 0.12);
-        color: var(--text-muted);
-        background: rgba(15, 23, 42, 0.03);
-        font-style: italic;
-      }
-      .sr-only {
-        position: absolute;
-        width: 1px;
-        height: 1px;
-        padding: 0;
-        margin: -1px;
-        overflow: hidden;
-        clip: rect(0, 0, 0, 0);
-        border: 0;
-      }
-      @media (max-width: 960px) {
-        .layout {
-          grid-template-columns: 1fr;
-          padding: 0 1.25rem 2.5rem;
-        }
-        .repo-pane {
-          order: 2;
-        }
-        .content {
-          order: 1;
-        }
-      }
-    </style>
-    <!-- Markdown rendering and syntax highlighting -->
-    <script src="https://cdn.jsdelivr.net/npm/marked@11.1.1/marked.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/dompurify@3.0.8/dist/purify.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css" media="(prefers-color-scheme: light)">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css" media="(prefers-color-scheme: dark)">
-  </head>
-  <body>
-    <header class="app-header">
-      <h1>Watercooler Threads Dashboard</h1>
-      <p>
-        Inspect and prioritize Watercooler threads locally. Sort by status or priority, tweak metadata inline, and expand entries to review conversation history.
-      </p>
-    </header>
-    <section class="config-panel">
-      <form id="threadsBaseForm" class="config-form">
-        <label for="threadsBaseInput">Threads base directory</label>
-        <div class="input-row">
-          <input id="threadsBaseInput" type="text" name="threadsBase" value="__THREADS_BASE__" placeholder="/path/to/*-threads root" />
-          <button type="submit">Save</button>
-        </div>
-        <small class="toolbar-note">Updates persist to your local dashboard config.</small>
-      </form>
-      <span id="configStatus" role="status"></span>
-    </section>
-    <main class="layout">
-      <aside class="repo-pane">
-        <h2 class="repo-heading">Repositories</h2>
-        <div id="reposContainer" class="repo-list" role="tablist" aria-label="Thread repositories"></div>
-      </aside>
-      <section class="content">
-        <div id="toolbarControls" class="toolbar" role="region" aria-label="Thread filters">
-          <label>
-            Status
-            <select id="filter-status"></select>
-          </label>
-          <label>
-            Sort by
-            <select id="sort-order"></select>
-          </label>
-          <label>
-            Search
-            <input id="search-term" type="search" placeholder="Filter by title, topic, or ball owner" />
-          </label>
-          <label>
-            <input id="toggle-archived" type="checkbox" />
-            Show archived threads
-          </label>
-          <span class="toolbar-note">Default sort: open → highest priority → most recent.</span>
-          <span id="liveIndicator" class="connection-indicator" aria-live="polite" data-state="connecting">Connecting…</span>
-        </div>
-        <section id="threadsContainer" class="thread-list" aria-live="polite"></section>
-      </section>
-    </main>
-    <div id="updateToast" role="status" aria-live="polite"></div>
-<script type="module">
-      const CSRF_TOKEN = document.querySelector('meta[name="watercooler-csrf"]')?.content || "";
-      const withCsrf = (headers = {}) =>
-        Object.assign({ "X-Watercooler-CSRF": CSRF_TOKEN }, headers || {});
-      const PRIORITY_LEVELS = ["P0", "P1", "P2", "P3", "P4", "P5"];
-      const STATUS_FILTERS = [
-        { value: "all", label: "All statuses" },
-        { value: "open", label: "Open" },
-        { value: "in_review", label: "In Review" },
-        { value: "blocked", label: "Blocked" },
-        { value: "closed", label: "Closed" },
-      ];
-      const SORT_OPTIONS = [
-        { value: "default", label: "Default (open → priority → recent)" },
-        { value: "updated-desc", label: "Last updated (newest first)" },
-        { value: "updated-asc", label: "Last updated (oldest first)" },
-        { value: "priority", label: "Priority (P0 → P5)" },
-        { value: "title", label: "Title (A → Z)" },
-      ];
-      const STORAGE_PREFIX = "wc-dashboard-local";
-      const STORAGE_KEYS = {
-        status: STORAGE_PREFIX + "-status-filter",
-        sort: STORAGE_PREFIX + "-sort-order",
-        search: STORAGE_PREFIX + "-search",
-        archived: STORAGE_PREFIX + "-show-archived",
-      };
-      const SSE_CONFIG = {
-        reconnectDelay: 5000,
-        maxDelay: 60000,
-        fallbackInterval: 60000,
-      };
-      const sseState = {
-        source: null,
-        reconnectDelay: SSE_CONFIG.reconnectDelay,
-        reconnectTimer: null,
-        fallbackTimer: null,
-        toastTimer: null,
-      };
-      let refreshInFlight = null;
-
-      // Configure marked.js for markdown rendering with syntax highlighting
-      if (typeof marked !== 'undefined') {
-        marked.setOptions({
-          highlight: function(code, lang) {
-            if (lang && hljs.getLanguage(lang)) {
-              try {
-                return hljs.highlight(code, { language: lang }).value;
-              } catch (e) {
-                console.warn('Highlight.js error:', e);
-              }
-            }
-            try {
-              return hljs.highlightAuto(code).value;
-            } catch (e) {
-              return code;
-            }
-          },
-          breaks: true,
-          gfm: true,
-        });
-      }
-
-      // Helper function to render markdown with sanitization
-      function renderMarkdown(text) {
-        if (!text || typeof marked === 'undefined' || typeof DOMPurify === 'undefined') {
-          return text || '';
-        }
-        try {
-          const rawHTML = marked.parse(text);
-          return DOMPurify.sanitize(rawHTML);
-        } catch (e) {
-          console.warn('Markdown rendering error:', e);
-          return text;
-        }
-      }
-
-      // URL-based state persistence
-      function getStateFromURL() {
-        const params = new URLSearchParams(window.location.search);
-        const threadsParam = params.get('thread');
-        const entriesParam = params.get('entry');
-        return {
-          repo: params.get('repo') || null,
-          status: params.get('status') || null,
-          search: params.get('search') || null,
-          threads: threadsParam ? new Set(threadsParam.split(',')) : new Set(),
-          entries: entriesParam ? new Set(entriesParam.split(',')) : new Set(),
-        };
-      }
-
-      function updateURL(updates) {
-        const params = new URLSearchParams(window.location.search);
-
-        // Apply updates
-        Object.entries(updates).forEach(([key, value]) => {
-          if (value) {
-            params.set(key, value);
-          } else {
-            params.delete(key);
-          }
-        });
-
-        // Update URL without page reload
-        const newURL = `${window.location.pathname}?${params.toString()}`;
-        window.history.replaceState({}, '', newURL);
-      }
-
-      function syncThreadsToURL() {
-        const threadsList = Array.from(state.openThreads).join(',');
-        updateURL({ thread: threadsList || null });
-      }
-
-      function syncEntriesToURL() {
-        const entriesList = Array.from(state.openEntries).join(',');
-        updateURL({ entry: entriesList || null });
-      }
-
-      const elements = {
-        repos: document.getElementById("reposContainer"),
-        threads: document.getElementById("threadsContainer"),
-        toolbar: document.getElementById("toolbarControls"),
-        statusSelect: document.getElementById("filter-status"),
-        sortSelect: document.getElementById("sort-order"),
-        searchInput: document.getElementById("search-term"),
-        archivedToggle: document.getElementById("toggle-archived"),
-        form: document.getElementById("threadsBaseForm"),
-        threadsBaseInput: document.getElementById("threadsBaseInput"),
-        statusBanner: document.getElementById("configStatus"),
-        liveIndicator: document.getElementById("liveIndicator"),
-        updateToast: document.getElementById("updateToast"),
-      };
-      // Initialize state from URL parameters (preferred) or localStorage (fallback)
-      const urlState = getStateFromURL();
-      const state = {
-        repos: [],
-        activeRepo: urlState.repo || null,
-        filters: {
-          status: urlState.status || localStorage.getItem(STORAGE_KEYS.status) || "all",
-          sort: localStorage.getItem(STORAGE_KEYS.sort) || "default",
-          search: urlState.search || localStorage.getItem(STORAGE_KEYS.search) || "",
-          showArchived: localStorage.getItem(STORAGE_KEYS.archived) === "true",
-        },
-        openThreads: urlState.threads || new Set(),
-        openEntries: urlState.entries || new Set(),
-      };
-
-      bindForm();
-      populateToolbar();
-      bindToolbar();
-      refreshData("initial").catch((error) => {
-        renderStatus(error.message, "error");
-        if (elements.threads) {
-          elements.threads.innerHTML = '<p class="empty-state">' + error.message + "</p>";
-        }
-      });
-      startFallbackPolling();
-      initEventStream();
-
-      async function fetchData() {
-        const response = await fetch("/api/data", { cache: "no-store" });
-        if (!response.ok) {
-          throw new Error("Failed to load dashboard data");
-        }
-        const data = await response.json();
-        if (elements.threadsBaseInput && typeof data.threadsBase === "string") {
-          elements.threadsBaseInput.value = data.threadsBase;
-        }
-
-        state.repos = data.repos || [];
-        const hasActive = state.activeRepo && state.repos.some((repo) => repo.name === state.activeRepo);
-        if (!hasActive && state.repos.length) {
-          state.activeRepo = state.repos[0].name;
-        } else if (!state.repos.length) {
-          state.activeRepo = null;
-        }
-
-        renderStatus(data.error || "", data.error ? "error" : "info");
-        renderRepos();
-        renderThreads();
-      }
-
-      async function refreshData(reason = "manual") {
-        if (refreshInFlight) {
-          return refreshInFlight;
-        }
 
-        const threadsEl = elements.threads;
-        const scrollTop = threadsEl ? threadsEl.scrollTop : 0;
-
-        refreshInFlight = (async () => {
-          await fetchData();
-          if (threadsEl) {
-            threadsEl.scrollTop = scrollTop;
-          }
-        })();
-
-        try {
-          await refreshInFlight;
-        } catch (error) {
-          if (reason !== "initial") {
-            console.error("Refresh failed:", error);
-          }
-          throw error;
-        } finally {
-          refreshInFlight = null;
-        }
-      }
+def _asset_version(name: str) -> str:
+    """Return a short content hash used to version a static asset URL."""
 
-      function startFallbackPolling() {
-        if (sseState.fallbackTimer) {
-          clearInterval(sseState.fallbackTimer);
-        }
-        sseState.fallbackTimer = setInterval(() => {
-          refreshData("interval").catch(() => {
-            // Suppress errors during background polling; status banner covers explicit failures.
-          });
-        }, SSE_CONFIG.fallbackInterval);
-      }
-
-      function initEventStream() {
-        if (!window.EventSource) {
-          setConnectionState("unsupported", "Live updates unavailable (EventSource unsupported)");
-          return;
-        }
-        connectEventStream();
-      }
-
-      function connectEventStream() {
-        teardownEventSource();
-        clearTimeout(sseState.reconnectTimer);
-        sseState.reconnectTimer = null;
-        setConnectionState("connecting");
-
-        const source = new EventSource("/api/events");
-        sseState.source = source;
-
-        source.addEventListener("open", () => {
-          sseState.reconnectDelay = SSE_CONFIG.reconnectDelay;
-          setConnectionState("connected");
-        });
-
-        source.addEventListener("message", (event) => {
-          if (!event.data) return;
-          try {
-            const payload = JSON.parse(event.data);
-            handleEventMessage(payload);
-          } catch (error) {
-            console.error("Invalid event payload", error);
-          }
-        });
-
-        source.addEventListener("error", () => {
-          scheduleReconnect();
-        });
-      }
-
-      function teardownEventSource() {
-        if (sseState.source) {
-          sseState.source.close();
-          sseState.source = null;
-        }
-      }
+    return hashlib.blake2b((STATIC_DIR / name).read_bytes(), digest_size=6).hexdigest()
 
-      function scheduleReconnect() {
-        setConnectionState(
-          sseState.reconnectDelay >= SSE_CONFIG.maxDelay ? "offline" : "reconnecting"
-        );
-
-        teardownEventSource();
-
-        if (sseState.reconnectTimer) {
-          clearTimeout(sseState.reconnectTimer);
-        }
 
-        const delay = sseState.reconnectDelay;
-        sseState.reconnectTimer = setTimeout(() => {
-          sseState.reconnectTimer = null;
-          connectEventStream();
-        }, delay);
-
-        sseState.reconnectDelay = Math.min(
-          Math.round(sseState.reconnectDelay * 1.8),
-          SSE_CONFIG.maxDelay
-        );
-      }
-
-      function handleEventMessage(payload) {
-        if (!payload || typeof payload.type !== "string") {
-          return;
-        }
-
-        if (payload.type === "threads:updated") {
-          refreshData("push")
-            .then(() => {
-              const timeText = formatUpdateTime(payload.timestamp);
-              showToast(`Threads updated ${timeText}`);
-            })
-            .catch(() => {
-              // Errors already surfaced via banner/log.
-            });
-        } else if (payload.type === "heartbeat") {
-          setConnectionState("connected");
-        }
-      }
-
-      function setConnectionState(state, overrideText) {
-        const indicator = elements.liveIndicator;
-        if (!indicator) return;
-        indicator.dataset.state = state;
-        const defaultText = {
-          connected: "Live updates on",
-          connecting: "Connecting…",
-          reconnecting: "Reconnecting…",
-          offline: "Offline – retrying soon",
-          unsupported: "Live updates unavailable",
-        };
-        indicator.textContent = overrideText || defaultText[state] || "Status unknown";
-      }
-
-      function showToast(message) {
-        const toast = elements.updateToast;
-        if (!toast) return;
-        toast.textContent = message;
-        toast.classList.add("visible");
-        if (sseState.toastTimer) {
-          clearTimeout(sseState.toastTimer);
-        }
-        sseState.toastTimer = setTimeout(() => {
-          toast.classList.remove("visible");
-        }, 2600);
-      }
-
-      function formatUpdateTime(value) {
-        try {
-          const date = value ? new Date(value) : new Date();
-          if (Number.isNaN(date.getTime())) {
-            return "just now";
-          }
-          return date.toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" });
-        } catch (error) {
-          console.warn("Unable to format update timestamp", error);
-          return "just now";
-        }
-      }
-
-      function populateToolbar() {
-        if (elements.statusSelect) {
-          elements.statusSelect.innerHTML = STATUS_FILTERS.map(
-            (item) => '<option value="' + item.value + '">' + item.label + "</option>"
-          ).join("");
-          elements.statusSelect.value = state.filters.status;
-        }
-        if (elements.sortSelect) {
-          elements.sortSelect.innerHTML = SORT_OPTIONS.map(
-            (item) => '<option value="' + item.value + '">' + item.label + "</option>"
-          ).join("");
-          elements.sortSelect.value = state.filters.sort;
-        }
-        if (elements.searchInput) {
-          elements.searchInput.value = state.filters.search;
-        }
-        if (elements.archivedToggle) {
-          elements.archivedToggle.checked = state.filters.showArchived;
-        }
-      }
-
-      function bindToolbar() {
-        if (elements.statusSelect) {
-          elements.statusSelect.addEventListener("change", (event) => {
-            state.filters.status = event.target.value;
-            localStorage.setItem(STORAGE_KEYS.status, state.filters.status);
-            updateURL({ status: state.filters.status !== 'all' ? state.filters.status : null });
-            renderThreads();
-          });
-        }
-        if (elements.sortSelect) {
-          elements.sortSelect.addEventListener("change", (event) => {
-            state.filters.sort = event.target.value;
-            localStorage.setItem(STORAGE_KEYS.sort, state.filters.sort);
-            renderThreads();
-          });
-        }
-        if (elements.searchInput) {
-          const debounced = debounce((event) => {
-            state.filters.search = event.target.value.trim().toLowerCase();
-            localStorage.setItem(STORAGE_KEYS.search, state.filters.search);
-            updateURL({ search: state.filters.search || null });
-            renderThreads();
-          }, 180);
-          elements.searchInput.addEventListener("input", debounced);
-        }
-        if (elements.archivedToggle) {
-          elements.archivedToggle.addEventListener("change", (event) => {
-            state.filters.showArchived = event.target.checked;
-            localStorage.setItem(STORAGE_KEYS.archived, state.filters.showArchived ? "true" : "false");
-            renderThreads();
-          });
-        }
-      }
-
-      function bindForm() {
-        if (!elements.form) return;
-        elements.form.addEventListener("submit", async (event) => {
-          event.preventDefault();
-          const formData = new FormData(elements.form);
-          const threadsBase = formData.get("threadsBase");
-
-          const response = await fetch("/api/config/threads-base", {
-            method: "POST",
-            headers: withCsrf({ "Content-Type": "application/json" }),
-            body: JSON.stringify({ threadsBase }),
-          });
-
-          if (response.ok) {
-            flashStatus("Threads directory updated");
-            await refreshData("manual");
-          } else {
-            const data = await response.json().catch(() => ({}));
-            renderStatus(data.detail || "Failed to update threads directory", "error");
-          }
-        });
-      }
-
-      function renderStatus(message = "", kind = "info") {
-        if (!elements.statusBanner) return;
-        if (!message) {
-          elements.statusBanner.textContent = "";
-          elements.statusBanner.style.color = "#059669";
-          return;
-        }
-        elements.statusBanner.textContent = message;
-        elements.statusBanner.style.color = kind === "error" ? "#b91c1c" : "#059669";
-      }
-
-      function flashStatus(message, kind = "info", timeout = 1600) {
-        renderStatus(message, kind);
-        if (timeout > 0) {
-          setTimeout(() => renderStatus("", "info"), timeout);
-        }
-      }
-
-      function renderRepos() {
-        if (!elements.repos) return;
-        elements.repos.innerHTML = "";
-        if (!state.repos.length) {
-          const empty = document.createElement("p");
-          empty.className = "empty-state";
-          empty.textContent = "No threads repositories discovered.";
-          elements.repos.append(empty);
-          return;
-        }
+# The CSRF token and asset versions are fixed for the process, so substitute them
+# once in a single pass and leave only $threads_base for each render
+_INDEX_TEMPLATE = Template(
+    Template(INDEX_HTML).safe_substitute(
+        csrf_token=CSRF_TOKEN,
+        app_css_version=_asset_version("app.css"),
+        app_js_version=_asset_version("app.js"),
+    )
+)
 
-        state.repos.forEach((repo, index) => {
-          const card = document.createElement("button");
-          card.type = "button";
-          card.className = "repo-card" + (repo.name === state.activeRepo ? " active" : "");
-          card.dataset.repoName = repo.name;
-          card.setAttribute("role", "tab");
-          card.setAttribute("aria-selected", repo.name === state.activeRepo ? "true" : "false");
-
-          const label = document.createElement("strong");
-          label.textContent = repo.name;
-          card.append(label);
-
-          const controlWrap = document.createElement("span");
-          controlWrap.className = "repo-controls";
-
-          const up = document.createElement("button");
-          up.type = "button";
-          up.textContent = "↑";
-          up.title = "Move repository up";
-          up.disabled = index === 0;
-          up.addEventListener("click", (event) => {
-            event.stopPropagation();
-            reorderRepo(repo.name, -1);
-          });
-
-          const down = document.createElement("button");
-          down.type = "button";
-          down.textContent = "↓";
-          down.title = "Move repository down";
-          down.disabled = index === state.repos.length - 1;
-          down.addEventListener("click", (event) => {
-            event.stopPropagation();
-            reorderRepo(repo.name, 1);
-          });
-
-          controlWrap.append(up, down);
-          card.append(controlWrap);
-
-          card.addEventListener("click", () => {
-            state.activeRepo = repo.name;
-            updateURL({ repo: repo.name });
-            renderRepos();
-            renderThreads();
-          });
-
-          elements.repos.append(card);
-        });
-      }
-
-      function applyFilters(threads) {
-        const search = state.filters.search;
-        const statusFilter = state.filters.status;
-        const includeArchived = state.filters.showArchived;
-        return threads.filter((thread) => {
-          const isArchived = Boolean(thread.isArchived);
-          if (isArchived && !includeArchived) {
-            return false;
-          }
-          const matchesStatus =
-            statusFilter === "all" || (thread.statusNormalized || "").toLowerCase() === statusFilter;
-          const matchesSearch =
-            !search ||
-            (thread.title || "").toLowerCase().includes(search) ||
-            (thread.topic || "").toLowerCase().includes(search) ||
-            (thread.ballOwner || "").toLowerCase().includes(search);
-          return matchesStatus && matchesSearch;
-        });
-      }
-
-      function sortThreads(threads) {
-        const key = state.filters.sort;
-        const comparator = getComparator(key);
-        return [...threads].sort(comparator);
-      }
-
-      function getComparator(key) {
-        const statusRank = (value) => {
-          switch (value) {
-            case "open":
-              return 0;
-            case "blocked":
-              return 1;
-            case "in_review":
-              return 2;
-            case "closed":
-              return 3;
-            default:
-              return 4;
-          }
-        };
-
-        if (key === "updated-desc") {
-          return (a, b) => compareDates(b.lastUpdate, a.lastUpdate);
-        }
-        if (key === "updated-asc") {
-          return (a, b) => compareDates(a.lastUpdate, b.lastUpdate);
-        }
-        if (key === "priority") {
-          return (a, b) => {
-            const diff = a.priorityRank - b.priorityRank;
-            return diff !== 0 ? diff : compareDates(b.lastUpdate, a.lastUpdate);
-          };
-        }
-        if (key === "title") {
-          return (a, b) => (a.title || "").localeCompare(b.title || "", undefined, { sensitivity: "base" });
-        }
 
-        return (a, b) => {
-          const first = statusRank(a.statusNormalized) - statusRank(b.statusNormalized);
-          if (first !== 0) return first;
-          const second = a.priorityRank - b.priorityRank;
-          if (second !== 0) return second;
-          return compareDates(b.lastUpdate, a.lastUpdate);
-        };
-      }
-
-      function compareDates(a, b) {
-        const dateA = a ? new Date(a) : new Date(0);
-        const dateB = b ? new Date(b) : new Date(0);
-        if (Number.isNaN(dateA) && Number.isNaN(dateB)) return 0;
-        if (Number.isNaN(dateA)) return 1;
-        if (Number.isNaN(dateB)) return -1;
-        return dateA - dateB;
-      }
-
-      function getActiveRepo() {
-        if (!state.activeRepo) return null;
-        return state.repos.find((repo) => repo.name === state.activeRepo) || null;
-      }
-
-      function getThreadKey(thread, index) {
-        if (!thread) return String(index);
-        const candidate = thread.topic || thread.title || thread.filePath;
-        return candidate ? String(candidate) : String(index);
-      }
-
-      function renderThreads() {
-        if (!elements.threads) return;
-        const currentlyOpen = new Set(
-          Array.from(elements.threads.querySelectorAll("details[open][data-topic]")).map(
-            (detail) => detail.dataset.topic || ""
-          )
-        );
-        currentlyOpen.forEach((topic) => {
-          if (topic) state.openThreads.add(topic);
-        });
-
-        elements.threads.innerHTML = "";
-        const repo = getActiveRepo();
-
-        if (!repo) {
-          const empty = document.createElement("p");
-          empty.className = "empty-state";
-          empty.textContent = "Select a repository to view its threads.";
-          elements.threads.append(empty);
-          state.openThreads = new Set();
-          return;
-        }
+@lru_cache(maxsize=8)
+def _render_index(threads_base: str) -> tuple[bytes, bytes]:
+    """Return the dashboard page for ``threads_base`` as plain and gzip bytes.
 
-        const filtered = sortThreads(applyFilters(repo.threads || []));
-        if (!filtered.length) {
-          const empty = document.createElement("p");
-          empty.className = "empty-state";
-          empty.textContent = "No threads match the current filters.";
-          elements.threads.append(empty);
-          state.openThreads = new Set();
-          return;
-        }
+    Keyed by the threads base, so changing it in the config picks up a fresh
+    render without an explicit invalidation step. Compressing once here keeps
+    gzip off the request path.
+    """
 
-        const nextOpen = new Set();
-
-        filtered.forEach((thread, index) => {
-          const key = getThreadKey(thread, index);
-          const shouldOpen = key ? state.openThreads.has(key) : false;
-          const card = buildThreadCard(thread, index, repo, shouldOpen, key);
-          if (card.open && key) {
-            nextOpen.add(key);
-          }
-          elements.threads.append(card);
-        });
-
-        state.openThreads = nextOpen;
-      }
-
-      function buildThreadCard(thread, index, repo, shouldOpen = false, threadKey = null) {
-        const detail = document.createElement("details");
-        detail.className = "thread-card";
-        detail.dataset.status = thread.statusNormalized || "";
-        detail.dataset.priority = thread.priority || "";
-        const identifier = threadKey || getThreadKey(thread, index);
-        if (identifier) {
-          detail.dataset.topic = identifier;
-        }
-        if (shouldOpen && identifier) {
-          detail.open = true;
-        }
-          const summary = document.createElement("summary");
-          summary.className = "thread-summary";
-        
-        // Add chevron first
-        const chevron = document.createElement("span");
-        chevron.className = "thread-chevron";
-        chevron.textContent = "▶";
-        chevron.setAttribute("aria-label", "Toggle thread");
-        
-        // Prevent default click behavior - only chevron will trigger expand
-        summary.addEventListener("click", (e) => {
-          const isChevron = e.target === chevron || e.target.closest(".thread-chevron");
-          const isEditable = e.target.closest(".badge-editable") || e.target.closest("select");
-          if (!isChevron && !isEditable) {
-            e.preventDefault();
-          }
-        });
-
-        const badge = document.createElement("span");
-        badge.className = "summary-badge";
-        badge.textContent = (thread.topic || "?").slice(0, 2).toUpperCase();
-
-        const heading = document.createElement("div");
-        heading.className = "thread-heading";
-        const title = document.createElement("h2");
-        title.textContent = thread.title || thread.topic || "Untitled thread";
-        heading.append(title);
-
-        // Editable meta line with inline status/priority editing
-        const metaLine = document.createElement("div");
-        metaLine.className = "thread-meta-editable";
-        
-        // Inline status editor
-        const statusWrapper = document.createElement("span");
-        statusWrapper.className = "badge badge-status-" + (thread.statusNormalized || "unknown") + " badge-editable badge-editable-status";
-        statusWrapper.textContent = formatStatus(thread.status);
-        const statusSelect = document.createElement("select");
-        ["OPEN", "IN_REVIEW", "BLOCKED", "CLOSED"].forEach((option) => {
-          const opt = document.createElement("option");
-          opt.value = option;
-          opt.textContent = formatStatus(option);
-          if (option === (thread.status || "OPEN").toUpperCase()) opt.selected = true;
-          statusSelect.append(opt);
-        });
-        statusSelect.addEventListener("change", async (e) => {
-          e.stopPropagation();
-          try {
-            const updates = {
-              Status: statusSelect.value,
-              Priority: thread.priority || "P2",
-              Ball: thread.ballOwner || "",
-              Spec: thread.spec || "",
-              Topic: thread.topic || "",
-            };
-            await saveThreadMetadata(thread, updates);
-            flashStatus("Status updated");
-            await refreshData("manual");
-          } catch (error) {
-            flashStatus("Failed to update status", "error");
-          }
-        });
-        statusWrapper.append(statusSelect);
-        metaLine.append(statusWrapper);
-
-        // Inline priority editor
-        const priorityWrapper = document.createElement("span");
-        priorityWrapper.className = "badge badge-priority badge-editable badge-editable-status";
-        priorityWrapper.textContent = "Priority " + thread.priority;
-        const prioritySelect = document.createElement("select");
-        PRIORITY_LEVELS.forEach((level) => {
-          const opt = document.createElement("option");
-          opt.value = level;
-          opt.textContent = level;
-          if (level === thread.priority) opt.selected = true;
-          prioritySelect.append(opt);
-        });
-        prioritySelect.addEventListener("change", async (e) => {
-          e.stopPropagation();
-          try {
-            const updates = {
-              Status: thread.status || "OPEN",
-              Priority: prioritySelect.value,
-              Ball: thread.ballOwner || "",
-              Spec: thread.spec || "",
-              Topic: thread.topic || "",
-            };
-            await saveThreadMetadata(thread, updates);
-            flashStatus("Priority updated");
-            await refreshData("manual");
-          } catch (error) {
-            flashStatus("Failed to update priority", "error");
-          }
-        });
-        priorityWrapper.append(prioritySelect);
-        metaLine.append(priorityWrapper);
-
-        if (thread.hasNew) {
-          const newBadge = document.createElement("span");
-          newBadge.className = "badge badge-new";
-          newBadge.textContent = "NEW";
-          metaLine.append(newBadge);
-        }
+    page = _INDEX_TEMPLATE.substitute(threads_base=html.escape(threads_base, quote=True))
+    page = page.encode("utf-8")
+    return page, gzip.compress(page, compresslevel=9, mtime=0)
 
-        if (thread.ballOwner) {
-          const ball = document.createElement("span");
-          ball.textContent = "Ball: " + thread.ballOwner;
-          metaLine.append(ball);
-        }
-        if (thread.lastUpdate) {
-          const updated = document.createElement("span");
-          updated.textContent = "Updated " + relativeTime(thread.lastUpdate);
-          updated.title = new Date(thread.lastUpdate).toISOString();
-          metaLine.append(updated);
-        }
-        metaLine.append("Entries: " + (thread.entryCount || 0));
-        heading.append(metaLine);
-
-        const actions = buildThreadActions(thread, index, repo);
-
-        summary.append(chevron, badge, heading, actions);
-        detail.append(summary);
-
-        const body = document.createElement("div");
-        body.className = "thread-detail";
-        body.append(buildEditor(thread));
-        body.append(buildEntryList(thread));
-        detail.append(body);
-
-        if (identifier) {
-          detail.addEventListener("toggle", () => {
-            if (detail.open) {
-              state.openThreads.add(identifier);
-            } else {
-              state.openThreads.delete(identifier);
-            }
-            syncThreadsToURL();
-          });
-        }
 
-        return detail;
-      }
-
-      function buildThreadActions(thread, index, repo) {
-        const actions = document.createElement("div");
-        actions.className = "thread-actions";
-
-        const up = document.createElement("button");
-        up.type = "button";
-        up.textContent = "↑";
-        up.title = "Move thread up";
-        up.disabled = index === 0;
-        up.addEventListener("click", async (event) => {
-          event.stopPropagation();
-          await reorderThread(repo.name, index, -1);
-        });
-
-        const down = document.createElement("button");
-        down.type = "button";
-        down.textContent = "↓";
-        down.title = "Move thread down";
-        down.disabled = index === (repo.threads?.length || 0) - 1;
-        down.addEventListener("click", async (event) => {
-          event.stopPropagation();
-          await reorderThread(repo.name, index, 1);
-        });
-
-        const copy = document.createElement("button");
-        copy.type = "button";
-        copy.textContent = "Copy path";
-        copy.title = "Copy thread file path";
-        copy.disabled = !thread.filePath;
-        copy.addEventListener("click", async (event) => {
-          event.stopPropagation();
-          if (!thread.filePath) return;
-          try {
-            await navigator.clipboard.writeText(thread.filePath);
-            flashStatus("Thread path copied to clipboard");
-          } catch (error) {
-            flashStatus("Unable to copy path", "error");
-          }
-        });
-
-        actions.append(up, down, copy);
-        return actions;
-      }
-
-      function buildEditor(thread) {
-        const wrapper = document.createElement("section");
-        wrapper.className = "editor";
-
-        const header = document.createElement("div");
-        header.className = "editor-header";
-        const title = document.createElement("strong");
-        title.textContent = "Thread settings";
-        const dirty = document.createElement("span");
-        dirty.className = "editor-message";
-        dirty.hidden = true;
-        dirty.textContent = "Unsaved changes";
-        header.append(title, dirty);
-
-        const controls = document.createElement("div");
-        controls.className = "editor-controls";
-
-        const baseMeta = {
-          Status: thread.status || "OPEN",
-          Priority: thread.priority || "P2",
-          Ball: thread.ballOwner || "",
-          Spec: thread.spec || "",
-          Topic: (thread.metadata && thread.metadata.Topic) || thread.topic || "",
-        };
-        let working = { ...baseMeta };
-
-        const statusSelect = document.createElement("select");
-        ["OPEN", "IN_REVIEW", "BLOCKED", "CLOSED"].forEach((option) => {
-          const opt = document.createElement("option");
-          opt.value = option;
-          opt.textContent = formatStatus(option);
-          if (option === working.Status) opt.selected = true;
-          statusSelect.append(opt);
-        });
-
-        const prioritySelect = document.createElement("select");
-        PRIORITY_LEVELS.forEach((level) => {
-          const opt = document.createElement("option");
-          opt.value = level;
-          opt.textContent = level;
-          if (level === working.Priority) opt.selected = true;
-          prioritySelect.append(opt);
-        });
-
-        const ballInput = document.createElement("input");
-        ballInput.type = "text";
-        ballInput.value = working.Ball;
-        ballInput.placeholder = "Codex / Claude";
-
-        const specInput = document.createElement("input");
-        specInput.type = "text";
-        specInput.value = working.Spec;
-        specInput.placeholder = "Spec (optional)";
-
-        const topicInput = document.createElement("input");
-        topicInput.type = "text";
-        topicInput.value = working.Topic;
-        topicInput.placeholder = "Topic label";
-
-        controls.append(
-          createField("Status", statusSelect),
-          createField("Priority", prioritySelect),
-          createField("Ball owner", ballInput),
-          createField("Spec", specInput),
-          createField("Topic", topicInput)
-        );
-
-        const actions = document.createElement("div");
-        actions.className = "editor-actions";
-        const saveBtn = document.createElement("button");
-        saveBtn.type = "button";
-        saveBtn.className = "primary";
-        saveBtn.textContent = "Save metadata";
-
-        const resetBtn = document.createElement("button");
-        resetBtn.type = "button";
-        resetBtn.className = "secondary";
-        resetBtn.textContent = "Reset";
-
-        const message = document.createElement("span");
-        message.className = "editor-message";
-        message.hidden = true;
-
-        actions.append(saveBtn, resetBtn, message);
-
-        wrapper.append(header, controls, actions);
-
-        function markDirty() {
-          dirty.hidden = false;
-          saveBtn.disabled = false;
-        }
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """Report malformed request bodies as 400 with a string detail.
 
-        statusSelect.addEventListener("change", () => {
-          working.Status = statusSelect.value;
-          markDirty();
-        });
-        prioritySelect.addEventListener("change", () => {
-          working.Priority = prioritySelect.value;
-          markDirty();
-        });
-        ballInput.addEventListener("input", () => {
-          working.Ball = ballInput.value;
-          markDirty();
-        });
-        specInput.addEventListener("input", () => {
-          working.Spec = specInput.value;
-          markDirty();
-        });
-        topicInput.addEventListener("input", () => {
-          working.Topic = topicInput.value;
-          markDirty();
-        });
-
-        resetBtn.addEventListener("click", () => {
-          working = { ...baseMeta };
-          statusSelect.value = working.Status;
-          prioritySelect.value = working.Priority;
-          ballInput.value = working.Ball;
-          specInput.value = working.Spec;
-          topicInput.value = working.Topic;
-          dirty.hidden = true;
-          saveBtn.disabled = false;
-          showEditorMessage("Values reset to last saved state");
-        });
-
-        saveBtn.addEventListener("click", async () => {
-          saveBtn.disabled = true;
-          try {
-            const updates = {
-              Status: (working.Status || "OPEN").toUpperCase(),
-              Priority: (working.Priority || "P2").toUpperCase(),
-              Ball: working.Ball || "",
-              Spec: working.Spec || "",
-              Topic: working.Topic || "",
-            };
-            const response = await saveThreadMetadata(thread, updates);
-            showEditorMessage("Thread metadata saved");
-            flashStatus("Thread metadata updated");
-            dirty.hidden = true;
-            baseMeta.Status = response.status;
-            baseMeta.Priority = response.priority;
-            baseMeta.Ball = response.ballOwner || "";
-            baseMeta.Spec = response.spec || "";
-            baseMeta.Topic = (response.metadata && response.metadata.Topic) || response.topic || "";
-            working = { ...baseMeta };
-            await refreshData("manual");
-          } catch (error) {
-            showEditorMessage(error.message || "Save failed", true);
-            saveBtn.disabled = false;
-          }
-        });
-
-        function showEditorMessage(text, isError = false) {
-          message.hidden = false;
-          message.textContent = text;
-          message.style.color = isError ? "var(--danger)" : "var(--success)";
-          setTimeout(() => {
-            message.hidden = true;
-          }, 3200);
-        }
+    The client surfaces ``detail`` verbatim, so keep it a short message rather
+    than FastAPI's default 422 error list.
+    """
 
-        return wrapper;
-      }
-
-      function createField(labelText, control) {
-        const label = document.createElement("label");
-        label.textContent = labelText;
-        label.append(control);
-        return label;
-      }
-
-      function buildEntryList(thread) {
-        const container = document.createElement("section");
-        container.className = "entries";
-        const heading = document.createElement("h3");
-        heading.textContent = "Entries";
-        container.append(heading);
-
-        const entries = thread.entries || [];
-        if (!entries.length) {
-          const empty = document.createElement("p");
-          empty.className = "empty-state";
-          empty.textContent = "No entries recorded for this thread.";
-          container.append(empty);
-          return container;
-        }
-
-        const threadTopic = thread.topic || "";
-        entries.forEach((entry, index) => {
-          const detail = document.createElement("details");
-          detail.className = "entry";
-
-          // Create unique entry ID for persistence
-          const entryId = `${threadTopic}:${index}`;
-          detail.dataset.entryId = entryId;
-
-          // Restore open state from URL
-          if (state.openEntries.has(entryId)) {
-            detail.open = true;
-          }
-
-          const summary = document.createElement("summary");
-          summary.className = "entry-summary";
-          
-          // Add chevron first
-          const chevron = document.createElement("span");
-          chevron.className = "entry-chevron";
-          chevron.textContent = "▶";
-          chevron.setAttribute("aria-label", "Toggle entry");
-          
-          // Prevent default click behavior - only chevron will trigger expand
-          summary.addEventListener("click", (e) => {
-            if (e.target !== chevron && !e.target.closest(".entry-chevron")) {
-              e.preventDefault();
-            }
-          });
-          summary.append(chevron);
-          
-          // Content wrapper
-          const content = document.createElement("div");
-          content.className = "entry-summary-content";
-          
-          const headerLine = document.createElement("span");
-          headerLine.className = "entry-line";
-          headerLine.textContent = entry.entryLine || (entry.author ? entry.author : "Entry " + (index + 1));
-          content.append(headerLine);
-
-          const title = document.createElement("strong");
-          title.textContent = entry.title || "Entry " + (index + 1);
-          content.append(title);
-
-          const meta = document.createElement("div");
-          meta.className = "entry-meta";
-          if (entry.role) meta.append(createMeta("Role: " + entry.role));
-          if (entry.type) meta.append(createMeta("Type: " + entry.type));
-          if (entry.author) meta.append(createMeta("Author: " + entry.author));
-          if (entry.timestamp) meta.append(createMeta(entry.timestamp));
-
-          content.append(meta);
-          summary.append(content);
-          detail.append(summary);
-
-          const body = document.createElement("div");
-          body.className = "entry-body";
-          const renderedContent = entry.body ? renderMarkdown(entry.body) : "(No entry body)";
-          body.innerHTML = renderedContent;
-          detail.append(body);
-
-          // Add toggle listener to persist entry state
-          detail.addEventListener("toggle", () => {
-            if (detail.open) {
-              state.openEntries.add(entryId);
-            } else {
-              state.openEntries.delete(entryId);
-            }
-            syncEntriesToURL();
-          });
-
-          container.append(detail);
-        });
-
-        return container;
-      }
-
-      function createMeta(text) {
-        const span = document.createElement("span");
-        span.textContent = text;
-        return span;
-      }
-
-      async function reorderRepo(repoName, direction) {
-        const index = state.repos.findIndex((repo) => repo.name === repoName);
-        const target = index + direction;
-        if (index < 0 || target < 0 || target >= state.repos.length) return;
-        const reordered = [...state.repos];
-        const [item] = reordered.splice(index, 1);
-        reordered.splice(target, 0, item);
-        state.repos = reordered;
-        await persistRepoOrder();
-        renderRepos();
-      }
-
-      async function persistRepoOrder() {
-        const response = await fetch("/api/repo-order", {
-          method: "POST",
-          headers: withCsrf({ "Content-Type": "application/json" }),
-          body: JSON.stringify({ order: state.repos.map((repo) => repo.name) }),
-        });
-        if (!response.ok) {
-          renderStatus("Failed to save repo order", "error");
-        } else {
-          flashStatus("Repository order saved");
-        }
-      }
-
-      async function reorderThread(repoName, index, direction) {
-        const repo = state.repos.find((item) => item.name === repoName);
-        if (!repo) return;
-        const threads = [...repo.threads];
-        const target = index + direction;
-        if (target < 0 || target >= threads.length) return;
-        const [item] = threads.splice(index, 1);
-        threads.splice(target, 0, item);
-        repo.threads = threads;
-        await persistThreadOrder(repoName, threads.map((thread) => thread.topic));
-        renderThreads();
-      }
-
-      async function persistThreadOrder(repoName, order) {
-        const response = await fetch("/api/thread-order", {
-          method: "POST",
-          headers: withCsrf({ "Content-Type": "application/json" }),
-          body: JSON.stringify({ repo: repoName, order }),
-        });
-        if (!response.ok) {
-          renderStatus("Failed to save thread order", "error");
-        } else {
-          flashStatus("Thread order saved");
-        }
-      }
-
-      async function saveThreadMetadata(thread, updates) {
-        const payload = {
-          filePath: thread.filePath,
-          repo: thread.repo,
-          originalTopic: thread.topic,
-          updates,
-        };
-        const response = await fetch("/api/thread-metadata", {
-          method: "POST",
-          headers: withCsrf({ "Content-Type": "application/json" }),
-          body: JSON.stringify(payload),
-        });
-        if (!response.ok) {
-          const data = await response.json().catch(() => ({}));
-          throw new Error(data.detail || "Failed to save metadata");
-        }
-        const data = await response.json();
-        return data.thread || thread;
-      }
-
-      function formatStatus(status) {
-        return (status || "UNKNOWN")
-          .toLowerCase()
-          .replace(/_/g, " ")
-          .replace(/(^|\\s)\\w/g, (match) => match.toUpperCase());
-      }
-
-      function relativeTime(timestamp) {
-        const date = new Date(timestamp);
-        if (Number.isNaN(date)) {
-          return "unknown";
-        }
-        const diffSeconds = (Date.now() - date.getTime()) / 1000;
-        const divisions = [
-          { amount: 60, unit: "second" },
-          { amount: 60, unit: "minute" },
-          { amount: 24, unit: "hour" },
-          { amount: 7, unit: "day" },
-          { amount: 4.34524, unit: "week" },
-          { amount: 12, unit: "month" },
-          { amount: Number.POSITIVE_INFINITY, unit: "year" },
-        ];
-        const rtf = new Intl.RelativeTimeFormat("en", { numeric: "auto" });
-        let duration = diffSeconds;
-        for (const division of divisions) {
-          if (Math.abs(duration) < division.amount) {
-            return rtf.format(Math.round(duration), division.unit);
-          }
-          duration /= division.amount;
-        }
-        return "awhile ago";
-      }
-
-      function debounce(fn, delay) {
-        let timeout;
-        return function (...args) {
-          clearTimeout(timeout);
-          timeout = setTimeout(() => fn.apply(this, args), delay);
-        };
-      }
-
-      function escapeHtml(value) {
-        return String(value || "")
-          .replace(/&/g, "&amp;")
-          .replace(/</g, "&lt;")
-          .replace(/>/g, "&gt;")
-          .replace(/"/g, "&quot;")
-          .replace(/'/g, "&#39;");
-      }
-    </script>
-  </body>
-</html>
-"""
+    errors = exc.errors()
+    if errors:
+        location = ".".join(str(part) for part in errors[0].get("loc", ()) if part != "body")
+        message = errors[0].get("msg", "invalid value")
+        prefix = f"Invalid payload: {location}" if location else "Invalid payload"
+        detail = f"{prefix}: {message}"
+    else:
+        detail = "Invalid payload"
+    return JSONResponse({"detail": detail}, status_code=400)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index() -> HTMLResponse:
+async def index(request: Request) -> Response:
     """Render the dashboard page."""
 
-    config = load_config()
-    html = (
-        INDEX_HTML
-        .replace("__THREADS_BASE__", config.threads_base)
-        .replace("__CSRF_TOKEN__", CSRF_TOKEN)
-    )
-    return HTMLResponse(content=html)
+    threads_base = await asyncio.to_thread(_current_threads_base)
+    page, compressed = _render_index(threads_base)
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=compressed, headers=headers)
+    return HTMLResponse(content=page, headers=headers)
 
 
 @app.get("/api/data")
-async def get_data() -> JSONResponse:
+async def get_data(request: Request) -> Response:
     """Return current dashboard data."""
 
-    payload = _build_payload()
-    return JSONResponse(payload)
-
+    # Statting and parsing thread files is blocking; keep it off the event loop.
+    etag, body = await _shared_payload_body()
+    # no-cache makes the browser revalidate every time, so an unchanged payload
+    # costs a 304 instead of re-downloading and re-rendering it.
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if _etag_matches(etag, request.headers.get("if-none-match", "")):
+        return Response(status_code=304, headers=headers)
+    accepts_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    if accepts_gzip and len(body) >= GZIP_MINIMUM_SIZE:
+        compressed = await asyncio.to_thread(_gzip_payload_body, etag, body)
+        # The compressed bytes are a different representation, so the tag is weak;
+        # If-None-Match uses weak comparison, so it still revalidates to a 304.
+        headers["ETag"] = "W/" + etag
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=compressed, media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _gzip_payload_body(etag: str, body: bytes) -> bytes:
+    """Return ``body`` gzip-compressed, compressing each payload version only once."""
+
+    cached = _gzip_payload.get("entry")
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+    compressed = gzip.compress(body, compresslevel=6, mtime=0)
+    _gzip_payload["entry"] = (etag, compressed)
+    return compressed
+
+
+def _validate_threads_base(threads_base: str) -> Path:
+    """Resolve and validate a candidate threads base directory.
 
-@app.post("/api/config/threads-base")
-async def update_threads_base(payload: Dict[str, Any], request: Request) -> JSONResponse:
-    """Update the threads base directory in the config."""
+    Args:
+        threads_base: Directory path as submitted by the client.
 
-    _require_authorized_post(request)
+    Returns:
+        The resolved directory path.
 
-    threads_base = payload.get("threadsBase")
-    if not threads_base:
-        raise HTTPException(status_code=400, detail="Missing threadsBase value")
+    Raises:
+        HTTPException: If the path is not a usable threads base.
+    """
 
-    path = Path(threads_base).expanduser().resolve()
-    if not path.exists() or not path.is_dir():
+    # One realpath and one stat replace the separate resolve/exists/is_dir calls
+    real_path = os.path.realpath(os.path.expanduser(threads_base))
+    try:
+        is_directory = stat.S_ISDIR(os.stat(real_path).st_mode)
+    except OSError:
+        is_directory = False
+    if not is_directory:
         raise HTTPException(status_code=400, detail="Path must be an existing directory")
 
+    path = Path(real_path)
     if path == Path(path.anchor):
         raise HTTPException(status_code=400, detail="Cannot use filesystem root as threads base")
 
     try:
-        contains_threads_repo = path.name.endswith("-threads") or any(
-            child.is_dir() and child.name.endswith("-threads") for child in path.iterdir()
-        )
+        contains_threads_repo = path.name.endswith("-threads")
+        if not contains_threads_repo:
+            with os.scandir(real_path) as entries:
+                contains_threads_repo = any(
+                    entry.name.endswith("-threads") and entry.is_dir() for entry in entries
+                )
     except PermissionError as exc:
         raise HTTPException(status_code=400, detail="Unable to inspect directory") from exc
 
@@ -2306,101 +999,171 @@ async def update_threads_base(payload: Dict[str, Any], request: Request) -> JSON
             detail="Directory must contain at least one '*-threads' repository",
         )
 
-    config = load_config()
-    config.threads_base = str(path)
-    save_config(config)
+    return path
+
+
+@lru_cache(maxsize=4)
+def _real_threads_base(threads_base: str) -> str:
+    """Return the canonical path of a configured threads base.
+
+    Cleared when the threads base is changed through the API.
+    """
+
+    return os.path.realpath(os.path.expanduser(threads_base))
+
+
+def _validate_thread_path(file_path: str, threads_base: str) -> Path:
+    """Resolve a client-supplied thread path and check it may be edited.
+
+    The checks work on path strings, so the only filesystem access is one
+    realpath and one stat of the thread file.
+
+    Args:
+        file_path: Thread file path as submitted by the client.
+        threads_base: Configured threads base directory.
+
+    Returns:
+        The resolved thread file path.
+
+    Raises:
+        HTTPException: If the file is missing or outside a ``*-threads``
+            repository under the threads base.
+    """
+
+    base = _real_threads_base(threads_base)
+    if os.path.dirname(base) == base:
+        raise HTTPException(status_code=400, detail="Configured threads base is not permitted")
+
+    real_path = os.path.realpath(os.path.expanduser(file_path))
+    try:
+        is_file = stat.S_ISREG(os.stat(real_path).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
+        raise HTTPException(status_code=400, detail="Thread file does not exist")
+
+    if os.path.commonpath((base, real_path)) != base:
+        raise HTTPException(status_code=400, detail="Invalid thread path")
+
+    # The nearest '*-threads' directory above the file is its repository. It must
+    # be the base itself or lie below it, not be one of the base's ancestors.
+    relative_dirs = os.path.relpath(real_path, base).split(os.sep)[:-1]
+    in_repository = base.endswith("-threads") or any(
+        part.endswith("-threads") for part in relative_dirs
+    )
+    if not in_repository:
+        if any(part.endswith("-threads") for part in base.split(os.sep)):
+            raise HTTPException(
+                status_code=400, detail="Thread file is outside the configured threads base"
+            )
+        raise HTTPException(
+            status_code=400, detail="Thread file must be inside a '*-threads' repository"
+        )
+
+    return Path(real_path)
+
+
+@app.post("/api/config/threads-base")
+async def update_threads_base(payload: ThreadsBaseBody, request: Request) -> JSONResponse:
+    """Update the threads base directory in the config."""
+
+    _require_authorized_post(request)
+
+    threads_base = payload.threadsBase
+    if not threads_base:
+        raise HTTPException(status_code=400, detail="Missing threadsBase value")
+
+    # The path is user-supplied and may sit on a slow or network mount, so
+    # validate it in a worker thread rather than on the event loop.
+    path = await asyncio.to_thread(_validate_threads_base, threads_base)
+
+    def _set_threads_base(config: DashboardConfig) -> bool:
+        config.threads_base = str(path)
+        return True
+
+    await asyncio.to_thread(_update_config, _set_threads_base)
+    _get_parser.cache_clear()
+    _real_threads_base.cache_clear()
+    _cached_repo_root.cache_clear()
     return JSONResponse({"status": "ok"})
 
 
 @app.post("/api/repo-order")
-async def update_repo_order(payload: Dict[str, Any], request: Request) -> JSONResponse:
+async def update_repo_order(payload: RepoOrderBody, request: Request) -> JSONResponse:
     """Persist a new repo ordering."""
 
     _require_authorized_post(request)
 
-    order = payload.get("order")
-    if not isinstance(order, list):
+    order = payload.order
+    if order is None:
         raise HTTPException(status_code=400, detail="order must be a list")
 
-    config = load_config()
-    config.repo_order = [str(repo) for repo in order]
-    save_config(config)
+    def _set_repo_order(config: DashboardConfig) -> bool:
+        config.repo_order = list(order)
+        return True
+
+    await asyncio.to_thread(_update_config, _set_repo_order, defer=True)
     return JSONResponse({"status": "ok"})
 
 
 @app.post("/api/thread-order")
-async def update_thread_order(payload: Dict[str, Any], request: Request) -> JSONResponse:
+async def update_thread_order(payload: ThreadOrderBody, request: Request) -> JSONResponse:
     """Persist thread ordering for a repository."""
 
     _require_authorized_post(request)
 
-    repo = payload.get("repo")
-    order = payload.get("order")
+    repo = payload.repo
+    order = payload.order
 
-    if not repo or not isinstance(order, list):
+    if not repo or order is None:
         raise HTTPException(status_code=400, detail="Invalid payload")
 
-    config = load_config()
-    config.thread_order[repo] = [str(topic) for topic in order]
-    save_config(config)
+    def _set_thread_order(config: DashboardConfig) -> bool:
+        config.thread_order[repo] = list(order)
+        return True
+
+    await asyncio.to_thread(_update_config, _set_thread_order, defer=True)
     return JSONResponse({"status": "ok"})
 
 
 @app.post("/api/thread-metadata")
-async def update_thread_metadata(payload: Dict[str, Any], request: Request) -> JSONResponse:
+async def update_thread_metadata(payload: ThreadMetadataBody, request: Request) -> JSONResponse:
     """Update thread metadata fields (status, priority, ball, spec, topic)."""
 
     _require_authorized_post(request)
 
-    file_path = payload.get("filePath")
-    updates = payload.get("updates")
-    repo = payload.get("repo")
-    original_topic = payload.get("originalTopic")
+    file_path = payload.filePath
+    updates = payload.updates
+    repo = payload.repo
+    original_topic = payload.originalTopic
 
-    if not file_path or not isinstance(updates, dict):
+    if not file_path or updates is None:
         raise HTTPException(status_code=400, detail="filePath and updates are required")
 
-    config = load_config()
-    base_path = Path(config.threads_base).expanduser().resolve()
+    threads_base = await asyncio.to_thread(_current_threads_base)
+    # Resolving the path touches the filesystem; keep it off the event loop.
+    resolved_path = await asyncio.to_thread(_validate_thread_path, file_path, threads_base)
 
-    if base_path == Path(base_path.anchor):
-        raise HTTPException(status_code=400, detail="Configured threads base is not permitted")
-
-    resolved_path = Path(file_path).expanduser().resolve()
-
-    if not resolved_path.is_file():
-        raise HTTPException(status_code=400, detail="Thread file does not exist")
-
-    try:
-        resolved_path.relative_to(base_path)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail="Invalid thread path") from exc
-
-    repo_root = next(
-        (parent for parent in resolved_path.parents if parent.name.endswith("-threads")),
-        None,
+    parser = _get_parser(threads_base)
+    # Repo lookup, file rewrite and commit are blocking; keep them off the event loop.
+    updated_thread, git_helper = await asyncio.to_thread(
+        _write_thread_metadata, parser, resolved_path, updates
     )
-    if not repo_root:
-        raise HTTPException(status_code=400, detail="Thread file must be inside a '*-threads' repository")
-    if repo_root != base_path and base_path not in repo_root.parents:
-        raise HTTPException(status_code=400, detail="Thread file is outside the configured threads base")
-
-    parser = _get_parser(config.threads_base)
-    git_helper = _get_git_helper(resolved_path)
-    updated_thread = parser.update_thread_metadata(resolved_path, updates, git_helper=git_helper)
     if not updated_thread:
         raise HTTPException(status_code=500, detail="Unable to update thread metadata")
 
+    # Push in the background so the request returns as soon as the commit lands.
+    git_status = updated_thread.get("git_status")
+    if git_helper and git_status and git_status.get("committed"):
+        git_status["push_queued"] = git_helper.schedule_push()
+
     updated_topic = updated_thread.get("topic")
-    config_changed = False
 
-    if repo and original_topic:
+    def _rename_in_thread_order(config: DashboardConfig) -> bool:
+        config_changed = False
         order = config.thread_order.get(repo, [])
         if order:
-            new_order = [
-                updated_topic if topic == original_topic else topic
-                for topic in order
-            ]
+            new_order = [updated_topic if topic == original_topic else topic for topic in order]
             if new_order != order:
                 config.thread_order[repo] = new_order
                 config_changed = True
@@ -2409,20 +1172,19 @@ async def update_thread_metadata(payload: Dict[str, Any], request: Request) -> J
             if updated_topic not in current_order:
                 config.thread_order[repo] = current_order + [updated_topic]
                 config_changed = True
+        return config_changed
 
-    if config_changed:
-        save_config(config)
+    if repo and original_topic:
+        await asyncio.to_thread(_update_config, _rename_in_thread_order, defer=True)
 
     repo_name = repo or updated_thread.get("repo") or ""
     serialized = _serialize_thread(updated_thread, repo_name)
 
     # Include git operation status in response
-    git_status = updated_thread.get("git_status", {"committed": False, "pushed": False, "error": "Git status unknown"})
-    return JSONResponse({
-        "status": "ok",
-        "thread": serialized,
-        "git": git_status
-    })
+    git_status = updated_thread.get(
+        "git_status", {"committed": False, "pushed": False, "error": "Git status unknown"}
+    )
+    return FastJSONResponse({"status": "ok", "thread": serialized, "git": git_status})
 
 
 @app.get("/api/events")
@@ -2433,7 +1195,7 @@ async def events_stream(request: Request) -> StreamingResponse:
     when threads repositories are updated.
     """
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE-formatted events."""
         try:
             async for event in _coordinator.subscribe():
@@ -2442,7 +1204,7 @@ async def events_stream(request: Request) -> StreamingResponse:
                     break
 
                 # Format as SSE
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _message_frame(event)
 
         except asyncio.CancelledError:
             logger.info("SSE client disconnected")
@@ -2459,24 +1221,240 @@ async def events_stream(request: Request) -> StreamingResponse:
     )
 
 
+class _DataStreamHub:
+    """Polls for payload changes once on behalf of every ``/api/data/stream`` client.
+
+    A single producer task rebuilds the payload each interval (or as soon as a
+    poller reports an update) and hands each new version to every subscriber
+    queue, so filesystem checks do not scale with the number of open tabs.
+    The task starts with the first subscriber and stops with the last.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self._previous: Dict[str, Any] | None = None
+        self._version: str | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a client and return the queue its updates are delivered to.
+
+        Queue items are ``(from_version, to_version, payload, frame)`` tuples.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=DATA_STREAM_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a client, stopping the producer when none are left."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wake(self) -> None:
+        """Check for changes now instead of waiting for the next interval."""
+        self._wake.set()
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=DATA_STREAM_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                # The payload cache makes an unchanged tree a stat-only check
+                current, version, frame = await asyncio.to_thread(
+                    _poll_change, self._previous, self._version
+                )
+            except Exception as e:
+                logger.error(f"Failed to refresh data stream payload: {e}")
+                continue
+
+            if frame is None:
+                continue
+            update = (self._version, version, current, frame)
+            self._previous, self._version = current, version
+            for queue in tuple(self._subscribers):
+                _offer(queue, update)
+
+
+def _offer(queue: asyncio.Queue, item: Any) -> None:
+    """Put ``item`` on a bounded queue, discarding its oldest entry when full."""
+
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        queue.put_nowait(item)
+
+
+_data_hub = _DataStreamHub()
+
+
+@app.get("/api/data/stream")
+async def data_stream(request: Request) -> StreamingResponse:
+    """Server-Sent Events stream of dashboard data changes.
+
+    Emits ``change`` events carrying only the repos that changed, with the
+    payload ETag as the event id. Pass the ETag the client already has as
+    ``?since=`` (or via ``Last-Event-ID``) to skip the initial catch-up event.
+    Refresh notifications from the pollers are forwarded as plain messages,
+    so this one connection replaces ``/api/events`` for the dashboard.
+    """
+
+    since = request.query_params.get("since") or request.headers.get("last-event-id")
+    if since:
+        # Compressed /api/data responses mark the ETag weak; versions compare strong
+        since = since.removeprefix("W/")
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        # Subscribe before catching up so no version published meanwhile is missed
+        updates = _data_hub.subscribe()
+
+        async def pump() -> None:
+            async for event in _coordinator.subscribe():
+                _offer(updates, _message_frame(event))
+                _data_hub.wake()
+
+        pump_task = asyncio.create_task(pump())
+        try:
+            previous, version, frame = await asyncio.to_thread(_poll_change, None, since)
+            if frame is not None:
+                yield frame
+            idle_ticks = 0
+
+            while not await request.is_disconnected():
+                try:
+                    item = await asyncio.wait_for(updates.get(), timeout=DATA_STREAM_INTERVAL)
+                except asyncio.TimeoutError:
+                    # A comment line keeps idle connections from being timed out by proxies
+                    idle_ticks += 1
+                    if idle_ticks * DATA_STREAM_INTERVAL >= DATA_STREAM_KEEPALIVE:
+                        idle_ticks = 0
+                        yield _SSE_KEEPALIVE
+                    continue
+
+                idle_ticks = 0
+                if isinstance(item, bytes):
+                    yield item
+                    continue
+
+                from_version, to_version, current, frame = item
+                if to_version == version:
+                    continue
+                if from_version != version:
+                    # This client was on another version (it caught up separately
+                    # or an update was dropped), so it needs its own delta
+                    frame = await asyncio.to_thread(
+                        _change_event, previous, version, current, to_version
+                    )
+                previous, version = current, to_version
+                yield frame
+
+        except asyncio.CancelledError:
+            logger.info("Data stream client disconnected")
+            raise
+        finally:
+            pump_task.cancel()
+            _data_hub.unsubscribe(updates)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def _message_frame(event: Dict[str, Any]) -> bytes:
+    """Encode a refresh notification as an SSE message frame."""
+
+    return _SSE_DATA + _json_bytes(event) + _SSE_END
+
+
+def _poll_change(
+    previous: Dict[str, Any] | None, previous_version: str | None
+) -> tuple[Dict[str, Any], str, bytes | None]:
+    """Rebuild the payload and return the ``change`` frame to send, if any.
+
+    Args:
+        previous: Payload the client last received, or None if unknown.
+        previous_version: ETag the client last received, or None.
+
+    Returns:
+        The current payload, its ETag, and the encoded frame (None when the
+        client is already up to date).
+    """
+
+    current, version = _build_payload_version()
+    if version == previous_version:
+        return current, version, None
+    return current, version, _change_event(previous, previous_version, current, version)
+
+
+def _change_event(
+    previous: Dict[str, Any] | None,
+    previous_version: str | None,
+    current: Dict[str, Any],
+    version: str,
+) -> bytes:
+    """Return the encoded ``change`` frame taking a client from one version to the next.
+
+    Every connected client sees the same version transitions, so frames are
+    cached by ``(from, to)`` and encoded once rather than once per client.
+    """
+
+    key = (previous_version if previous is not None else None, version)
+    with _change_frames_lock:
+        frame = _change_frames.get(key)
+    if frame is not None:
+        return frame
+
+    delta = _json_bytes(_payload_delta(previous, current))
+    frame = _SSE_ID + version.encode("ascii") + _SSE_CHANGE_DATA + delta + _SSE_END
+    with _change_frames_lock:
+        _change_frames[key] = frame
+        while len(_change_frames) > CHANGE_FRAME_CACHE_SIZE:
+            _change_frames.popitem(last=False)
+    return frame
+
+
 @app.get("/api/health")
 async def health_check() -> JSONResponse:
     """Health check endpoint with poller status."""
 
-    poller_stats = [poller.get_stats() for poller in _pollers]
+    poller_stats = _poller.get_stats() if _poller else []
     coordinator_stats = _coordinator.get_stats()
 
-    return JSONResponse({
-        "status": "ok",
-        "timestamp": datetime.now().isoformat(),
-        "pollers": poller_stats,
-        "coordinator": coordinator_stats,
-    })
+    return JSONResponse(
+        {
+            "status": "ok",
+            "timestamp": datetime.now().isoformat(),
+            "pollers": poller_stats,
+            "coordinator": coordinator_stats,
+        }
+    )
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize background polling services on startup."""
+    global _poller
+
     config = load_config()
     threads_base = Path(config.threads_base).expanduser().resolve()
 
@@ -2484,38 +1462,49 @@ async def startup_event():
         logger.warning(f"Threads base does not exist: {threads_base}")
         return
 
-    # Find all *-threads repositories
-    for item in threads_base.iterdir():
-        if item.is_dir() and item.name.endswith("-threads"):
-            try:
-                # Create and start a poller for this repo
-                poller = ThreadsPoller(
-                    repo_path=item,
-                    interval=20,  # Poll every 20 seconds
-                    coordinator=_coordinator,
-                )
-                await poller.start()
-                _pollers.append(poller)
-                logger.info(f"Started poller for {item}")
-            except Exception as e:
-                logger.error(f"Failed to start poller for {item}: {e}")
+    # Find all *-threads repositories and poll them from a single task. Going
+    # through the shared parser warms its repository index for the first request.
+    parser = _get_parser(config.threads_base)
+    await asyncio.to_thread(_load_parse_cache, parser)
+    repo_paths = parser.list_repositories()
+    try:
+        _poller = MultiRepoPoller(
+            repo_paths=repo_paths,
+            interval=20,  # Poll every 20 seconds
+            coordinator=_coordinator,
+        )
+        await _poller.start()
+    except Exception as e:
+        logger.error(f"Failed to start poller for {threads_base}: {e}")
+        _poller = None
 
-    logger.info(f"Auto-refresh initialized with {len(_pollers)} poller(s)")
+    logger.info(f"Auto-refresh initialized with {len(repo_paths)} repo(s)")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up polling services on shutdown."""
-    logger.info(f"Stopping {len(_pollers)} poller(s)...")
+    global _poller
+
+    await asyncio.to_thread(_flush_config)
+    await asyncio.to_thread(_save_parse_cache)
 
-    for poller in _pollers:
+    if _poller is not None:
+        logger.info(f"Stopping poller for {len(_poller.pollers)} repo(s)...")
         try:
-            await poller.stop()
+            await _poller.stop()
         except Exception as e:
-            logger.error(f"Error stopping poller {poller.repo_path}: {e}")
+            logger.error(f"Error stopping poller: {e}")
 
-    _pollers.clear()
-    logger.info("Auto-refresh shutdown complete")
+        _poller = None
+        logger.info("Auto-refresh shutdown complete")
+
+    # Let queued background pushes finish before the loop goes away
+    for helper in _git_helpers.values():
+        try:
+            await helper.wait_for_push()
+        except Exception as e:
+            logger.error(f"Error finishing push for {helper.repo_path}: {e}")
 
 
 def run() -> None:
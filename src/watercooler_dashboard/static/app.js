@@ -0,0 +1,1756 @@
+const CSRF_TOKEN = document.querySelector('meta[name="watercooler-csrf"]')?.content || "";
+const withCsrf = (headers = {}) =>
+  Object.assign({ "X-Watercooler-CSRF": CSRF_TOKEN }, headers || {});
+const PRIORITY_LEVELS = ["P0", "P1", "P2", "P3", "P4", "P5"];
+// Shared Intl instances; constructing them per call dominates formatting and sorting.
+const TIME_FORMAT = new Intl.DateTimeFormat([], { hour: "2-digit", minute: "2-digit" });
+const RELATIVE_TIME_FORMAT = new Intl.RelativeTimeFormat("en", { numeric: "auto" });
+const TITLE_COLLATOR = new Intl.Collator(undefined, { sensitivity: "base" });
+// Units relativeTime steps through, with how many of each make the next one up
+const RELATIVE_TIME_DIVISIONS = [
+  { amount: 60, unit: "second" },
+  { amount: 60, unit: "minute" },
+  { amount: 24, unit: "hour" },
+  { amount: 7, unit: "day" },
+  { amount: 4.34524, unit: "week" },
+  { amount: 12, unit: "month" },
+  { amount: Number.POSITIVE_INFINITY, unit: "year" },
+];
+const STORAGE_PREFIX = "wc-dashboard-local";
+const STORAGE_KEYS = {
+  status: STORAGE_PREFIX + "-status-filter",
+  sort: STORAGE_PREFIX + "-sort-order",
+  search: STORAGE_PREFIX + "-search",
+  archived: STORAGE_PREFIX + "-show-archived",
+};
+const SSE_CONFIG = {
+  reconnectDelay: 5000,
+  maxDelay: 60000,
+  fallbackInterval: 60000,
+};
+const sseState = {
+  source: null,
+  reconnectDelay: SSE_CONFIG.reconnectDelay,
+  reconnectTimer: null,
+  fallbackTimer: null,
+  toastTimer: null,
+};
+let refreshInFlight = null;
+// Change events arriving within this window are merged and rendered once.
+const CHANGE_APPLY_DELAY = 300;
+const pendingChange = { delta: null, version: null, timer: null };
+// Background refreshes within this many ms of the last data update are skipped;
+// user-triggered refreshes always fetch.
+const REFRESH_TTL = 500;
+const BACKGROUND_REFRESH_REASONS = new Set(["interval", "push", "visible"]);
+const ORDER_SAVE_DELAY = 250;
+// Pending reorder saves keyed by target ("repos" or "threads:<repo>")
+const pendingOrderSaves = new Map();
+// Markdown source of entry bodies not rendered yet, keyed by their <details>;
+// filled in the first time the entry is opened.
+const pendingEntryBodies = new WeakMap();
+// Metadata POST in flight per thread file, with the updates it carries
+const metadataSaves = new Map();
+// Rendered DOM nodes reused across renders: repo cards by name, thread cards by
+// repo + thread key along with the data signature they were built from.
+const repoCards = new Map();
+let threadCards = new Map();
+// Thread each rendered card was built from, for the delegated list handlers.
+const cardThreads = new WeakMap();
+// JSON signature per thread object; a new object arrives whenever its data changes.
+const threadSignatures = new WeakMap();
+// Cards past the first screenful start as placeholders and are only built once
+// they scroll near the viewport.
+const EAGER_THREAD_CARDS = 30;
+const pendingThreadStubs = new WeakMap();
+const threadStubObserver =
+  "IntersectionObserver" in window
+    ? new IntersectionObserver(materializeThreadStubs, { rootMargin: "400px" })
+    : null;
+// "Updated … ago" labels are refreshed only while on (or near) screen: when they
+// scroll into view and once a minute for those visible. Without
+// IntersectionObserver, reused cards refresh their labels on every render instead.
+const TIME_LABEL_INTERVAL = 60000;
+const visibleTimeLabels = new Set();
+const timeLabelObserver =
+  "IntersectionObserver" in window
+    ? new IntersectionObserver(handleTimeLabelVisibility, { rootMargin: "200px" })
+    : null;
+if (timeLabelObserver) {
+  setInterval(() => visibleTimeLabels.forEach(updateTimeLabel), TIME_LABEL_INTERVAL);
+}
+
+// Markdown rendering and syntax highlighting are only needed once an entry is
+// shown, so the libraries load on demand (or when the page goes idle) instead of
+// blocking the first paint.
+const MARKDOWN_SCRIPTS = [
+  "https://cdn.jsdelivr.net/npm/marked@11.1.1/marked.min.js",
+  "https://cdn.jsdelivr.net/npm/dompurify@3.0.8/dist/purify.min.js",
+  "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js",
+];
+let markdownLibraries = null;
+
+function loadMarkdownLibraries() {
+  if (!markdownLibraries) {
+    markdownLibraries = Promise.all(MARKDOWN_SCRIPTS.map(loadScript))
+      .then(configureMarkdown)
+      .catch((error) => {
+        // Entries stay as plain text.
+        console.warn("Markdown libraries unavailable:", error);
+      });
+  }
+  return markdownLibraries;
+}
+
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const script = document.createElement("script");
+    script.src = src;
+    script.async = true;
+    script.onload = resolve;
+    script.onerror = () => reject(new Error("Failed to load " + src));
+    document.head.append(script);
+  });
+}
+
+function markdownReady() {
+  return typeof marked !== 'undefined' && typeof DOMPurify !== 'undefined';
+}
+
+// Only what marked (GFM) and highlight.js emit for entry bodies. A tight allowlist
+// is both safer and cheaper to sanitize than DOMPurify's permissive default.
+const PURIFY_CONFIG = {
+  ALLOWED_TAGS: [
+    "p", "br", "hr", "strong", "em", "del", "a", "img", "ul", "ol", "li",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "code", "pre", "span",
+    "table", "thead", "tbody", "tr", "th", "td", "input",
+  ],
+  ALLOWED_ATTR: [
+    "href", "title", "class", "src", "alt", "align", "start", "type", "checked", "disabled",
+  ],
+};
+const UNSAFE_URL = /^\s*(javascript|data|vbscript):/i;
+
+// Configure marked.js for markdown rendering with syntax highlighting, and the
+// sanitizer it feeds.
+function configureMarkdown() {
+  DOMPurify.addHook("afterSanitizeAttributes", (node) => {
+    const href = node.getAttribute?.("href");
+    if (href && UNSAFE_URL.test(href)) {
+      node.removeAttribute("href");
+    }
+    // "input" is allowed only for GFM task-list items: always a read-only checkbox
+    if (node.nodeName === "INPUT") {
+      node.setAttribute("type", "checkbox");
+      node.setAttribute("disabled", "");
+    }
+  });
+  marked.setOptions({
+    highlight: function(code, lang) {
+      if (lang && hljs.getLanguage(lang)) {
+        try {
+          return hljs.highlight(code, { language: lang }).value;
+        } catch (e) {
+          console.warn('Highlight.js error:', e);
+        }
+      }
+      try {
+        return hljs.highlightAuto(code).value;
+      } catch (e) {
+        return code;
+      }
+    },
+    breaks: true,
+    gfm: true,
+  });
+}
+
+// Show `text` as markdown, or as plain text until the libraries have loaded.
+function renderEntryBody(element, text) {
+  if (markdownReady()) {
+    element.innerHTML = renderMarkdown(text);
+    return;
+  }
+  element.textContent = text;
+  loadMarkdownLibraries().then(() => {
+    if (markdownReady()) {
+      element.innerHTML = renderMarkdown(text);
+    }
+  });
+}
+
+// Sanitized HTML by markdown source. Entry bodies rarely change between refreshes,
+// so re-opened or re-rendered entries skip parsing and sanitizing. Keyed by the
+// text itself (no hash collisions); least recently used entries are evicted.
+const MARKDOWN_CACHE_SIZE = 500;
+const markdownCache = new Map();
+
+// Helper function to render markdown with sanitization
+function renderMarkdown(text) {
+  if (!text || typeof marked === 'undefined' || typeof DOMPurify === 'undefined') {
+    return text || '';
+  }
+  const cached = markdownCache.get(text);
+  if (cached !== undefined) {
+    markdownCache.delete(text);
+    markdownCache.set(text, cached);
+    return cached;
+  }
+  try {
+    const rawHTML = marked.parse(text);
+    const html = DOMPurify.sanitize(rawHTML, PURIFY_CONFIG);
+    markdownCache.set(text, html);
+    if (markdownCache.size > MARKDOWN_CACHE_SIZE) {
+      markdownCache.delete(markdownCache.keys().next().value);
+    }
+    return html;
+  } catch (e) {
+    console.warn('Markdown rendering error:', e);
+    return text;
+  }
+}
+
+// URL-based state persistence
+function getStateFromURL() {
+  const params = new URLSearchParams(window.location.search);
+  const threadsParam = params.get('thread');
+  const entriesParam = params.get('entry');
+  return {
+    repo: params.get('repo') || null,
+    status: params.get('status') || null,
+    search: params.get('search') || null,
+    threads: threadsParam ? new Set(threadsParam.split(',')) : new Set(),
+    entries: entriesParam ? new Set(entriesParam.split(',')) : new Set(),
+  };
+}
+
+// URL changes requested since the last flush; written with a single replaceState.
+let pendingURLUpdates = {};
+let urlFlushScheduled = false;
+
+function updateURL(updates) {
+  Object.assign(pendingURLUpdates, updates);
+  if (urlFlushScheduled) return;
+  urlFlushScheduled = true;
+  // Animation frames do not run in hidden tabs, so fall back to a timer there.
+  if (document.hidden || typeof requestAnimationFrame !== "function") {
+    setTimeout(flushURL, 50);
+  } else {
+    requestAnimationFrame(flushURL);
+  }
+}
+
+function flushURL() {
+  const updates = pendingURLUpdates;
+  pendingURLUpdates = {};
+  urlFlushScheduled = false;
+
+  const params = new URLSearchParams(window.location.search);
+  Object.entries(updates).forEach(([key, value]) => {
+    if (value) {
+      params.set(key, value);
+    } else {
+      params.delete(key);
+    }
+  });
+
+  // Update URL without page reload, skipping no-op writes
+  const query = params.toString();
+  if (query === window.location.search.replace(/^\?/, "")) return;
+  window.history.replaceState({}, "", `${window.location.pathname}?${query}`);
+}
+
+function syncThreadsToURL() {
+  const threadsList = Array.from(state.openThreads).join(',');
+  updateURL({ thread: threadsList || null });
+}
+
+function syncEntriesToURL() {
+  const entriesList = Array.from(state.openEntries).join(',');
+  updateURL({ entry: entriesList || null });
+}
+
+const elements = {
+  repos: document.getElementById("reposContainer"),
+  threads: document.getElementById("threadsContainer"),
+  toolbar: document.getElementById("toolbarControls"),
+  statusSelect: document.getElementById("filter-status"),
+  sortSelect: document.getElementById("sort-order"),
+  searchInput: document.getElementById("search-term"),
+  archivedToggle: document.getElementById("toggle-archived"),
+  form: document.getElementById("threadsBaseForm"),
+  threadsBaseInput: document.getElementById("threadsBaseInput"),
+  statusBanner: document.getElementById("configStatus"),
+  liveIndicator: document.getElementById("liveIndicator"),
+  updateToast: document.getElementById("updateToast"),
+};
+// Initialize state from URL parameters (preferred) or localStorage (fallback)
+const urlState = getStateFromURL();
+const state = {
+  repos: [],
+  activeRepo: urlState.repo || null,
+  filters: {
+    status: urlState.status || localStorage.getItem(STORAGE_KEYS.status) || "all",
+    sort: localStorage.getItem(STORAGE_KEYS.sort) || "default",
+    search: urlState.search || localStorage.getItem(STORAGE_KEYS.search) || "",
+    showArchived: localStorage.getItem(STORAGE_KEYS.archived) === "true",
+  },
+  openThreads: urlState.threads || new Set(),
+  openEntries: urlState.entries || new Set(),
+  // ETag of the data currently shown, used to resume /api/data/stream
+  dataVersion: null,
+  // When the data shown was last loaded or patched (ms since epoch)
+  dataLoadedAt: 0,
+};
+
+bindForm();
+populateToolbar();
+bindToolbar();
+bindLists();
+refreshData("initial")
+  .catch((error) => {
+    renderStatus(error.message, "error");
+    if (elements.threads) {
+      const empty = document.createElement("p");
+      empty.className = "empty-state";
+      empty.textContent = error.message;
+      elements.threads.replaceChildren(empty);
+    }
+  })
+  // Open the stream once the first snapshot is loaded so it only sends what changed since.
+  .finally(() => {
+    initEventStream();
+    if ("requestIdleCallback" in window) {
+      requestIdleCallback(loadMarkdownLibraries);
+    } else {
+      setTimeout(loadMarkdownLibraries, 2000);
+    }
+  });
+startFallbackPolling();
+window.addEventListener("pagehide", flushOrderSaves);
+document.addEventListener("visibilitychange", handleVisibilityChange);
+
+async function fetchData() {
+  const response = await fetch("/api/data", { cache: "no-cache" });
+  if (!response.ok) {
+    throw new Error("Failed to load dashboard data");
+  }
+  const data = await response.json();
+  discardDataDelta();
+  state.dataVersion = response.headers.get("ETag");
+  applyData(data.threadsBase, data.repos || [], data.error);
+}
+
+// Bursts of change events (a git pull touching many files) render once, on the
+// trailing edge of a short window; later repos replace earlier ones by name.
+function queueDataDelta(delta, version) {
+  const queued = pendingChange.delta;
+  if (queued) {
+    const byName = new Map((queued.repos || []).map((repo) => [repo.name, repo]));
+    (delta.repos || []).forEach((repo) => byName.set(repo.name, repo));
+    delta = { ...delta, repos: Array.from(byName.values()) };
+  }
+  pendingChange.delta = delta;
+  pendingChange.version = version || pendingChange.version;
+  if (!pendingChange.timer) {
+    pendingChange.timer = setTimeout(flushDataDelta, CHANGE_APPLY_DELAY);
+  }
+}
+
+function flushDataDelta() {
+  const { delta, version } = pendingChange;
+  discardDataDelta();
+  if (!delta) return;
+  applyDataDelta(delta);
+  state.dataVersion = version || state.dataVersion;
+}
+
+// A full snapshot supersedes any change events still waiting to be applied.
+function discardDataDelta() {
+  clearTimeout(pendingChange.timer);
+  pendingChange.delta = null;
+  pendingChange.version = null;
+  pendingChange.timer = null;
+}
+
+// Merge a change event from /api/data/stream: `repos` holds only the repos that
+// changed, `order` lists every repo currently present.
+function applyDataDelta(delta) {
+  const byName = new Map(state.repos.map((repo) => [repo.name, repo]));
+  (delta.repos || []).forEach((repo) => byName.set(repo.name, repo));
+  const repos = (delta.order || []).map((name) => byName.get(name)).filter(Boolean);
+  applyData(delta.threadsBase, repos, delta.error);
+}
+
+function applyData(threadsBase, repos, error) {
+  if (elements.threadsBaseInput && typeof threadsBase === "string") {
+    elements.threadsBaseInput.value = threadsBase;
+  }
+
+  state.repos = repos;
+  state.dataLoadedAt = Date.now();
+  repos.forEach((repo) => (repo.threads || []).forEach(indexThread));
+  const hasActive = state.activeRepo && state.repos.some((repo) => repo.name === state.activeRepo);
+  if (!hasActive && state.repos.length) {
+    state.activeRepo = state.repos[0].name;
+  } else if (!state.repos.length) {
+    state.activeRepo = null;
+  }
+
+  renderStatus(error || "", error ? "error" : "info");
+  renderRepos();
+  renderThreads();
+}
+
+async function refreshData(reason = "manual") {
+  if (refreshInFlight) {
+    return refreshInFlight;
+  }
+  if (BACKGROUND_REFRESH_REASONS.has(reason) && Date.now() - state.dataLoadedAt < REFRESH_TTL) {
+    return;
+  }
+
+  // No scroll save/restore: cards are reconciled in place and the list opts into
+  // scroll anchoring, so the viewport stays put across updates.
+  refreshInFlight = fetchData();
+
+  try {
+    await refreshInFlight;
+  } catch (error) {
+    if (reason !== "initial") {
+      console.error("Refresh failed:", error);
+    }
+    throw error;
+  } finally {
+    refreshInFlight = null;
+  }
+}
+
+function startFallbackPolling() {
+  if (sseState.fallbackTimer) {
+    clearInterval(sseState.fallbackTimer);
+  }
+  sseState.fallbackTimer = setInterval(() => {
+    refreshData("interval").catch(() => {
+      // Suppress errors during background polling; status banner covers explicit failures.
+    });
+  }, SSE_CONFIG.fallbackInterval);
+}
+
+// Hidden tabs neither poll nor hold a stream open; catch up when shown again.
+function handleVisibilityChange() {
+  if (document.hidden) {
+    // Hidden tabs get throttled timers and may be discarded without a pagehide,
+    // so send any settled-but-unsaved reorder now.
+    flushOrderSaves();
+    clearInterval(sseState.fallbackTimer);
+    sseState.fallbackTimer = null;
+    clearTimeout(sseState.reconnectTimer);
+    sseState.reconnectTimer = null;
+    teardownEventSource();
+    return;
+  }
+  sseState.reconnectDelay = SSE_CONFIG.reconnectDelay;
+  refreshData("visible")
+    .catch(() => {
+      // The stream and polling below retry; the status banner covers explicit failures.
+    })
+    .finally(initEventStream);
+  startFallbackPolling();
+}
+
+function initEventStream() {
+  if (!window.EventSource) {
+    setConnectionState("unsupported", "Live updates unavailable (EventSource unsupported)");
+    return;
+  }
+  connectEventStream();
+}
+
+function connectEventStream() {
+  teardownEventSource();
+  clearTimeout(sseState.reconnectTimer);
+  sseState.reconnectTimer = null;
+  setConnectionState("connecting");
+
+  const since = state.dataVersion ? "?since=" + encodeURIComponent(state.dataVersion) : "";
+  const source = new EventSource("/api/data/stream" + since);
+  sseState.source = source;
+
+  source.addEventListener("open", () => {
+    sseState.reconnectDelay = SSE_CONFIG.reconnectDelay;
+    setConnectionState("connected");
+  });
+
+  source.addEventListener("message", (event) => {
+    if (!event.data) return;
+    try {
+      const payload = JSON.parse(event.data);
+      handleEventMessage(payload);
+    } catch (error) {
+      console.error("Invalid event payload", error);
+    }
+  });
+
+  source.addEventListener("change", (event) => {
+    try {
+      queueDataDelta(JSON.parse(event.data), event.lastEventId);
+    } catch (error) {
+      console.error("Invalid change payload", error);
+    }
+  });
+
+  source.addEventListener("error", () => {
+    scheduleReconnect();
+  });
+}
+
+function teardownEventSource() {
+  if (sseState.source) {
+    sseState.source.close();
+    sseState.source = null;
+  }
+}
+
+function scheduleReconnect() {
+  setConnectionState(
+    sseState.reconnectDelay >= SSE_CONFIG.maxDelay ? "offline" : "reconnecting"
+  );
+
+  teardownEventSource();
+
+  if (sseState.reconnectTimer) {
+    clearTimeout(sseState.reconnectTimer);
+  }
+
+  const delay = sseState.reconnectDelay;
+  sseState.reconnectTimer = setTimeout(() => {
+    sseState.reconnectTimer = null;
+    connectEventStream();
+  }, delay);
+
+  sseState.reconnectDelay = Math.min(
+    Math.round(sseState.reconnectDelay * 1.8),
+    SSE_CONFIG.maxDelay
+  );
+}
+
+function handleEventMessage(payload) {
+  if (!payload || typeof payload.type !== "string") {
+    return;
+  }
+
+  if (payload.type === "threads:updated") {
+    // The new data itself arrives as a "change" event on the same stream.
+    showToast(`Threads updated ${formatUpdateTime(payload.timestamp)}`);
+  } else if (payload.type === "heartbeat") {
+    setConnectionState("connected");
+  }
+}
+
+function setConnectionState(state, overrideText) {
+  const indicator = elements.liveIndicator;
+  if (!indicator) return;
+  indicator.dataset.state = state;
+  const defaultText = {
+    connected: "Live updates on",
+    connecting: "Connecting…",
+    reconnecting: "Reconnecting…",
+    offline: "Offline – retrying soon",
+    unsupported: "Live updates unavailable",
+  };
+  indicator.textContent = overrideText || defaultText[state] || "Status unknown";
+}
+
+function showToast(message) {
+  const toast = elements.updateToast;
+  if (!toast) return;
+  toast.textContent = message;
+  toast.classList.add("visible");
+  if (sseState.toastTimer) {
+    clearTimeout(sseState.toastTimer);
+  }
+  sseState.toastTimer = setTimeout(() => {
+    toast.classList.remove("visible");
+  }, 2600);
+}
+
+function formatUpdateTime(value) {
+  try {
+    const date = value ? new Date(value) : new Date();
+    if (Number.isNaN(date.getTime())) {
+      return "just now";
+    }
+    return TIME_FORMAT.format(date);
+  } catch (error) {
+    console.warn("Unable to format update timestamp", error);
+    return "just now";
+  }
+}
+
+function populateToolbar() {
+  // The status and sort <option>s are part of the page template.
+  if (elements.statusSelect) {
+    elements.statusSelect.value = state.filters.status;
+  }
+  if (elements.sortSelect) {
+    elements.sortSelect.value = state.filters.sort;
+  }
+  if (elements.searchInput) {
+    elements.searchInput.value = state.filters.search;
+  }
+  if (elements.archivedToggle) {
+    elements.archivedToggle.checked = state.filters.showArchived;
+  }
+}
+
+function bindToolbar() {
+  if (elements.statusSelect) {
+    elements.statusSelect.addEventListener("change", (event) => {
+      state.filters.status = event.target.value;
+      localStorage.setItem(STORAGE_KEYS.status, state.filters.status);
+      updateURL({ status: state.filters.status !== 'all' ? state.filters.status : null });
+      renderThreads();
+    }, { passive: true });
+  }
+  if (elements.sortSelect) {
+    elements.sortSelect.addEventListener("change", (event) => {
+      state.filters.sort = event.target.value;
+      localStorage.setItem(STORAGE_KEYS.sort, state.filters.sort);
+      renderThreads();
+    }, { passive: true });
+  }
+  if (elements.searchInput) {
+    const debounced = debounce((event) => {
+      state.filters.search = event.target.value.trim().toLowerCase();
+      localStorage.setItem(STORAGE_KEYS.search, state.filters.search);
+      updateURL({ search: state.filters.search || null });
+      renderThreads();
+    }, 180);
+    elements.searchInput.addEventListener("input", debounced, { passive: true });
+  }
+  if (elements.archivedToggle) {
+    elements.archivedToggle.addEventListener("change", (event) => {
+      state.filters.showArchived = event.target.checked;
+      localStorage.setItem(STORAGE_KEYS.archived, state.filters.showArchived ? "true" : "false");
+      renderThreads();
+    }, { passive: true });
+  }
+}
+
+// Repo and thread cards carry data-* attributes instead of their own listeners;
+// these container-level handlers dispatch on them. All are passive except the
+// thread list click, which cancels summary toggles.
+function bindLists() {
+  if (elements.repos) {
+    elements.repos.addEventListener("click", handleRepoListClick, { passive: true });
+  }
+  if (elements.threads) {
+    elements.threads.addEventListener("click", handleThreadListClick);
+    elements.threads.addEventListener("change", handleThreadListChange, { passive: true });
+    elements.threads.addEventListener("toggle", handleThreadListToggle, {
+      capture: true,
+      passive: true,
+    });
+  }
+}
+
+function bindForm() {
+  if (!elements.form) return;
+  elements.form.addEventListener("submit", async (event) => {
+    event.preventDefault();
+    const formData = new FormData(elements.form);
+    const threadsBase = formData.get("threadsBase");
+
+    const response = await fetch("/api/config/threads-base", {
+      method: "POST",
+      headers: withCsrf({ "Content-Type": "application/json" }),
+      body: JSON.stringify({ threadsBase }),
+    });
+
+    if (response.ok) {
+      flashStatus("Threads directory updated");
+      await refreshData("manual");
+    } else {
+      const data = await response.json().catch(() => ({}));
+      renderStatus(data.detail || "Failed to update threads directory", "error");
+    }
+  });
+}
+
+function renderStatus(message = "", kind = "info") {
+  if (!elements.statusBanner) return;
+  if (!message) {
+    elements.statusBanner.textContent = "";
+    elements.statusBanner.style.color = "#059669";
+    return;
+  }
+  elements.statusBanner.textContent = message;
+  elements.statusBanner.style.color = kind === "error" ? "#b91c1c" : "#059669";
+}
+
+function flashStatus(message, kind = "info", timeout = 1600) {
+  renderStatus(message, kind);
+  if (timeout > 0) {
+    setTimeout(() => renderStatus("", "info"), timeout);
+  }
+}
+
+function renderRepos() {
+  if (!elements.repos) return;
+  if (!state.repos.length) {
+    repoCards.clear();
+    const empty = document.createElement("p");
+    empty.className = "empty-state";
+    empty.textContent = "No threads repositories discovered.";
+    elements.repos.replaceChildren(empty);
+    return;
+  }
+
+  // Reuse each repo's card and only touch the attributes that depend on state.
+  const seen = new Set();
+  const cards = state.repos.map((repo, index) => {
+    let card = repoCards.get(repo.name);
+    if (!card) {
+      card = buildRepoCard(repo.name);
+      repoCards.set(repo.name, card);
+    }
+    const isActive = repo.name === state.activeRepo;
+    card.classList.toggle("active", isActive);
+    card.setAttribute("aria-selected", isActive ? "true" : "false");
+    const [up, down] = card.querySelectorAll(".repo-controls button");
+    up.disabled = index === 0;
+    down.disabled = index === state.repos.length - 1;
+    seen.add(repo.name);
+    return card;
+  });
+  for (const name of repoCards.keys()) {
+    if (!seen.has(name)) repoCards.delete(name);
+  }
+  reconcileChildren(elements.repos, cards);
+}
+
+function buildRepoCard(repoName) {
+  const card = document.createElement("button");
+  card.type = "button";
+  card.className = "repo-card";
+  card.dataset.repoName = repoName;
+  card.setAttribute("role", "tab");
+
+  const label = document.createElement("strong");
+  label.textContent = repoName;
+  card.append(label);
+
+  const controlWrap = document.createElement("span");
+  controlWrap.className = "repo-controls";
+
+  const up = document.createElement("button");
+  up.type = "button";
+  up.textContent = "↑";
+  up.title = "Move repository up";
+  up.dataset.action = "repo-up";
+
+  const down = document.createElement("button");
+  down.type = "button";
+  down.textContent = "↓";
+  down.title = "Move repository down";
+  down.dataset.action = "repo-down";
+
+  controlWrap.append(up, down);
+  card.append(controlWrap);
+  return card;
+}
+
+// One click handler for every repo card (see bindLists).
+function handleRepoListClick(event) {
+  const card = event.target.closest(".repo-card");
+  if (!card) return;
+  const repoName = card.dataset.repoName;
+  const action = event.target.closest("[data-action]")?.dataset.action;
+  if (action === "repo-up") {
+    reorderRepo(repoName, -1);
+  } else if (action === "repo-down") {
+    reorderRepo(repoName, 1);
+  } else {
+    selectRepo(card);
+  }
+}
+
+// Switching tabs only changes which card is active, so update those two cards
+// rather than re-rendering the repo list.
+function selectRepo(card) {
+  const repoName = card.dataset.repoName;
+  if (repoName !== state.activeRepo) {
+    const previous = repoCards.get(state.activeRepo);
+    if (previous) {
+      previous.classList.remove("active");
+      previous.setAttribute("aria-selected", "false");
+    }
+    card.classList.add("active");
+    card.setAttribute("aria-selected", "true");
+    state.activeRepo = repoName;
+    updateURL({ repo: repoName });
+  }
+  renderThreads();
+}
+
+// Move `nodes` into `container` in order, leaving nodes already in place untouched
+// and removing any children that are no longer wanted.
+function reconcileChildren(container, nodes) {
+  // Nothing to keep (first render, repo switch): swap everything in one insertion.
+  if (!nodes.some((node) => node.parentNode === container)) {
+    const fragment = document.createDocumentFragment();
+    nodes.forEach((node) => fragment.appendChild(node));
+    container.replaceChildren(fragment);
+    return;
+  }
+  nodes.forEach((node, position) => {
+    const current = container.children[position];
+    if (current !== node) {
+      container.insertBefore(node, current || null);
+    }
+  });
+  while (container.children.length > nodes.length) {
+    container.lastElementChild.remove();
+  }
+}
+
+// Lowercased search text, the status sort rank, and the last update as epoch ms
+// (0 when missing or unparseable), stored non-enumerable so they stay out of card
+// signatures.
+// Threads from a delta that were already indexed are skipped.
+function indexThread(thread) {
+  if (Object.prototype.hasOwnProperty.call(thread, "_searchText")) return;
+  const updatedMs = thread.lastUpdate ? Date.parse(thread.lastUpdate) : 0;
+  Object.defineProperties(thread, {
+    _searchText: {
+      value: [thread.title, thread.topic, thread.ballOwner]
+        .map((value) => (value || "").toLowerCase())
+        .join("\u0000"),
+    },
+    _updatedMs: { value: Number.isNaN(updatedMs) ? 0 : updatedMs },
+    _statusRank: {
+      value: STATUS_RANK.get((thread.statusNormalized || "").toLowerCase()) ?? STATUS_RANK.size,
+    },
+  });
+}
+
+// Last filtered + sorted list; reused while the thread array and filters are unchanged.
+let visibleThreadsCache = { threads: null, filterKey: "", list: [] };
+
+function visibleThreads(repo) {
+  const threads = repo.threads || [];
+  const { status, sort, search, showArchived } = state.filters;
+  const filterKey = [status, sort, search, showArchived].join("\u0000");
+  if (visibleThreadsCache.threads !== threads || visibleThreadsCache.filterKey !== filterKey) {
+    visibleThreadsCache = { threads, filterKey, list: sortThreads(applyFilters(threads)) };
+  }
+  return visibleThreadsCache.list;
+}
+
+function applyFilters(threads) {
+  const search = state.filters.search;
+  const statusFilter = state.filters.status;
+  const includeArchived = state.filters.showArchived;
+  return threads.filter((thread) => {
+    const isArchived = Boolean(thread.isArchived);
+    if (isArchived && !includeArchived) {
+      return false;
+    }
+    const matchesStatus =
+      statusFilter === "all" || (thread.statusNormalized || "").toLowerCase() === statusFilter;
+    const matchesSearch = !search || thread._searchText.includes(search);
+    return matchesStatus && matchesSearch;
+  });
+}
+
+function sortThreads(threads) {
+  const key = state.filters.sort;
+  const comparator = getComparator(key);
+  return [...threads].sort(comparator);
+}
+
+// Default ordering: open, blocked, in review, closed, then anything else.
+const STATUS_RANK = new Map([
+  ["open", 0],
+  ["blocked", 1],
+  ["in_review", 2],
+  ["closed", 3],
+]);
+
+// Comparators over fields precomputed by indexThread, so sorting is plain
+// integer arithmetic (titles aside) with no per-comparison parsing or branching.
+const THREAD_COMPARATORS = {
+  "updated-desc": (a, b) => b._updatedMs - a._updatedMs,
+  "updated-asc": (a, b) => a._updatedMs - b._updatedMs,
+  priority: (a, b) => a.priorityRank - b.priorityRank || b._updatedMs - a._updatedMs,
+  title: (a, b) => TITLE_COLLATOR.compare(a.title || "", b.title || ""),
+  default: (a, b) =>
+    a._statusRank - b._statusRank ||
+    a.priorityRank - b.priorityRank ||
+    b._updatedMs - a._updatedMs,
+};
+
+function getComparator(key) {
+  // The sort key comes from localStorage, so only accept our own keys.
+  return Object.hasOwn(THREAD_COMPARATORS, key) ? THREAD_COMPARATORS[key] : THREAD_COMPARATORS.default;
+}
+
+function getActiveRepo() {
+  if (!state.activeRepo) return null;
+  return state.repos.find((repo) => repo.name === state.activeRepo) || null;
+}
+
+function getThreadKey(thread, index) {
+  if (!thread) return String(index);
+  const candidate = thread.topic || thread.title || thread.filePath;
+  return candidate ? String(candidate) : String(index);
+}
+
+function renderThreads() {
+  if (!elements.threads) return;
+  const currentlyOpen = new Set(
+    Array.from(elements.threads.querySelectorAll("details[open][data-topic]")).map(
+      (detail) => detail.dataset.topic || ""
+    )
+  );
+  currentlyOpen.forEach((topic) => {
+    if (topic) state.openThreads.add(topic);
+  });
+
+  const repo = getActiveRepo();
+
+  if (!repo) {
+    const empty = document.createElement("p");
+    empty.className = "empty-state";
+    empty.textContent = "Select a repository to view its threads.";
+    elements.threads.replaceChildren(empty);
+    releaseThreadStubs(new Map());
+    threadCards = new Map();
+    state.openThreads = new Set();
+    return;
+  }
+
+  const filtered = visibleThreads(repo);
+  if (!filtered.length) {
+    const empty = document.createElement("p");
+    empty.className = "empty-state";
+    empty.textContent = "No threads match the current filters.";
+    elements.threads.replaceChildren(empty);
+    releaseThreadStubs(new Map());
+    threadCards = new Map();
+    state.openThreads = new Set();
+    return;
+  }
+
+  const nextOpen = new Set();
+  const nextCards = new Map();
+  const repoSize = repo.threads?.length || 0;
+
+  const cards = filtered.map((thread, index) => {
+    const key = getThreadKey(thread, index);
+    const signature = threadSignature(thread);
+    const cacheKey = repo.name + "\u0000" + key;
+    const cached = threadCards.get(cacheKey);
+    let card;
+    if (cached && cached.signature === signature) {
+      // Same data, possibly a new position: only the reorder controls move.
+      card = cached.card;
+      updateThreadPosition(card, index, repoSize);
+      if (!timeLabelObserver) {
+        refreshRelativeTimes(card);
+      }
+    } else {
+      const shouldOpen = key ? state.openThreads.has(key) : false;
+      card =
+        threadStubObserver && !shouldOpen && index >= EAGER_THREAD_CARDS
+          ? buildThreadStub(thread, index, repo, key, cacheKey)
+          : buildThreadCard(thread, index, repo, shouldOpen, key);
+    }
+    nextCards.set(cacheKey, { signature, card });
+    if (card.open && key) {
+      nextOpen.add(key);
+    }
+    return card;
+  });
+
+  releaseThreadStubs(nextCards);
+  threadCards = nextCards;
+  reconcileChildren(elements.threads, cards);
+  state.openThreads = nextOpen;
+}
+
+function threadSignature(thread) {
+  let signature = threadSignatures.get(thread);
+  if (signature === undefined) {
+    signature = JSON.stringify(thread);
+    threadSignatures.set(thread, signature);
+  }
+  return signature;
+}
+
+// Lightweight stand-in for a thread card; swapped for the real card when it nears
+// the viewport, so large repos only build what the user scrolls to.
+function buildThreadStub(thread, index, repo, key, cacheKey) {
+  const stub = document.createElement("div");
+  stub.className = "thread-stub";
+  stub.dataset.index = String(index);
+  pendingThreadStubs.set(stub, { thread, repo, key, cacheKey });
+  threadStubObserver.observe(stub);
+  return stub;
+}
+
+// Placeholders that came into view, built a few per animation frame so a long
+// fling through the list cannot block the main thread in one go.
+const THREAD_CARDS_PER_FRAME = 10;
+const stubQueue = [];
+let stubFrame = null;
+
+function materializeThreadStubs(entries) {
+  entries.forEach((entry) => {
+    if (!entry.isIntersecting) return;
+    threadStubObserver.unobserve(entry.target);
+    stubQueue.push(entry.target);
+  });
+  scheduleStubFrame();
+}
+
+function scheduleStubFrame() {
+  if (stubFrame === null && stubQueue.length) {
+    stubFrame = requestAnimationFrame(buildQueuedStubs);
+  }
+}
+
+function buildQueuedStubs() {
+  stubFrame = null;
+  stubQueue.splice(0, THREAD_CARDS_PER_FRAME).forEach(materializeThreadStub);
+  scheduleStubFrame();
+}
+
+function materializeThreadStub(stub) {
+  const pending = pendingThreadStubs.get(stub);
+  if (!pending) return; // Released by a later render.
+  if (!stub.isConnected) {
+    // Detached while queued; build it if a later render puts it back in view.
+    threadStubObserver.observe(stub);
+    return;
+  }
+  pendingThreadStubs.delete(stub);
+
+  // The repo may have been refreshed since the stub was made; use its current size.
+  const repo = state.repos.find((item) => item.name === pending.repo.name) || pending.repo;
+  const index = Number(stub.dataset.index);
+  const card = buildThreadCard(
+    pending.thread,
+    index,
+    repo,
+    state.openThreads.has(pending.key),
+    pending.key
+  );
+  updateThreadPosition(card, index, repo.threads?.length || 0);
+  stub.replaceWith(card);
+  const cached = threadCards.get(pending.cacheKey);
+  if (cached && cached.card === stub) {
+    cached.card = card;
+  }
+}
+
+// Stop observing placeholders that are not part of the next render.
+function releaseThreadStubs(nextCards) {
+  if (!threadStubObserver) return;
+  threadCards.forEach(({ card }, cacheKey) => {
+    if (pendingThreadStubs.has(card) && nextCards.get(cacheKey)?.card !== card) {
+      threadStubObserver.unobserve(card);
+      pendingThreadStubs.delete(card);
+    }
+  });
+}
+
+// The reorder buttons read the card's index when clicked, so a moved card (or one
+// whose repo gained or lost threads) only needs its index and enabled state updated.
+function updateThreadPosition(card, index, repoSize) {
+  card.dataset.index = String(index);
+  if (pendingThreadStubs.has(card)) return;
+  const [up, down] = card.querySelectorAll(".thread-actions button");
+  up.disabled = index === 0;
+  down.disabled = index === repoSize - 1;
+}
+
+function handleTimeLabelVisibility(entries) {
+  entries.forEach(({ target, isIntersecting }) => {
+    if (isIntersecting) {
+      visibleTimeLabels.add(target);
+      updateTimeLabel(target);
+    } else {
+      visibleTimeLabels.delete(target);
+      if (!target.isConnected) {
+        timeLabelObserver.unobserve(target);
+      }
+    }
+  });
+}
+
+function updateTimeLabel(label) {
+  const text = "Updated " + relativeTime(label.dataset.timestamp);
+  if (label.textContent !== text) {
+    label.textContent = text;
+  }
+}
+
+function refreshRelativeTimes(card) {
+  card.querySelectorAll(".thread-updated[data-timestamp]").forEach(updateTimeLabel);
+}
+
+function buildThreadCard(thread, index, repo, shouldOpen = false, threadKey = null) {
+  const detail = document.createElement("details");
+  detail.className = "thread-card";
+  detail.dataset.index = String(index);
+  detail.dataset.status = thread.statusNormalized || "";
+  detail.dataset.priority = thread.priority || "";
+  const identifier = threadKey || getThreadKey(thread, index);
+  if (identifier) {
+    detail.dataset.topic = identifier;
+  }
+  if (shouldOpen && identifier) {
+    detail.open = true;
+  }
+    const summary = document.createElement("summary");
+    summary.className = "thread-summary";
+
+  // Add chevron first
+  const chevron = document.createElement("span");
+  chevron.className = "thread-chevron";
+  chevron.textContent = "▶";
+  chevron.setAttribute("aria-label", "Toggle thread");
+
+  const badge = document.createElement("span");
+  badge.className = "summary-badge";
+  badge.textContent = (thread.topic || "?").slice(0, 2).toUpperCase();
+
+  const heading = document.createElement("div");
+  heading.className = "thread-heading";
+  const title = document.createElement("h2");
+  title.textContent = thread.title || thread.topic || "Untitled thread";
+  heading.append(title);
+
+  // Editable meta line with inline status/priority editing
+  const metaLine = document.createElement("div");
+  metaLine.className = "thread-meta-editable";
+
+  // Inline status editor
+  const statusWrapper = document.createElement("span");
+  statusWrapper.className = "badge badge-status-" + (thread.statusNormalized || "unknown") + " badge-editable badge-editable-status";
+  statusWrapper.textContent = formatStatus(thread.status);
+  const statusSelect = document.createElement("select");
+  ["OPEN", "IN_REVIEW", "BLOCKED", "CLOSED"].forEach((option) => {
+    const opt = document.createElement("option");
+    opt.value = option;
+    opt.textContent = formatStatus(option);
+    if (option === (thread.status || "OPEN").toUpperCase()) opt.selected = true;
+    statusSelect.append(opt);
+  });
+  statusSelect.dataset.action = "inline-status";
+  statusWrapper.append(statusSelect);
+  metaLine.append(statusWrapper);
+
+  // Inline priority editor
+  const priorityWrapper = document.createElement("span");
+  priorityWrapper.className = "badge badge-priority badge-editable badge-editable-status";
+  priorityWrapper.textContent = "Priority " + thread.priority;
+  const prioritySelect = document.createElement("select");
+  PRIORITY_LEVELS.forEach((level) => {
+    const opt = document.createElement("option");
+    opt.value = level;
+    opt.textContent = level;
+    if (level === thread.priority) opt.selected = true;
+    prioritySelect.append(opt);
+  });
+  prioritySelect.dataset.action = "inline-priority";
+  priorityWrapper.append(prioritySelect);
+  metaLine.append(priorityWrapper);
+
+  if (thread.hasNew) {
+    const newBadge = document.createElement("span");
+    newBadge.className = "badge badge-new";
+    newBadge.textContent = "NEW";
+    metaLine.append(newBadge);
+  }
+
+  if (thread.ballOwner) {
+    const ball = document.createElement("span");
+    ball.textContent = "Ball: " + thread.ballOwner;
+    metaLine.append(ball);
+  }
+  if (thread.lastUpdate) {
+    const updated = document.createElement("span");
+    updated.className = "thread-updated";
+    updated.dataset.timestamp = thread.lastUpdate;
+    updated.textContent = "Updated " + relativeTime(thread.lastUpdate);
+    updated.title = thread.lastUpdate;
+    timeLabelObserver?.observe(updated);
+    metaLine.append(updated);
+  }
+  metaLine.append("Entries: " + (thread.entryCount || 0));
+  heading.append(metaLine);
+
+  const actions = buildThreadActions(thread, index, repo);
+
+  summary.append(chevron, badge, heading, actions);
+  detail.append(summary);
+
+  // The editor and entries are only built once the card is first opened, so
+  // collapsed cards stay a summary line's worth of nodes and listeners.
+  const body = document.createElement("div");
+  body.className = "thread-detail";
+  body.dataset.lazy = "1";
+  detail.append(body);
+  cardThreads.set(detail, thread);
+  if (detail.open) {
+    fillThreadBody(detail);
+  }
+
+  return detail;
+}
+
+function fillEntryBody(detail) {
+  const text = pendingEntryBodies.get(detail);
+  if (text === undefined) return;
+  pendingEntryBodies.delete(detail);
+  renderEntryBody(detail.querySelector(":scope > .entry-body"), text);
+}
+
+function fillThreadBody(card) {
+  const body = card.querySelector(":scope > .thread-detail");
+  if (!body || !body.dataset.lazy) return;
+  delete body.dataset.lazy;
+  const thread = cardThreads.get(card);
+  body.append(buildEditor(thread), buildEntryList(thread));
+}
+
+// Clicks anywhere in the thread list: reorder/copy buttons, and keeping
+// summaries from toggling unless the chevron (or an inline editor) was used.
+function handleThreadListClick(event) {
+  const target = event.target;
+  const card = target.closest(".thread-card");
+  if (!card) return;
+
+  const action = target.closest("[data-action]")?.dataset.action;
+  if (action === "thread-up" || action === "thread-down") {
+    reorderThread(state.activeRepo, Number(card.dataset.index), action === "thread-up" ? -1 : 1);
+    return;
+  }
+  if (action === "copy-path") {
+    copyThreadPath(cardThreads.get(card));
+    return;
+  }
+
+  const isToggle = target.closest(".thread-chevron, .entry-chevron");
+  const isEditable = target.closest(".badge-editable, select");
+  if (target.closest("summary") && !isToggle && !isEditable) {
+    event.preventDefault();
+  }
+}
+
+function handleThreadListChange(event) {
+  const action = event.target.dataset.action;
+  const card = event.target.closest(".thread-card");
+  if (!card) return;
+  if (action === "inline-status") {
+    saveInlineMetadata(cardThreads.get(card), { Status: event.target.value }, "status");
+  } else if (action === "inline-priority") {
+    saveInlineMetadata(cardThreads.get(card), { Priority: event.target.value }, "priority");
+  }
+}
+
+// `toggle` does not bubble, so this is registered in the capture phase.
+function handleThreadListToggle(event) {
+  const detail = event.target;
+  if (detail.matches("details.entry")) {
+    const entryId = detail.dataset.entryId;
+    if (detail.open) {
+      fillEntryBody(detail);
+      state.openEntries.add(entryId);
+    } else {
+      state.openEntries.delete(entryId);
+    }
+    syncEntriesToURL();
+    return;
+  }
+  if (!detail.matches("details.thread-card")) return;
+
+  if (detail.open) {
+    fillThreadBody(detail);
+  }
+  const identifier = detail.dataset.topic;
+  if (!identifier) return;
+  if (detail.open) {
+    state.openThreads.add(identifier);
+  } else {
+    state.openThreads.delete(identifier);
+  }
+  syncThreadsToURL();
+}
+
+async function saveInlineMetadata(thread, changes, field) {
+  try {
+    const updates = {
+      Status: thread.status || "OPEN",
+      Priority: thread.priority || "P2",
+      Ball: thread.ballOwner || "",
+      Spec: thread.spec || "",
+      Topic: thread.topic || "",
+      ...changes,
+    };
+    await saveThreadMetadata(thread, updates);
+    flashStatus(field.charAt(0).toUpperCase() + field.slice(1) + " updated");
+    await refreshData("manual");
+  } catch (error) {
+    flashStatus("Failed to update " + field, "error");
+  }
+}
+
+async function copyThreadPath(thread) {
+  if (!thread?.filePath) return;
+  try {
+    await navigator.clipboard.writeText(thread.filePath);
+    flashStatus("Thread path copied to clipboard");
+  } catch (error) {
+    flashStatus("Unable to copy path", "error");
+  }
+}
+
+function buildThreadActions(thread, index, repo) {
+  const actions = document.createElement("div");
+  actions.className = "thread-actions";
+
+  const up = document.createElement("button");
+  up.type = "button";
+  up.textContent = "↑";
+  up.title = "Move thread up";
+  up.dataset.action = "thread-up";
+  up.disabled = index === 0;
+
+  const down = document.createElement("button");
+  down.type = "button";
+  down.textContent = "↓";
+  down.title = "Move thread down";
+  down.dataset.action = "thread-down";
+  down.disabled = index === (repo.threads?.length || 0) - 1;
+
+  const copy = document.createElement("button");
+  copy.type = "button";
+  copy.textContent = "Copy path";
+  copy.title = "Copy thread file path";
+  copy.dataset.action = "copy-path";
+  copy.disabled = !thread.filePath;
+
+  actions.append(up, down, copy);
+  return actions;
+}
+
+function buildEditor(thread) {
+  const wrapper = document.createElement("section");
+  wrapper.className = "editor";
+
+  const header = document.createElement("div");
+  header.className = "editor-header";
+  const title = document.createElement("strong");
+  title.textContent = "Thread settings";
+  const dirty = document.createElement("span");
+  dirty.className = "editor-message";
+  dirty.hidden = true;
+  dirty.textContent = "Unsaved changes";
+  header.append(title, dirty);
+
+  const controls = document.createElement("div");
+  controls.className = "editor-controls";
+
+  const baseMeta = {
+    Status: thread.status || "OPEN",
+    Priority: thread.priority || "P2",
+    Ball: thread.ballOwner || "",
+    Spec: thread.spec || "",
+    Topic: (thread.metadata && thread.metadata.Topic) || thread.topic || "",
+  };
+  let working = { ...baseMeta };
+
+  const statusSelect = document.createElement("select");
+  ["OPEN", "IN_REVIEW", "BLOCKED", "CLOSED"].forEach((option) => {
+    const opt = document.createElement("option");
+    opt.value = option;
+    opt.textContent = formatStatus(option);
+    if (option === working.Status) opt.selected = true;
+    statusSelect.append(opt);
+  });
+
+  const prioritySelect = document.createElement("select");
+  PRIORITY_LEVELS.forEach((level) => {
+    const opt = document.createElement("option");
+    opt.value = level;
+    opt.textContent = level;
+    if (level === working.Priority) opt.selected = true;
+    prioritySelect.append(opt);
+  });
+
+  const ballInput = document.createElement("input");
+  ballInput.type = "text";
+  ballInput.value = working.Ball;
+  ballInput.placeholder = "Codex / Claude";
+
+  const specInput = document.createElement("input");
+  specInput.type = "text";
+  specInput.value = working.Spec;
+  specInput.placeholder = "Spec (optional)";
+
+  const topicInput = document.createElement("input");
+  topicInput.type = "text";
+  topicInput.value = working.Topic;
+  topicInput.placeholder = "Topic label";
+
+  controls.append(
+    createField("Status", statusSelect),
+    createField("Priority", prioritySelect),
+    createField("Ball owner", ballInput),
+    createField("Spec", specInput),
+    createField("Topic", topicInput)
+  );
+
+  const actions = document.createElement("div");
+  actions.className = "editor-actions";
+  const saveBtn = document.createElement("button");
+  saveBtn.type = "button";
+  saveBtn.className = "primary";
+  saveBtn.textContent = "Save metadata";
+
+  const resetBtn = document.createElement("button");
+  resetBtn.type = "button";
+  resetBtn.className = "secondary";
+  resetBtn.textContent = "Reset";
+
+  const message = document.createElement("span");
+  message.className = "editor-message";
+  message.hidden = true;
+
+  actions.append(saveBtn, resetBtn, message);
+
+  wrapper.append(header, controls, actions);
+
+  function markDirty() {
+    dirty.hidden = false;
+    saveBtn.disabled = false;
+  }
+
+  statusSelect.addEventListener("change", () => {
+    working.Status = statusSelect.value;
+    markDirty();
+  }, { passive: true });
+  prioritySelect.addEventListener("change", () => {
+    working.Priority = prioritySelect.value;
+    markDirty();
+  }, { passive: true });
+  ballInput.addEventListener("input", () => {
+    working.Ball = ballInput.value;
+    markDirty();
+  }, { passive: true });
+  specInput.addEventListener("input", () => {
+    working.Spec = specInput.value;
+    markDirty();
+  }, { passive: true });
+  topicInput.addEventListener("input", () => {
+    working.Topic = topicInput.value;
+    markDirty();
+  }, { passive: true });
+
+  resetBtn.addEventListener("click", () => {
+    working = { ...baseMeta };
+    statusSelect.value = working.Status;
+    prioritySelect.value = working.Priority;
+    ballInput.value = working.Ball;
+    specInput.value = working.Spec;
+    topicInput.value = working.Topic;
+    dirty.hidden = true;
+    saveBtn.disabled = false;
+    showEditorMessage("Values reset to last saved state");
+  });
+
+  saveBtn.addEventListener("click", async () => {
+    saveBtn.disabled = true;
+    try {
+      const updates = {
+        Status: (working.Status || "OPEN").toUpperCase(),
+        Priority: (working.Priority || "P2").toUpperCase(),
+        Ball: working.Ball || "",
+        Spec: working.Spec || "",
+        Topic: working.Topic || "",
+      };
+      const response = await saveThreadMetadata(thread, updates);
+      showEditorMessage("Thread metadata saved");
+      flashStatus("Thread metadata updated");
+      dirty.hidden = true;
+      baseMeta.Status = response.status;
+      baseMeta.Priority = response.priority;
+      baseMeta.Ball = response.ballOwner || "";
+      baseMeta.Spec = response.spec || "";
+      baseMeta.Topic = (response.metadata && response.metadata.Topic) || response.topic || "";
+      working = { ...baseMeta };
+      await refreshData("manual");
+    } catch (error) {
+      showEditorMessage(error.message || "Save failed", true);
+      saveBtn.disabled = false;
+    }
+  });
+
+  function showEditorMessage(text, isError = false) {
+    message.hidden = false;
+    message.textContent = text;
+    message.style.color = isError ? "var(--danger)" : "var(--success)";
+    setTimeout(() => {
+      message.hidden = true;
+    }, 3200);
+  }
+
+  return wrapper;
+}
+
+function createField(labelText, control) {
+  const label = document.createElement("label");
+  label.textContent = labelText;
+  label.append(control);
+  return label;
+}
+
+function buildEntryList(thread) {
+  const container = document.createElement("section");
+  container.className = "entries";
+  const heading = document.createElement("h3");
+  heading.textContent = "Entries";
+  container.append(heading);
+
+  const entries = thread.entries || [];
+  if (!entries.length) {
+    const empty = document.createElement("p");
+    empty.className = "empty-state";
+    empty.textContent = "No entries recorded for this thread.";
+    container.append(empty);
+    return container;
+  }
+
+  const threadTopic = thread.topic || "";
+  // Built into a fragment and inserted with a single append
+  const list = document.createDocumentFragment();
+  entries.forEach((entry, index) => {
+    const detail = document.createElement("details");
+    detail.className = "entry";
+
+    // Create unique entry ID for persistence
+    const entryId = `${threadTopic}:${index}`;
+    detail.dataset.entryId = entryId;
+
+    // Restore open state from URL
+    if (state.openEntries.has(entryId)) {
+      detail.open = true;
+    }
+
+    const summary = document.createElement("summary");
+    summary.className = "entry-summary";
+
+    // Add chevron first
+    const chevron = document.createElement("span");
+    chevron.className = "entry-chevron";
+    chevron.textContent = "▶";
+    chevron.setAttribute("aria-label", "Toggle entry");
+
+    summary.append(chevron);
+
+    // Content wrapper
+    const content = document.createElement("div");
+    content.className = "entry-summary-content";
+
+    const headerLine = document.createElement("span");
+    headerLine.className = "entry-line";
+    headerLine.textContent = entry.entryLine || (entry.author ? entry.author : "Entry " + (index + 1));
+    content.append(headerLine);
+
+    const title = document.createElement("strong");
+    title.textContent = entry.title || "Entry " + (index + 1);
+    content.append(title);
+
+    const meta = document.createElement("div");
+    meta.className = "entry-meta";
+    if (entry.role) meta.append(createMeta("Role: " + entry.role));
+    if (entry.type) meta.append(createMeta("Type: " + entry.type));
+    if (entry.author) meta.append(createMeta("Author: " + entry.author));
+    if (entry.timestamp) meta.append(createMeta(entry.timestamp));
+
+    content.append(meta);
+    summary.append(content);
+    detail.append(summary);
+
+    const body = document.createElement("div");
+    body.className = "entry-body";
+    if (!entry.body) {
+      body.textContent = "(No entry body)";
+    } else if (detail.open) {
+      renderEntryBody(body, entry.body);
+    } else {
+      pendingEntryBodies.set(detail, entry.body);
+    }
+    detail.append(body);
+    list.append(detail);
+  });
+  container.append(list);
+
+  return container;
+}
+
+function createMeta(text) {
+  const span = document.createElement("span");
+  span.textContent = text;
+  return span;
+}
+
+async function reorderRepo(repoName, direction) {
+  const index = state.repos.findIndex((repo) => repo.name === repoName);
+  const target = index + direction;
+  if (index < 0 || target < 0 || target >= state.repos.length) return;
+  const reordered = [...state.repos];
+  const [item] = reordered.splice(index, 1);
+  reordered.splice(target, 0, item);
+  state.repos = reordered;
+  renderRepos();
+  const order = reordered.map((repo) => repo.name);
+  scheduleOrderSave("repos", () => persistRepoOrder(order));
+}
+
+// Rapid ↑/↓ clicks only persist the final order, once the clicks settle.
+function scheduleOrderSave(key, save) {
+  clearTimeout(pendingOrderSaves.get(key)?.timer);
+  const timer = setTimeout(() => {
+    pendingOrderSaves.delete(key);
+    save();
+  }, ORDER_SAVE_DELAY);
+  pendingOrderSaves.set(key, { timer, save });
+}
+
+function flushOrderSaves() {
+  pendingOrderSaves.forEach(({ timer, save }) => {
+    clearTimeout(timer);
+    save();
+  });
+  pendingOrderSaves.clear();
+}
+
+async function persistRepoOrder(order) {
+  const response = await fetch("/api/repo-order", {
+    method: "POST",
+    headers: withCsrf({ "Content-Type": "application/json" }),
+    body: JSON.stringify({ order }),
+    keepalive: true,
+  });
+  if (!response.ok) {
+    renderStatus("Failed to save repo order", "error");
+  } else {
+    flashStatus("Repository order saved");
+  }
+}
+
+async function reorderThread(repoName, index, direction) {
+  const repo = state.repos.find((item) => item.name === repoName);
+  if (!repo) return;
+  const threads = [...repo.threads];
+  const target = index + direction;
+  if (target < 0 || target >= threads.length) return;
+  const [item] = threads.splice(index, 1);
+  threads.splice(target, 0, item);
+  repo.threads = threads;
+  renderThreads();
+  const order = threads.map((thread) => thread.topic);
+  scheduleOrderSave("threads:" + repoName, () => persistThreadOrder(repoName, order));
+}
+
+async function persistThreadOrder(repoName, order) {
+  const response = await fetch("/api/thread-order", {
+    method: "POST",
+    headers: withCsrf({ "Content-Type": "application/json" }),
+    body: JSON.stringify({ repo: repoName, order }),
+    keepalive: true,
+  });
+  if (!response.ok) {
+    renderStatus("Failed to save thread order", "error");
+  } else {
+    flashStatus("Thread order saved");
+  }
+}
+
+// An identical save already in flight (a double click, or the same change from
+// two editors) is shared rather than sent again; a different change to the same
+// file waits for it, so the server never commits one file twice at once.
+function saveThreadMetadata(thread, updates) {
+  const filePath = thread.filePath;
+  const key = JSON.stringify(updates);
+  const inFlight = metadataSaves.get(filePath);
+  if (inFlight && inFlight.key === key) return inFlight.promise;
+
+  const send = () => postThreadMetadata(thread, updates);
+  const promise = (inFlight ? inFlight.promise.then(send, send) : send()).finally(() => {
+    if (metadataSaves.get(filePath)?.promise === promise) metadataSaves.delete(filePath);
+  });
+  metadataSaves.set(filePath, { key, promise });
+  return promise;
+}
+
+async function postThreadMetadata(thread, updates) {
+  const payload = {
+    filePath: thread.filePath,
+    repo: thread.repo,
+    originalTopic: thread.topic,
+    updates,
+  };
+  const response = await fetch("/api/thread-metadata", {
+    method: "POST",
+    headers: withCsrf({ "Content-Type": "application/json" }),
+    body: JSON.stringify(payload),
+  });
+  if (!response.ok) {
+    const data = await response.json().catch(() => ({}));
+    throw new Error(data.detail || "Failed to save metadata");
+  }
+  const data = await response.json();
+  return data.thread || thread;
+}
+
+// One pass: underscores become spaces and each word's first letter is capitalized.
+function formatStatus(status) {
+  return (status || "UNKNOWN")
+    .toLowerCase()
+    .replace(/([\s_]|^)([^\W_]?)/g, (_, sep, letter) => (sep === "_" ? " " : sep) + letter.toUpperCase());
+}
+
+function relativeTime(timestamp) {
+  const time = new Date(timestamp).getTime();
+  if (Number.isNaN(time)) {
+    return "unknown";
+  }
+  let duration = (Date.now() - time) / 1000;
+  for (const division of RELATIVE_TIME_DIVISIONS) {
+    if (Math.abs(duration) < division.amount) {
+      return RELATIVE_TIME_FORMAT.format(Math.round(duration), division.unit);
+    }
+    duration /= division.amount;
+  }
+  return "awhile ago";
+}
+
+function debounce(fn, delay) {
+  let timeout;
+  return function (...args) {
+    clearTimeout(timeout);
+    timeout = setTimeout(() => fn.apply(this, args), delay);
+  };
+}
+
+const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+
+function escapeHtml(value) {
+  return String(value || "").replace(/[&<>"']/g, (char) => HTML_ESCAPES[char]);
+}
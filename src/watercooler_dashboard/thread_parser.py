@@ -1,12 +1,148 @@
 """Parse Watercooler threads from the threads repository."""
 
+import json
+import logging
 import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any, Iterator
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (`speedups` extra); fall back to stdlib json.
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 ThreadData = dict[str, Any]
 
+# Upper bound on worker threads used to parse thread files concurrently
+MAX_PARSE_WORKERS = 8
+
+# Parsed thread files kept per parser, reused while their mtime and size match
+MAX_CACHED_THREADS = 4096
+
+# Format of files written by ThreadParser.save_cache; bump when parsed records change
+PARSE_CACHE_VERSION = 1
+
+# Header fields written right after existing ones when missing from the order
+PREFERRED_HEADER_FIELDS = ("Status", "Priority", "Ball", "Spec", "Topic", "Created")
+
+# A repository listing is only reused once the base directory's mtime is this
+# old, since a change in the same coarse timestamp tick would go unnoticed
+REPO_INDEX_SETTLE_NS = 1_000_000_000
+
+# Read size for a thread file whose size is not known from a stat, and for any
+# reads after the first
+READ_SIZE_HINT = 64 * 1024
+
+# Enum-like field values shared by many threads; interned so records reuse one string
+INTERNED_FIELDS = frozenset({"Status", "Priority", "Ball", "Role", "Type"})
+
+# Markdown files in a threads repository that are not threads
+NON_THREAD_FILES = frozenset({"README.md", "INDEX.md"})
+
+# Patterns used for every thread file, compiled once rather than per call
+_HEADER_FIELD_RE = re.compile(r"^([\w \-]+):\s*(.+)$")
+_ENTRY_FIELD_RE = re.compile(r"^([\w \-]+):\s*(.*)$")
+_ENTRY_SPLIT_RE = re.compile(r"\n---\s*\n(?=Entry:)")
+_ENTRY_LINE_RE = re.compile(r"^(.+?)(?:\s+\((.+?)\))?\s+(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)$")
+_AGENT_SUFFIX_RE = re.compile(r"\s*\(.*\)\s*$")
+# A header/body separator line, and further separator lines directly after it
+_HEADER_END_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+_LEADING_SEP_RE = re.compile(r"\n[^\S\n]*---[^\S\n]*(?=\n|\Z)")
+# Line boundaries other than "\n" that str.splitlines() honours
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# Shared across parsers and calls so each refresh reuses warm worker threads
+_PARSE_POOL = ThreadPoolExecutor(max_workers=MAX_PARSE_WORKERS, thread_name_prefix="thread-parse")
+
+
+def _read_file(path: str, size: int) -> bytes:
+    """Read a whole file, expecting it to be ``size`` bytes long.
+
+    The first read asks for the whole expected file. Reads can still come back
+    short (network mounts, signals) and the file may have grown since it was
+    statted, so reading continues until ``os.read`` reports end of file.
+    """
+
+    chunks: list[bytes] = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while chunk := os.read(fd, READ_SIZE_HINT if chunks else size + 1):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _normalize_agent(name: str | None) -> str:
+    """Return an agent name lowercased and without its ``(user)`` suffix."""
+    if not name:
+        return ""
+    return _AGENT_SUFFIX_RE.sub("", name.strip()).lower()
+
+
+@dataclass(slots=True)
+class ThreadView:
+    """Compact, attribute-access summary of a thread for dashboard rendering.
+
+    Holds only the fields the Slack blocks need, without entry bodies.
+    """
+
+    topic: str
+    status: str
+    ball_owner: str | None
+    entry_count: int
+    last_update: str | None
+    has_new: bool
+    has_ball: bool = False
+
+    @classmethod
+    def from_thread(cls, thread: ThreadData) -> "ThreadView":
+        """Build a view from a parsed thread record."""
+        return cls(
+            topic=thread.get("topic"),
+            status=thread["status"],
+            ball_owner=thread.get("ball_owner"),
+            entry_count=thread["entry_count"],
+            last_update=thread["last_update"],
+            has_new=bool(thread["has_new"]),
+            has_ball=bool(thread.get("has_ball")),
+        )
+
+
+def _iter_thread_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield the thread markdown files under ``root``, recursively.
+
+    Walks with ``os.scandir`` so entry types come from the directory listing and
+    names are filtered before any ``Path`` is built. Like ``Path.rglob``, it
+    does not descend into symlinked directories.
+    """
+
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        entry.name.endswith(".md")
+                        and entry.name not in NON_THREAD_FILES
+                        and not entry.is_dir()  # skip symlinks to directories
+                    ):
+                        yield entry
+        except OSError:
+            continue
+
 
 class ThreadParser:
     """Parses Watercooler thread files and extracts metadata."""
@@ -19,6 +155,11 @@ class ThreadParser:
                          If None, uses WATERCOOLER_THREADS_BASE env var or default.
         """
         self.threads_base = self._resolve_threads_base(threads_base)
+        # path -> (mtime_ns, size, parsed thread); shared by the parse pool workers
+        self._cache: OrderedDict[str, tuple[int, int, ThreadData | None]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (base mtime_ns, sorted repo paths, repo path by display name)
+        self._repo_index: tuple[int, list[Path], dict[str, Path]] | None = None
 
     # ------------------------------------------------------------------
     # Repository discovery helpers
@@ -27,35 +168,98 @@ class ThreadParser:
     def list_repositories(self) -> list[Path]:
         """Return all thread repositories discovered under the base path."""
 
-        if not self.threads_base.exists():
-            return []
+        return list(self._get_repo_index()[1])
+
+    def _get_repo_index(self) -> tuple[int, list[Path], dict[str, Path]]:
+        """Return the repositories under the base, rescanning only when it changes.
+
+        Adding, removing or renaming a repository directory updates the base
+        directory's mtime, so a single stat tells whether the listing is current.
+        """
+
+        try:
+            mtime_ns = os.stat(self.threads_base).st_mtime_ns
+        except OSError:
+            self._repo_index = None
+            return 0, [], {}
+
+        index = self._repo_index
+        if index is not None and index[0] == mtime_ns:
+            return index
+
+        # scandir reports each entry's type from the directory listing, so only
+        # symlinked entries cost a stat. The name check runs first to skip even that.
+        try:
+            with os.scandir(self.threads_base) as entries:
+                repos = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith("-threads") and entry.is_dir()
+                ]
+        except OSError:
+            return 0, [], {}
+
+        repos.sort(key=lambda path: path.name.lower())
+        index = (mtime_ns, repos, {self._repo_display_name(path): path for path in repos})
+        settled = time.time_ns() - mtime_ns >= REPO_INDEX_SETTLE_NS
+        self._repo_index = index if settled else None
+        return index
+
+    def get_threads_by_repo(
+        self, snapshot: tuple[tuple[str, tuple[tuple[str, int, int], ...]], ...] | None = None
+    ) -> dict[str, list[ThreadData]]:
+        """Return thread metadata grouped by repository display name.
 
-        repos = [
-            item
-            for item in self.threads_base.iterdir()
-            if item.is_dir() and item.name.endswith("-threads")
-        ]
+        Args:
+            snapshot: A ``fingerprint()`` result to parse from. Its stat stamps key
+                the parse cache directly, so the files are not walked or statted again.
+        """
 
-        return sorted(repos, key=lambda path: path.name.lower())
+        if snapshot is None:
+            snapshot = self.fingerprint()
 
-    def get_threads_by_repo(self) -> dict[str, list[ThreadData]]:
-        """Return thread metadata grouped by repository display name."""
+        stamps = [stamp for _, repo_stamps in snapshot for stamp in repo_stamps]
+        if len(stamps) <= 1:
+            parsed = iter(map(self._load_stamped, stamps))
+        else:
+            # Parsing is dominated by file reads, which release the GIL. Files from
+            # every repo go through one pool, so a single large repo is spread across
+            # workers too; map() keeps the snapshot order for regrouping below.
+            parsed = _PARSE_POOL.map(self._load_stamped, stamps)
+
+        return {
+            repo_name: self._finish_repo(repo_name, islice(parsed, len(repo_stamps)))
+            for repo_name, repo_stamps in snapshot
+        }
+
+    def fingerprint(self) -> tuple[tuple[str, tuple[tuple[str, int, int], ...]], ...]:
+        """Return a cheap, hashable snapshot of every thread file on disk.
+
+        Each repository contributes its name plus the ``(path, mtime_ns, size)``
+        of its thread files, so any add, remove or edit changes the result
+        without reading or parsing file contents.
+        """
 
-        grouped: dict[str, list[ThreadData]] = {}
+        snapshot = []
         for repo_path in self.list_repositories():
-            repo_name = self._repo_display_name(repo_path)
-            grouped[repo_name] = self._collect_threads(repo_path, repo_name=repo_name)
+            stamps = []
+            for entry in _iter_thread_files(repo_path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stamps.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            snapshot.append((self._repo_display_name(repo_path), tuple(sorted(stamps))))
 
-        return grouped
+        return tuple(snapshot)
 
     def get_threads_for_repo(self, repo_name: str) -> list[ThreadData]:
         """Return threads for a single repository by its display name."""
 
-        for repo_path in self.list_repositories():
-            if self._repo_display_name(repo_path) == repo_name:
-                return self._collect_threads(repo_path, repo_name=repo_name)
-
-        return []
+        repo_path = self._get_repo_index()[2].get(repo_name)
+        if repo_path is None:
+            return []
+        return self._collect_threads(repo_path, repo_name=repo_name)
 
     def _resolve_threads_base(self, threads_base: str | None) -> Path:
         """Resolve the threads base directory."""
@@ -68,48 +272,188 @@ class ThreadParser:
 
         return Path.home() / ".watercooler-threads"
 
-
     def get_all_threads(self) -> list[dict[str, Any]]:
         """Get all threads from the threads repository.
 
         Returns:
             List of thread metadata dictionaries.
         """
-        threads: list[ThreadData] = []
+        return list(self.iter_all_threads())
+
+    def iter_all_threads(self) -> Iterator[ThreadData]:
+        """Yield all threads, one repository at a time, in ``get_all_threads`` order.
 
+        Only one repository's sorted thread list is held at a time, so callers
+        that reduce threads as they go never build the combined list.
+        """
         for repo_path in self.list_repositories():
-            repo_threads = self._collect_threads(repo_path, repo_name=self._repo_display_name(repo_path))
-            threads.extend(repo_threads)
+            repo_name = self._repo_display_name(repo_path)
+            yield from self._collect_threads(repo_path, repo_name=repo_name)
 
-        return threads
+    def get_thread_views(self) -> list[ThreadView]:
+        """Get compact views of all threads, dropping entries and raw metadata."""
+        return [ThreadView.from_thread(thread) for thread in self.iter_all_threads()]
 
     def _collect_threads(self, repo_path: Path, repo_name: str) -> list[ThreadData]:
         """Collect thread metadata for a single repository."""
 
-        threads: list[ThreadData] = []
-        for thread_file in repo_path.rglob("*.md"):
-            if thread_file.name in {"README.md", "INDEX.md"}:
-                continue
+        files = list(_iter_thread_files(repo_path))
+        if len(files) <= 1:
+            parsed = map(self._load_thread, files)
+        else:
+            parsed = _PARSE_POOL.map(self._load_thread, files)
+        return self._finish_repo(repo_name, parsed)
+
+    def _load_thread(self, entry: os.DirEntry) -> ThreadData | None:
+        """Return the parsed thread for ``entry``, reusing the cache while it is unchanged.
+
+        Cached records are shared between calls, so callers must not mutate them.
+        """
+
+        try:
+            stat = entry.stat()
+        except OSError:
+            return None
+        return self._load_stamped((entry.path, stat.st_mtime_ns, stat.st_size))
+
+    def _load_stamped(self, stamp: tuple[str, int, int]) -> ThreadData | None:
+        """Return the parsed thread for a ``(path, mtime_ns, size)`` stamp, using the cache."""
+
+        path, mtime_ns, size = stamp
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[:2] == (mtime_ns, size):
+                self._cache.move_to_end(path)
+                return cached[2]
+
+        thread_data = self._parse_thread_file(Path(path), size)
+        self._remember(path, mtime_ns, size, thread_data)
+        return thread_data
+
+    def _remember(
+        self, path: str, mtime_ns: int, size: int, thread_data: ThreadData | None
+    ) -> None:
+        """Cache a parsed thread under the stat stamp it was parsed from."""
+
+        with self._cache_lock:
+            self._cache[path] = (mtime_ns, size, thread_data)
+            self._cache.move_to_end(path)
+            if len(self._cache) > MAX_CACHED_THREADS:
+                self._cache.popitem(last=False)
+
+    def save_cache(self, path: Path) -> int:
+        """Write the parsed-thread cache to ``path`` so a later run can start warm.
+
+        Args:
+            path: Destination file, replaced atomically.
+
+        Returns:
+            Number of parsed threads written.
+        """
+
+        with self._cache_lock:
+            threads = [
+                [file_path, mtime_ns, size, thread_data]
+                for file_path, (mtime_ns, size, thread_data) in self._cache.items()
+                if thread_data is not None
+            ]
+        data = {
+            "version": PARSE_CACHE_VERSION,
+            "threads_base": str(self.threads_base),
+            "threads": threads,
+        }
+        raw = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+        return len(threads)
+
+    def load_cache(self, path: Path) -> int:
+        """Seed the parsed-thread cache from a file written by ``save_cache``.
+
+        Records keep the stat stamp they were parsed under, so a file changed since
+        the cache was written misses on lookup and is parsed again. Missing,
+        malformed, outdated or foreign cache files are ignored.
+
+        Args:
+            path: Cache file to read.
+
+        Returns:
+            Number of parsed threads loaded.
+        """
 
-            thread_data = self._parse_thread_file(thread_file)
+        try:
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if data.get("version") != PARSE_CACHE_VERSION or data.get("threads_base") != str(
+                self.threads_base
+            ):
+                return 0
+            entries = [
+                (file_path, (int(mtime_ns), int(size), dict(thread_data)))
+                for file_path, mtime_ns, size, thread_data in data["threads"]
+            ]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring parse cache {path}: {e}")
+            return 0
+
+        loaded = 0
+        with self._cache_lock:
+            for file_path, cached in entries[-MAX_CACHED_THREADS:]:
+                # Anything parsed in this process is at least as fresh
+                if file_path not in self._cache:
+                    self._cache[file_path] = cached
+                    loaded += 1
+            while len(self._cache) > MAX_CACHED_THREADS:
+                self._cache.popitem(last=False)
+        return loaded
+
+    def _finish_repo(self, repo_name: str, parsed: Iterator[ThreadData | None]) -> list[ThreadData]:
+        """Tag parsed threads with their repository and sort them by topic."""
+
+        threads: list[ThreadData] = []
+        for thread_data in parsed:
             if thread_data:
                 thread_data["repo"] = repo_name
                 threads.append(thread_data)
 
         return sorted(threads, key=lambda thread: thread["topic"].lower())
 
-    def _parse_thread_file(self, file_path: Path) -> dict[str, Any] | None:
+    def _parse_thread_file(
+        self, file_path: Path, size: int = READ_SIZE_HINT
+    ) -> dict[str, Any] | None:
         """Parse a single thread file.
 
         Args:
             file_path: Path to the thread markdown file.
+            size: Expected file size in bytes, usually from the walk's stat.
 
         Returns:
             Thread metadata dictionary or None if parsing fails.
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
+            # One read plus one decode; _split_header_and_body normalizes CRLF, so
+            # the text layer's newline translation is not needed.
+            content = _read_file(str(file_path), size).decode("utf-8")
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            return None
+
+        return self._parse_thread_content(file_path, content)
+
+    def _parse_thread_content(self, file_path: Path, content: str) -> dict[str, Any] | None:
+        """Parse the text of a thread file.
 
+        Args:
+            file_path: Path the content was read from (or written to).
+            content: Full text of the thread file.
+
+        Returns:
+            Thread metadata dictionary or None if parsing fails.
+        """
+        try:
             header_lines, body_text = self._split_header_and_body(content)
             title, metadata, order = self._parse_header_lines(
                 header_lines, default_title=file_path.stem
@@ -124,39 +468,31 @@ class ThreadParser:
             spec = metadata.get("Spec")
             topic = metadata.get("Topic", file_path.stem)
 
-            def _normalize(name: str | None) -> str:
-                if not name:
-                    return ""
-                return re.sub(r"\s*\(.*\)\s*$", "", name.strip()).lower()
+            normalized_ball = _normalize_agent(ball_owner_raw)
+            # One backward walk finds both the latest author and the latest title
+            last_author = ""
+            last_title = None
+            for entry in reversed(entries):
+                if not last_author and entry.get("author"):
+                    last_author = entry["author"]
+                if last_title is None and entry.get("title"):
+                    last_title = entry["title"]
+                if last_author and last_title is not None:
+                    break
 
-            normalized_ball = _normalize(ball_owner_raw)
-            last_author = next(
-                (entry.get("author") for entry in reversed(entries) if entry.get("author")),
-                "",
-            )
-            normalized_author = _normalize(last_author)
+            normalized_author = _normalize_agent(last_author)
             has_new_flag = (
                 bool(entries)
                 and bool(normalized_author)
                 and normalized_author != normalized_ball
                 and status.upper() != "CLOSED"
             )
-            for entry in entries:
-                entry["is_new"] = False
-            if has_new_flag and entries:
+            if has_new_flag:
                 entries[-1]["is_new"] = True
 
-            timestamps = [
-                entry["timestamp"] for entry in entries if entry.get("timestamp")
-            ]
+            timestamps = [entry["timestamp"] for entry in entries if entry.get("timestamp")]
             last_update = timestamps[-1] if timestamps else created
 
-            last_title = None
-            for entry in reversed(entries):
-                if entry.get("title"):
-                    last_title = entry["title"]
-                    break
-
             return {
                 "topic": topic,
                 "title": title,
@@ -167,8 +503,9 @@ class ThreadParser:
                 "created": created,
                 "last_update": last_update,
                 "entry_count": len(entries),
-                "has_new": bool(entries) and entries[-1].get("is_new", False),
+                "has_new": has_new_flag,
                 "file_path": str(file_path),
+                "is_archived": "_archive" in file_path.parts,
                 "last_title": last_title,
                 "metadata": metadata,
                 "header_order": order,
@@ -192,7 +529,8 @@ class ThreadParser:
         self,
         file_path: Path,
         updates: dict[str, Any],
-        git_helper: Any = None
+        git_helper: Any = None,
+        push: bool = True,
     ) -> ThreadData | None:
         """Update thread header metadata and return the refreshed thread record.
 
@@ -200,6 +538,8 @@ class ThreadParser:
             file_path: Path to the thread file.
             updates: Dictionary of metadata fields to update.
             git_helper: Optional GitHelper instance for committing/pushing changes.
+            push: Push after committing. Pass False to commit only and push
+                  separately (e.g. via ``GitHelper.schedule_push``).
 
         Returns:
             Updated thread data, or None if parsing fails.
@@ -211,7 +551,9 @@ class ThreadParser:
 
         content = resolved_path.read_text(encoding="utf-8")
         header_lines, body_text = self._split_header_and_body(content)
-        title, metadata, order = self._parse_header_lines(header_lines, default_title=resolved_path.stem)
+        title, metadata, order = self._parse_header_lines(
+            header_lines, default_title=resolved_path.stem
+        )
 
         for key, value in updates.items():
             normalized_key = str(key).strip()
@@ -236,6 +578,16 @@ class ThreadParser:
             new_content += "\n"
 
         resolved_path.write_text(new_content, encoding="utf-8")
+        # Parse what was just written rather than reading it back, and cache it
+        # under the new stamp so the next walk does not parse it again
+        parsed = self._parse_thread_content(resolved_path, new_content)
+        try:
+            stat = resolved_path.stat()
+        except OSError:
+            with self._cache_lock:
+                self._cache.pop(str(resolved_path), None)
+        else:
+            self._remember(str(resolved_path), stat.st_mtime_ns, stat.st_size, parsed)
 
         # Commit and push changes if git helper is available
         git_status = {"committed": False, "pushed": False, "error": None}
@@ -243,18 +595,19 @@ class ThreadParser:
             if git_helper.is_available():
                 fields = ", ".join(updates.keys())
                 message = f"Update thread metadata via dashboard: {fields}"
-                success, error = git_helper.commit_and_push(
+                commit = git_helper.commit_and_push if push else git_helper.commit
+                success, error = commit(
                     resolved_path,
                     message,
                     author_name="Watercooler Dashboard",
-                    author_email="dashboard@watercooler.dev"
+                    author_email="dashboard@watercooler.dev",
                 )
                 if success:
                     git_status["committed"] = True
-                    if not error:  # error can contain "push failed" message
-                        git_status["pushed"] = True
-                    else:
+                    if error:  # error can contain "push failed" message
                         git_status["error"] = error
+                    elif push:
+                        git_status["pushed"] = True
                 else:
                     git_status["error"] = error
                     print(f"Git operation failed: {error}")
@@ -265,41 +618,39 @@ class ThreadParser:
             git_status["error"] = "No git helper provided"
             print(f"No git helper provided for update to {resolved_path}")
 
-        parsed = self._parse_thread_file(resolved_path)
-        if parsed:
-            parsed["git_status"] = git_status
-        return parsed
+        if parsed is None:
+            return None
+        # A copy, since the parsed record is now shared through the cache
+        return {**parsed, "git_status": git_status}
 
     # ------------------------------------------------------------------
     # Internal parsing helpers
     # ------------------------------------------------------------------
 
     def _split_header_and_body(self, content: str) -> tuple[list[str], str]:
-        """Split raw thread content into header lines and body text."""
+        """Split raw thread content into header lines and body text.
 
-        lines = content.splitlines()
-        header_lines: list[str] = []
-        body_lines: list[str] = []
+        The body is sliced out of ``content`` rather than split into lines and
+        re-joined, so large threads are not copied line by line.
+        """
 
-        in_header = True
-        for line in lines:
-            if in_header and line.strip() == "---":
-                in_header = False
-                continue
+        if _OTHER_LINE_BREAKS_RE.search(content):
+            # Rare: normalize so "\n" is the only line boundary, as splitlines() would
+            content = "\n".join(content.splitlines())
 
-            if in_header:
-                header_lines.append(line)
-            else:
-                body_lines.append(line)
+        separator = _HEADER_END_RE.search(content)
+        if separator is None:
+            header_lines, body = content.split("\n"), ""
+        else:
+            header_lines = content[: separator.start()].split("\n")
+            body = content[separator.end() :]
+            while (extra := _LEADING_SEP_RE.match(body)) is not None:
+                body = body[extra.end() :]
 
         while header_lines and not header_lines[-1].strip():
             header_lines.pop()
 
-        while body_lines and body_lines[0].strip() == "---":
-            body_lines.pop(0)
-
-        body_text = "\n".join(body_lines).strip()
-        return header_lines, body_text
+        return header_lines, body.strip()
 
     def _parse_header_lines(
         self, header_lines: list[str], default_title: str
@@ -320,16 +671,17 @@ class ThreadParser:
         metadata: dict[str, str] = {}
         order: list[str] = []
 
-        pattern = re.compile(r"^([\w \-]+):\s*(.+)$")
         for line in meta_lines:
             stripped = line.strip()
             if not stripped:
                 continue
-            match = pattern.match(stripped)
+            match = _HEADER_FIELD_RE.match(stripped)
             if not match:
                 continue
-            key = match.group(1).strip()
+            key = sys.intern(match.group(1).strip())
             value = match.group(2).strip()
+            if key in INTERNED_FIELDS:
+                value = sys.intern(value)
             metadata[key] = value
             order.append(key)
 
@@ -341,45 +693,48 @@ class ThreadParser:
         if not body_text:
             return
 
-        segments = re.split(r"\n---\s*\n(?=Entry:)", body_text.strip())
+        # body_text comes from _split_header_and_body, so "\n" is its only line break
+        segments = _ENTRY_SPLIT_RE.split(body_text.strip())
         for raw_segment in segments:
             segment = raw_segment.strip()
             if not segment:
                 continue
 
-            lines = segment.splitlines()
+            # Read "Key: value" lines up to the first blank or non-field line; the
+            # rest of the segment is the entry body.
             meta: dict[str, str] = {}
             cursor = 0
-            pattern = re.compile(r"^([\w \-]+):\s*(.*)$")
-
-            while cursor < len(lines):
-                line = lines[cursor]
+            length = len(segment)
+            while cursor < length:
+                line_end = segment.find("\n", cursor)
+                if line_end == -1:
+                    line_end = length
+                line = segment[cursor:line_end]
                 if not line.strip():
-                    cursor += 1
+                    cursor = line_end + 1
                     break
 
-                match = pattern.match(line)
+                match = _ENTRY_FIELD_RE.match(line)
                 if not match:
                     break
 
-                key = match.group(1).strip()
+                key = sys.intern(match.group(1).strip())
                 value = match.group(2).strip()
+                if key in INTERNED_FIELDS:
+                    value = sys.intern(value)
                 meta[key] = value
-                cursor += 1
+                cursor = line_end + 1
 
-            body = "\n".join(lines[cursor:]).strip()
+            body = segment[cursor:].strip()
 
             author = None
             actor = None
             timestamp = None
             entry_line = meta.get("Entry")
             if entry_line:
-                match = re.match(
-                    r"^(.+?)(?:\s+\((.+?)\))?\s+(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)$",
-                    entry_line,
-                )
+                match = _ENTRY_LINE_RE.match(entry_line)
                 if match:
-                    author = match.group(1).strip()
+                    author = sys.intern(match.group(1).strip())
                     actor = match.group(2).strip() if match.group(2) else None
                     timestamp = match.group(3).strip()
                 else:
@@ -395,30 +750,16 @@ class ThreadParser:
                 "role": meta.get("Role"),
                 "type": meta.get("Type"),
                 "spec": meta.get("Spec"),
-                "is_new": "NEW" in (meta.get("Type", "") or ""),
+                "is_new": False,
             }
 
     def _render_header(self, title: str, metadata: dict[str, str], order: list[str]) -> str:
         """Render the header portion of a thread file from metadata."""
 
-        normalized_order: list[str] = []
-        seen: set[str] = set()
-
-        for key in order:
-            if key not in seen:
-                normalized_order.append(key)
-                seen.add(key)
-
-        preferred = ["Status", "Priority", "Ball", "Spec", "Topic", "Created"]
-        for key in preferred:
-            if key in metadata and key not in seen:
-                normalized_order.append(key)
-                seen.add(key)
-
-        for key in metadata:
-            if key not in seen:
-                normalized_order.append(key)
-                seen.add(key)
+        # Original order first, then preferred fields, then anything else; dict keys
+        # keep the first position of each key.
+        preferred = (key for key in PREFERRED_HEADER_FIELDS if key in metadata)
+        normalized_order = dict.fromkeys([*order, *preferred, *metadata])
 
         lines = [f"# {title}"]
         for key in normalized_order:
@@ -0,0 +1,160 @@
+"""Tests for the auto-refresh poller and coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from git import Repo
+
+from watercooler_dashboard.auto_refresh import MultiRepoPoller, RefreshCoordinator, ThreadsPoller
+
+
+def _init_repo(path: Path) -> Repo:
+    repo = Repo.init(path)
+    (path / "thread.md").write_text("# thread\n", encoding="utf-8")
+    repo.index.add(["thread.md"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+def test_read_head_sha_matches_gitpython(tmp_path):
+    repo = _init_repo(tmp_path / "alpha-threads")
+    poller = ThreadsPoller(repo_path=Path(repo.working_dir))
+
+    assert poller._read_head_sha() == repo.head.commit.hexsha
+
+
+def test_read_head_sha_falls_back_to_packed_refs(tmp_path):
+    repo = _init_repo(tmp_path / "alpha-threads")
+    repo.git.pack_refs("--all")
+    assert not (Path(repo.git_dir) / repo.head.ref.path).exists()
+
+    poller = ThreadsPoller(repo_path=Path(repo.working_dir))
+
+    assert poller._read_head_sha() == repo.head.commit.hexsha
+
+
+def test_read_head_sha_handles_detached_head(tmp_path):
+    repo = _init_repo(tmp_path / "alpha-threads")
+    sha = repo.head.commit.hexsha
+    repo.git.checkout("--detach")
+
+    poller = ThreadsPoller(repo_path=Path(repo.working_dir))
+
+    assert poller._read_head_sha() == sha
+
+
+def test_fetch_and_check_skips_fetch_until_remote_moves(tmp_path):
+    upstream = _init_repo(tmp_path / "upstream")
+    clone = Repo.clone_from(upstream.working_dir, tmp_path / "alpha-threads")
+    poller = ThreadsPoller(repo_path=Path(clone.working_dir))
+    poller._update_last_commit()
+
+    assert asyncio.run(poller._fetch_and_check()) is False
+    assert poller.get_stats()["fetch_count"] == 0
+
+    (Path(upstream.working_dir) / "thread.md").write_text("# updated\n", encoding="utf-8")
+    upstream.index.add(["thread.md"])
+    new_sha = upstream.index.commit("Update thread").hexsha
+
+    assert asyncio.run(poller._fetch_and_check()) is True
+    assert poller.get_stats()["fetch_count"] == 1
+    assert poller._last_commit == new_sha
+    assert clone.head.commit.hexsha == new_sha
+
+
+def test_multi_repo_poller_refreshes_only_changed_repos(tmp_path):
+    upstream = _init_repo(tmp_path / "upstream")
+    changed = Repo.clone_from(upstream.working_dir, tmp_path / "alpha-threads")
+    quiet = _init_repo(tmp_path / "beta-threads")
+
+    class _Recorder:
+        def __init__(self):
+            self.repos: list[str] = []
+
+        async def trigger_refresh(self, repo_path: str, reason: str = "update"):
+            self.repos.append(repo_path)
+
+    recorder = _Recorder()
+    poller = MultiRepoPoller(
+        repo_paths=[Path(changed.working_dir), Path(quiet.working_dir)],
+        coordinator=recorder,
+    )
+    for repo_poller in poller.pollers:
+        repo_poller._update_last_commit()
+
+    (Path(upstream.working_dir) / "thread.md").write_text("# updated\n", encoding="utf-8")
+    upstream.index.add(["thread.md"])
+    upstream.index.commit("Update thread")
+
+    asyncio.run(poller.poll_once())
+
+    assert recorder.repos == [str(Path(changed.working_dir))]
+
+
+def test_coordinator_coalesces_refresh_bursts():
+    async def scenario() -> list[dict]:
+        coordinator = RefreshCoordinator()
+        stream = coordinator.subscribe()
+        heartbeat = await stream.__anext__()
+        assert heartbeat["type"] == "heartbeat"
+
+        await coordinator.trigger_refresh("/threads/alpha-threads")
+        await coordinator.trigger_refresh("/threads/beta-threads")
+        await coordinator.trigger_refresh("/threads/alpha-threads")
+
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+        try:
+            extra = await asyncio.wait_for(stream.__anext__(), timeout=0.2)
+        except asyncio.TimeoutError:
+            extra = None
+        await stream.aclose()
+        return [first, extra]
+
+    event, extra = asyncio.run(scenario())
+
+    assert extra is None
+    assert event["type"] == "threads:updated"
+    assert event["count"] == 3
+    assert event["repos"] == ["/threads/alpha-threads", "/threads/beta-threads"]
+
+
+def test_coordinator_debounce_restarts_on_each_trigger_and_caps_batches():
+    async def scenario() -> tuple[list[int], list[int]]:
+        coordinator = RefreshCoordinator()
+        coordinator.batch_window = 0.1
+        coordinator.max_batch_size = 3
+        queue: asyncio.Queue = asyncio.Queue()
+        coordinator._subscribers.append(queue)
+
+        # Triggers closer together than the window keep postponing the flush
+        for _ in range(2):
+            await coordinator.trigger_refresh("/threads/alpha-threads")
+            await asyncio.sleep(0.06)
+        assert queue.empty()
+        await asyncio.sleep(0.1)
+        debounced = [queue.get_nowait()["count"] for _ in range(queue.qsize())]
+
+        # Reaching the size cap flushes without waiting for quiet
+        for _ in range(3):
+            await coordinator.trigger_refresh("/threads/beta-threads")
+        capped = [queue.get_nowait()["count"] for _ in range(queue.qsize())]
+        return debounced, capped
+
+    debounced, capped = asyncio.run(scenario())
+
+    assert debounced == [2]
+    assert capped == [5]
+
+
+def test_coordinator_drops_oldest_event_for_slow_subscribers():
+    coordinator = RefreshCoordinator()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    coordinator._subscribers.append(queue)
+
+    for count in range(1, 5):
+        coordinator._broadcast({"type": "threads:updated", "count": count})
+
+    assert [queue.get_nowait()["count"] for _ in range(queue.qsize())] == [3, 4]
+    assert coordinator.get_stats()["subscribers"] == 1
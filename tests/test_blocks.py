@@ -1,7 +1,13 @@
 """Tests for Slack Block Kit builders."""
 
 import pytest
-from watercooler_dashboard.blocks import build_dashboard_blocks, _get_status_emoji
+from watercooler_dashboard.blocks import (
+    build_dashboard_blocks,
+    _escape_mrkdwn,
+    _format_timestamp,
+    _get_status_emoji,
+)
+from watercooler_dashboard.thread_parser import ThreadView
 
 
 def test_build_dashboard_blocks_empty():
@@ -29,6 +35,45 @@ def test_build_dashboard_blocks_with_threads():
     assert blocks[0]["type"] == "header"
 
 
+def test_build_dashboard_blocks_with_thread_views():
+    """Thread views render the same text as the dictionary form."""
+    view = ThreadView(
+        topic="a<b",
+        status="BLOCKED",
+        ball_owner="Alice",
+        entry_count=2,
+        last_update="2025-10-29T01:00:00Z",
+        has_new=False,
+        has_ball=True,
+    )
+    blocks = build_dashboard_blocks([view])
+    assert blocks[4]["text"]["text"] == "*a&lt;b* :tennis:"
+    assert blocks[5]["elements"][0]["text"] == (
+        "Ball: *Alice* | Entries: 2 | Last: 2025-10-29 01:00"
+    )
+
+
+def test_build_dashboard_blocks_keeps_all_unknown_statuses():
+    """Threads with unrecognised statuses should all land in the OTHER group."""
+    threads = [
+        {
+            "topic": f"thread-{index}",
+            "status": status,
+            "ball_owner": "Alice",
+            "last_update": None,
+            "entry_count": 1,
+            "has_new": False,
+        }
+        for index, status in enumerate(["DRAFT", "OPEN", "PAUSED"])
+    ]
+    blocks = build_dashboard_blocks(threads)
+    texts = [block["text"]["text"] for block in blocks if block["type"] == "section"]
+    assert "| 1 active |" in texts[0]
+    other_index = texts.index("*:question: OTHER*")
+    assert "thread-0" in texts[other_index + 1]
+    assert "thread-2" in texts[other_index + 2]
+
+
 def test_get_status_emoji():
     """Test status emoji mapping."""
     assert _get_status_emoji("OPEN") == ":large_green_circle:"
@@ -36,3 +81,16 @@ def test_get_status_emoji():
     assert _get_status_emoji("BLOCKED") == ":red_circle:"
     assert _get_status_emoji("CLOSED") == ":white_check_mark:"
     assert _get_status_emoji("UNKNOWN") == ":question:"
+
+
+def test_escape_mrkdwn():
+    """Control characters are escaped and empty values become empty strings."""
+    assert _escape_mrkdwn("a & <b>") == "a &amp; &lt;b&gt;"
+    assert _escape_mrkdwn(None) == ""
+
+
+def test_format_timestamp():
+    """ISO timestamps are shortened; missing or invalid values fall back."""
+    assert _format_timestamp("2025-10-29T01:00:00Z") == "2025-10-29 01:00"
+    assert _format_timestamp(None) == "Unknown"
+    assert _format_timestamp("not-a-date") == "not-a-date"
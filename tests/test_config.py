@@ -1,9 +1,13 @@
 """Tests for configuration helpers."""
 
+import os
 from pathlib import Path
 
+import pytest
+
 from watercooler_dashboard.config import (
     DashboardConfig,
+    _detect_threads_base,
     default_threads_base,
     load_config,
     save_config,
@@ -28,6 +32,28 @@ def test_config_round_trip(tmp_path, monkeypatch):
     assert loaded.thread_order["repo-a"] == ["thread-1", "thread-2"]
 
 
+def test_save_config_skips_unchanged_writes(tmp_path, monkeypatch):
+    """Saving identical config should leave the file untouched."""
+
+    config_path = tmp_path / "config.json"
+    monkeypatch.setenv("WATERCOOLER_DASHBOARD_CONFIG", str(config_path))
+
+    config = DashboardConfig(threads_base=str(tmp_path))
+    save_config(config)
+    first_mtime = config_path.stat().st_mtime_ns
+    os.utime(config_path, ns=(first_mtime - 10_000_000, first_mtime - 10_000_000))
+    stale_mtime = config_path.stat().st_mtime_ns
+
+    save_config(config)
+    assert config_path.stat().st_mtime_ns == stale_mtime
+
+    config.repo_order = ["repo-a"]
+    save_config(config)
+    assert config_path.stat().st_mtime_ns != stale_mtime
+    assert load_config().repo_order == ["repo-a"]
+    assert not (tmp_path / "config.json.tmp").exists()
+
+
 def test_config_handles_missing_file(monkeypatch, tmp_path):
     """Loading without a file should return defaults."""
 
@@ -37,3 +63,104 @@ def test_config_handles_missing_file(monkeypatch, tmp_path):
     config = load_config()
     assert config.repo_order == []
     assert Path(config.threads_base) == Path(default_threads_base())
+
+
+def test_default_threads_base_detects_threads_repos(monkeypatch, tmp_path):
+    """Detection picks the working directory when it holds `*-threads` repos."""
+
+    monkeypatch.delenv("WATERCOOLER_THREADS_BASE", raising=False)
+    (tmp_path / "alpha-threads").mkdir()
+    monkeypatch.chdir(tmp_path)
+    _detect_threads_base.cache_clear()
+
+    assert default_threads_base() == str(tmp_path.resolve())
+    assert _detect_threads_base.cache_info().misses == 1
+
+    default_threads_base()
+    assert _detect_threads_base.cache_info().hits == 1
+
+
+def test_config_handles_malformed_file(monkeypatch, tmp_path):
+    """A corrupt config file falls back to defaults without being overwritten."""
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{not json", encoding="utf-8")
+    monkeypatch.setenv("WATERCOOLER_DASHBOARD_CONFIG", str(config_path))
+
+    config = load_config()
+    assert config.repo_order == []
+    assert config_path.read_text(encoding="utf-8") == "{not json"
+
+
+def test_load_config_caches_until_file_changes(monkeypatch, tmp_path):
+    """Repeated loads reuse the parsed file but return independent objects."""
+
+    config_path = tmp_path / "config.json"
+    monkeypatch.setenv("WATERCOOLER_DASHBOARD_CONFIG", str(config_path))
+    save_config(DashboardConfig(threads_base=str(tmp_path), repo_order=["a", "b"]))
+
+    reads = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    first = load_config()
+    first.repo_order.append("mutated")
+    second = load_config()
+    assert second.repo_order == ["a", "b"]
+    assert len(reads) == 1
+
+    save_config(DashboardConfig(threads_base=str(tmp_path), repo_order=["b", "a"]))
+    assert load_config().repo_order == ["b", "a"]
+
+
+def test_order_reconciliation_keeps_saved_order_and_appends_new(tmp_path):
+    """Stored orderings drop vanished entries and append new ones in discovery order."""
+
+    config = DashboardConfig(
+        threads_base=str(tmp_path),
+        repo_order=["beta", "gone", "alpha"],
+        thread_order={"alpha": ["t2", "missing", "t1"]},
+    )
+
+    config.ensure_repo_order(["alpha", "beta", "gamma"])
+    config.apply_thread_order("alpha", ["t1", "t2", "t3"])
+
+    assert config.repo_order == ["beta", "alpha", "gamma"]
+    assert config.thread_order["alpha"] == ["t2", "t1", "t3"]
+
+
+def test_order_reconciliation_leaves_permutations_untouched(tmp_path):
+    """An ordering that already covers every item is kept as the same list."""
+
+    config = DashboardConfig(
+        threads_base=str(tmp_path),
+        repo_order=["beta", "alpha"],
+        thread_order={"alpha": ["t2", "t1"], "beta": ["x", "x"]},
+    )
+    repo_order = config.repo_order
+    alpha_order = config.thread_order["alpha"]
+
+    config.ensure_repo_order(["alpha", "beta"])
+    config.apply_thread_order("alpha", ["t1", "t2"])
+    config.apply_thread_order("beta", ["x", "y"])
+    config.apply_thread_order("gamma", [])
+
+    assert config.repo_order is repo_order
+    assert config.thread_order["alpha"] is alpha_order
+    assert config.thread_order["beta"] == ["x", "x", "y"]
+    assert config.thread_order["gamma"] == []
+
+
+def test_config_bytes_match_with_and_without_orjson(monkeypatch):
+    from watercooler_dashboard import config as config_module
+
+    pytest.importorskip("orjson")
+    data = {"threads_base": "/tmp/Ünïcode", "repo_order": ["a"], "thread_order": {"a": []}}
+    with_orjson = config_module._dumps(data)
+    monkeypatch.setattr(config_module, "orjson", None)
+    assert config_module._dumps(data) == with_orjson
@@ -0,0 +1,122 @@
+"""Tests for the git commit/push helper."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+from git import Remote, Repo
+
+from watercooler_dashboard.git_helper import GitHelper
+
+
+def _init_repo(path: Path) -> Repo:
+    repo = Repo.init(path)
+    (path / "thread.md").write_text("# thread\n", encoding="utf-8")
+    repo.index.add(["thread.md"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+def test_commit_and_push_commits_thread_file(tmp_path):
+    repo = _init_repo(tmp_path / "alpha-threads")
+    root = Path(repo.working_dir)
+    (root / "thread.md").write_text("# thread\nStatus: OPEN\n", encoding="utf-8")
+
+    helper = GitHelper(root)
+    success, error = helper.commit_and_push(
+        root / "thread.md", "Update thread", author_name="Watercooler Dashboard"
+    )
+
+    assert (success, error) == (True, None)
+    head = repo.head.commit
+    assert head.message.strip() == "Update thread"
+    assert head.author.name == "Watercooler Dashboard"
+    assert head.author.email == "dashboard@watercooler.dev"
+    assert list(head.stats.files) == ["thread.md"]
+
+
+def test_commit_and_push_skips_unchanged_file(tmp_path):
+    repo = _init_repo(tmp_path / "alpha-threads")
+    initial = repo.head.commit.hexsha
+
+    helper = GitHelper(Path(repo.working_dir))
+    success, error = helper.commit_and_push(Path(repo.working_dir) / "thread.md", "No-op")
+
+    assert (success, error) == (True, None)
+    assert repo.head.commit.hexsha == initial
+
+
+def test_git_helper_unavailable_outside_repo(tmp_path):
+    helper = GitHelper(tmp_path)
+    assert not helper.is_available()
+    assert helper.commit_and_push(tmp_path / "thread.md", "msg") == (
+        False,
+        "Git repository not initialized",
+    )
+
+
+def test_schedule_push_coalesces_requests(tmp_path):
+    upstream = Repo.init(tmp_path / "upstream.git", bare=True)
+    repo = _init_repo(tmp_path / "alpha-threads")
+    repo.create_remote("origin", upstream.git_dir)
+    branch = repo.active_branch.name
+    repo.git.push("--set-upstream", "origin", branch)
+    root = Path(repo.working_dir)
+    helper = GitHelper(root)
+
+    pushes: list[int] = []
+    original_push = helper.push
+
+    def _counting_push():
+        pushes.append(1)
+        return original_push()
+
+    helper.push = _counting_push
+
+    async def scenario():
+        for index in range(3):
+            (root / "thread.md").write_text(f"# thread {index}\n", encoding="utf-8")
+            assert helper.commit(root / "thread.md", f"Update {index}") == (True, None)
+            assert helper.schedule_push() is True
+        await helper.wait_for_push()
+
+    asyncio.run(scenario())
+
+    assert upstream.commit(branch).hexsha == repo.head.commit.hexsha
+    assert len(pushes) == 1
+
+
+def test_commit_is_not_blocked_by_a_running_push(tmp_path, monkeypatch):
+    upstream = Repo.init(tmp_path / "upstream.git", bare=True)
+    repo = _init_repo(tmp_path / "alpha-threads")
+    repo.create_remote("origin", upstream.git_dir)
+    root = Path(repo.working_dir)
+    helper = GitHelper(root)
+
+    pushing = threading.Event()
+    release = threading.Event()
+
+    def slow_push(self, *args, **kwargs):
+        pushing.set()
+        release.wait(timeout=5)
+        return []
+
+    monkeypatch.setattr(Remote, "push", slow_push)
+    pusher = threading.Thread(target=helper.push)
+    pusher.start()
+    try:
+        assert pushing.wait(timeout=5)
+        (root / "thread.md").write_text("# thread\nStatus: OPEN\n", encoding="utf-8")
+        results: list[tuple[bool, str | None]] = []
+        committer = threading.Thread(
+            target=lambda: results.append(helper.commit(root / "thread.md", "Update while pushing"))
+        )
+        committer.start()
+        committer.join(timeout=2)
+        assert results == [(True, None)]
+        assert repo.head.commit.message.strip() == "Update while pushing"
+    finally:
+        release.set()
+        pusher.join()
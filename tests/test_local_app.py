@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from pathlib import Path
 
+from fastapi import Request
 from fastapi.testclient import TestClient
 
 from watercooler_dashboard import local_app
@@ -118,3 +122,582 @@ Ready to go.
     body = response.json()
     assert body["status"] == "ok"
     assert body["thread"]["priority"] == "P0"
+
+
+def test_build_payload_reuses_cache_until_files_change(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    thread_path = threads_root / "alpha-threads" / "sample.md"
+    thread_path.write_text("# sample\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    first = local_app._build_payload()
+    assert local_app._build_payload() is first
+
+    thread_path.write_text("# sample\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+    refreshed = local_app._build_payload()
+    assert refreshed is not first
+    assert refreshed["repos"][0]["threads"][0]["status"] == "CLOSED"
+
+    config = load_config()
+    config.repo_order = ["alpha", "beta"]
+    save_config(config)
+    assert local_app._build_payload() is not refreshed
+
+
+def test_index_escapes_threads_base(monkeypatch, tmp_path):
+    threads_root = tmp_path / 'odd"<base>'
+    (threads_root / "alpha-threads").mkdir(parents=True)
+    config_file = tmp_path / "config.json"
+    monkeypatch.setenv("WATERCOOLER_DASHBOARD_CONFIG", str(config_file))
+    save_config(DashboardConfig(threads_base=str(threads_root)))
+
+    client = TestClient(local_app.app)
+    response = client.get("/")
+    assert response.status_code == 200
+    assert 'value="' + str(tmp_path) + '/odd&quot;&lt;base&gt;"' in response.text
+    assert local_app.CSRF_TOKEN in response.text
+
+
+def test_index_shows_threads_base_from_a_pending_config(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+    pending_base = tmp_path / "pending-root"
+    pending = DashboardConfig(threads_base=str(pending_base))
+    monkeypatch.setattr(local_app, "_pending_config", (local_app.config_path(), pending))
+
+    response = TestClient(local_app.app).get("/")
+    assert 'value="' + str(pending_base) + '"' in response.text
+
+
+def test_render_index_keeps_dollar_signs_in_threads_base():
+    page, _ = local_app._render_index("/data/$threads_base/${x}")
+    assert b'value="/data/$threads_base/${x}"' in page
+    assert b"$csrf_token" not in page
+
+
+def test_index_serves_precompressed_gzip(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+
+    client = TestClient(local_app.app)
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == compressed.text
+
+
+def test_order_threads_appends_unordered_topics_alphabetically():
+    threads = [{"topic": name} for name in ("delta", "Bravo", "alpha", "charlie")]
+    ordered = local_app._order_threads(threads, ["charlie", "missing", "alpha"])
+    assert [thread["topic"] for thread in ordered] == ["charlie", "alpha", "Bravo", "delta"]
+
+
+def test_build_payload_saves_config_only_when_order_changes(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    thread_path = threads_root / "alpha-threads" / "sample.md"
+    thread_path.write_text("# sample\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    saves = []
+    monkeypatch.setattr(local_app, "save_config", lambda config: saves.append(config))
+
+    local_app._build_payload()
+    assert len(saves) == 1
+
+    save_config(saves[0])
+    thread_path.write_text("# sample\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+    local_app._build_payload()
+    assert len(saves) == 1
+
+
+def test_data_endpoint_matches_with_and_without_orjson(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    (threads_root / "alpha-threads" / "sample.md").write_text(
+        "# sample\nStatus: OPEN\nBall: Ünïcode\n\n---\n", encoding="utf-8"
+    )
+
+    client = TestClient(local_app.app)
+    fast = client.get("/api/data").json()
+    monkeypatch.setattr(local_app, "orjson", None)
+    monkeypatch.setattr(local_app, "_payload_cache", {})
+    monkeypatch.setattr(local_app, "_repo_fragments", {})
+    assert client.get("/api/data").json() == fast
+
+
+def test_payload_body_reuses_fragments_of_unchanged_repos(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    (threads_root / "alpha-threads" / "one.md").write_text("# one\nStatus: OPEN\n\n---\n")
+    (threads_root / "beta-threads").mkdir()
+    beta_thread = threads_root / "beta-threads" / "two.md"
+    beta_thread.write_text("# two\nStatus: OPEN\n\n---\n")
+
+    _, body = local_app._build_payload_body()
+    assert json.loads(body) == local_app._build_payload()
+    alpha_fragment = local_app._repo_fragments["alpha"][2]
+    beta_fragment = local_app._repo_fragments["beta"][2]
+
+    beta_thread.write_text("# two\nStatus: CLOSED\n\n---\n")
+    refreshed = json.loads(local_app._build_payload_body()[1])
+    assert refreshed["repos"][1]["threads"][0]["status"] == "CLOSED"
+    assert local_app._repo_fragments["alpha"][2] is alpha_fragment
+    assert local_app._repo_fragments["beta"][2] is not beta_fragment
+
+
+def test_data_endpoint_returns_304_for_matching_etag(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    thread_path = threads_root / "alpha-threads" / "sample.md"
+    thread_path.write_text("# sample\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    client = TestClient(local_app.app)
+    first = client.get("/api/data")
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/data", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    thread_path.write_text("# sample\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+    changed = client.get("/api/data", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_etag_matching_uses_weak_comparison():
+    etag = '"abc"'
+    assert local_app._etag_matches(etag, '"abc"')
+    assert local_app._etag_matches(etag, 'W/"abc"')
+    assert local_app._etag_matches(etag, '"old", W/"abc"')
+    assert local_app._etag_matches(etag, "*")
+    assert not local_app._etag_matches(etag, '"abcd"')
+    assert not local_app._etag_matches(etag, "")
+
+
+def test_accepts_gzip_honours_q_values():
+    assert local_app._accepts_gzip("gzip, deflate, br")
+    assert local_app._accepts_gzip("br;q=1.0, GZIP;q=0.5")
+    assert local_app._accepts_gzip("*")
+    assert not local_app._accepts_gzip("gzip;q=0")
+    assert not local_app._accepts_gzip("gzip; q=0.000, identity")
+    assert not local_app._accepts_gzip("*, gzip;q=0")
+    assert not local_app._accepts_gzip("*;q=0")
+    assert not local_app._accepts_gzip("identity")
+    assert not local_app._accepts_gzip("")
+
+
+def test_order_endpoints_reject_malformed_bodies(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+    with _client() as client:
+        response = client.post(
+            "/api/repo-order",
+            headers=_auth_headers(),
+            json={"order": "alpha"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid payload: order")
+
+        response = client.post(
+            "/api/thread-order",
+            headers=_auth_headers(),
+            json={"repo": "alpha", "order": ["one", "two"]},
+        )
+        assert response.status_code == 200
+    assert load_config().thread_order["alpha"] == ["one", "two"]
+
+
+def test_order_endpoints_coerce_items_to_strings(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+    with _client() as client:
+        response = client.post(
+            "/api/thread-order",
+            headers=_auth_headers(),
+            json={"repo": "alpha", "order": ["one", 2, None]},
+        )
+        assert response.status_code == 200
+        response = client.post(
+            "/api/repo-order", headers=_auth_headers(), json={"order": [1, "alpha"]}
+        )
+        assert response.status_code == 200
+    local_app._flush_config()
+    config = load_config()
+    assert config.thread_order["alpha"] == ["one", "2", "None"]
+    assert config.repo_order == ["1", "alpha"]
+
+
+def test_index_links_versioned_static_assets(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+
+    client = TestClient(local_app.app)
+    page = client.get("/").text
+    js_url = page.split('<script type="module" src="', 1)[1].split('"', 1)[0]
+    assert js_url.startswith("/static/app.js?v=")
+    assert "/static/app.css?v=" in page
+
+    asset = client.get(js_url)
+    assert asset.status_code == 200
+    assert "immutable" in asset.headers["cache-control"]
+    assert "CSRF_TOKEN" in asset.text
+
+
+def test_parser_shared_per_threads_base(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    parser = local_app._get_parser(str(threads_root))
+    assert local_app._get_parser(str(threads_root)) is parser
+
+    with _client() as client:
+        response = client.post(
+            "/api/config/threads-base",
+            headers=_auth_headers(),
+            json={"threadsBase": str(threads_root)},
+        )
+    assert response.status_code == 200
+    assert local_app._get_parser(str(threads_root)) is not parser
+
+
+def test_payload_delta_only_carries_changed_repos(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    (threads_root / "alpha-threads" / "one.md").write_text("# one\nStatus: OPEN\n\n---\n")
+    (threads_root / "beta-threads").mkdir()
+    beta_thread = threads_root / "beta-threads" / "two.md"
+    beta_thread.write_text("# two\nStatus: OPEN\n\n---\n")
+
+    previous, version = local_app._build_payload_version()
+    full = local_app._payload_delta(None, previous)
+    assert [repo["name"] for repo in full["repos"]] == ["alpha", "beta"]
+
+    beta_thread.write_text("# two\nStatus: CLOSED\n\n---\n")
+    current, new_version = local_app._build_payload_version()
+    delta = local_app._payload_delta(previous, current)
+    assert new_version != version
+    assert delta["order"] == ["alpha", "beta"]
+    assert [repo["name"] for repo in delta["repos"]] == ["beta"]
+    assert delta["repos"][0]["threads"][0]["status"] == "CLOSED"
+
+
+def test_unchanged_threads_are_not_reserialized(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    repo_dir = threads_root / "alpha-threads"
+    (repo_dir / "one.md").write_text("# one\nStatus: OPEN\n\n---\n")
+    two = repo_dir / "two.md"
+    two.write_text("# two\nStatus: OPEN\n\n---\n")
+
+    first = {t["topic"]: t for t in local_app._build_payload()["repos"][0]["threads"]}
+
+    two.write_text("# two\nStatus: BLOCKED\n\n---\n")
+    second = {t["topic"]: t for t in local_app._build_payload()["repos"][0]["threads"]}
+
+    assert second["one"] is first["one"]
+    assert second["two"] is not first["two"]
+    assert second["two"]["status"] == "BLOCKED"
+
+
+def test_change_frames_are_shared_between_clients(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    thread_path = threads_root / "alpha-threads" / "one.md"
+    thread_path.write_text("# one\nStatus: OPEN\n\n---\n")
+
+    payload, version, frame = local_app._poll_change(None, None)
+    assert frame.startswith(b"id: " + version.encode() + b"\nevent: change\ndata: ")
+    assert local_app._poll_change(payload, version)[2] is None
+
+    thread_path.write_text("# one\nStatus: CLOSED\n\n---\n")
+    first = local_app._poll_change(payload, version)[2]
+    second = local_app._poll_change(payload, version)[2]
+    assert first is second
+    assert b'"CLOSED"' in first
+
+
+def test_post_accepts_request_host_origin(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    with TestClient(local_app.app, base_url="http://dash.local:9000") as client:
+        response = client.post(
+            "/api/config/threads-base",
+            headers=_auth_headers("http://dash.local:9000"),
+            json={"threadsBase": str(threads_root)},
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/api/config/threads-base",
+            headers=_auth_headers("http://elsewhere.local:9000"),
+            json={"threadsBase": str(threads_root)},
+        )
+        assert response.status_code == 403
+
+
+def test_origin_from_url_extracts_scheme_and_host():
+    assert local_app._origin_from_url("http://localhost:8080/dash?x=1") == "http://localhost:8080"
+    assert local_app._origin_from_url("HTTPS://Example.test#frag") == "https://Example.test"
+    assert local_app._origin_from_url("null") is None
+    assert local_app._origin_from_url("http:///path") is None
+    assert local_app._origin_from_url(None) is None
+
+
+def test_message_frame_encodes_sse_data_line():
+    frame = local_app._message_frame({"type": "threads:updated", "repos": ["a"]})
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert json.loads(frame[len(b"data: ") :]) == {"type": "threads:updated", "repos": ["a"]}
+
+
+def test_entry_preview_keeps_first_three_non_blank_lines():
+    body = "\n  first  \n\n second\n\t\nthird\nfourth\n" + "x" * 10_000
+    assert local_app._entry_preview(body) == "first\nsecond\nthird"
+    assert local_app._entry_preview("only") == "only"
+    assert local_app._entry_preview("") == ""
+
+
+def test_normalize_status_handles_spacing_and_missing_values():
+    assert local_app._normalize_status("in review") == ("IN REVIEW", "in_review")
+    assert local_app._normalize_status("OPEN") == ("OPEN", "open")
+    assert local_app._normalize_status(None) == ("UNKNOWN", "unknown")
+
+
+def test_repo_root_lookups_are_cached_per_directory(tmp_path: Path, monkeypatch):
+    calls: list[Path] = []
+
+    def fake_repo_root(path: Path):
+        calls.append(path)
+
+    monkeypatch.setattr(local_app, "get_repo_root", fake_repo_root)
+    local_app._cached_repo_root.cache_clear()
+    try:
+        assert local_app._get_git_helper(tmp_path / "a.md") is None
+        assert local_app._get_git_helper(tmp_path / "b.md") is None
+        assert calls == [tmp_path]
+    finally:
+        local_app._cached_repo_root.cache_clear()
+
+
+def test_data_stream_hub_polls_once_for_all_subscribers(monkeypatch):
+    calls: list[str | None] = []
+
+    def fake_poll_change(previous, previous_version):
+        calls.append(previous_version)
+        return {"repos": []}, "v1", b"frame"
+
+    monkeypatch.setattr(local_app, "_poll_change", fake_poll_change)
+    monkeypatch.setattr(local_app, "DATA_STREAM_INTERVAL", 0.01)
+
+    async def scenario():
+        hub = local_app._DataStreamHub()
+        first, second = hub.subscribe(), hub.subscribe()
+        update = await asyncio.wait_for(first.get(), timeout=1.0)
+        assert await asyncio.wait_for(second.get(), timeout=1.0) is update
+        assert update == (None, "v1", {"repos": []}, b"frame")
+        hub.unsubscribe(first)
+        hub.unsubscribe(second)
+        assert hub._task is None
+
+    asyncio.run(scenario())
+    assert calls[0] is None
+    assert all(version == "v1" for version in calls[1:])
+
+
+def test_build_payload_lists_empty_repos_without_threads(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    (threads_root / "beta-threads").mkdir()
+    (threads_root / "alpha-threads" / "sample.md").write_text(
+        "# sample\nStatus: OPEN\n\n---\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(local_app, "_payload_cache", {})
+    monkeypatch.setattr(local_app, "_repo_fragments", {})
+
+    payload = local_app._build_payload()
+    repos = {repo["name"]: repo["threads"] for repo in payload["repos"]}
+    assert repos["beta"] == []
+    assert [thread["topic"] for thread in repos["alpha"]] == ["sample"]
+    assert json.loads(local_app._build_payload_body()[1]) == payload
+
+
+def test_concurrent_data_requests_share_one_build(monkeypatch):
+    calls: list[int] = []
+
+    def slow_build():
+        calls.append(1)
+        time.sleep(0.05)
+        return '"etag"', b"{}"
+
+    monkeypatch.setattr(local_app, "_build_payload_body", slow_build)
+    monkeypatch.setattr(local_app, "_inflight_payload", None)
+
+    async def scenario():
+        results = await asyncio.gather(*(local_app._shared_payload_body() for _ in range(3)))
+        assert results == [('"etag"', b"{}")] * 3
+        assert calls == [1]
+        # A request after the build finished starts a fresh one
+        await local_app._shared_payload_body()
+        assert calls == [1, 1]
+
+    asyncio.run(scenario())
+
+
+def test_data_requests_after_a_write_do_not_join_an_older_build(monkeypatch):
+    builds: list[int] = []
+
+    def slow_build():
+        builds.append(1)
+        version = len(builds)
+        time.sleep(0.05)
+        return f'"v{version}"', b"{}"
+
+    monkeypatch.setattr(local_app, "_build_payload_body", slow_build)
+    monkeypatch.setattr(local_app, "_inflight_payload", None)
+
+    async def scenario():
+        before = asyncio.ensure_future(local_app._shared_payload_body())
+        await asyncio.sleep(0.01)
+        local_app._bump_payload_generation()
+        after = await local_app._shared_payload_body()
+        assert (await before)[0] == '"v1"'
+        assert after[0] == '"v2"'
+
+    asyncio.run(scenario())
+
+
+def test_deferred_order_saves_are_batched(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+    monkeypatch.setattr(local_app, "CONFIG_SAVE_DELAY", 0.05)
+    saves: list[list[str]] = []
+    real_save = local_app.save_config
+
+    def counting_save(config, path=None):
+        saves.append(list(config.repo_order))
+        real_save(config, path)
+
+    monkeypatch.setattr(local_app, "save_config", counting_save)
+
+    for order in (["b", "a"], ["a", "b"], ["c", "a", "b"]):
+
+        def _set(config, order=order):
+            config.repo_order = list(order)
+            return True
+
+        local_app._update_config(_set, defer=True)
+
+    # Handlers see the pending order before it reaches the disk
+    with local_app._config_lock:
+        assert local_app._load_config().repo_order == ["c", "a", "b"]
+    assert saves == []
+
+    time.sleep(0.2)
+    assert saves == [["c", "a", "b"]]
+    assert load_config().repo_order == ["c", "a", "b"]
+    assert local_app._pending_config is None
+
+
+def test_live_config_is_reused_until_the_file_changes(monkeypatch, tmp_path):
+    _setup_config(tmp_path, monkeypatch)
+    monkeypatch.setattr(local_app, "_live_config", None)
+
+    with local_app._config_lock:
+        first = local_app._load_config()
+        assert local_app._load_config() is first
+
+        edited = load_config()
+        edited.repo_order = ["outside"]
+        save_config(edited)
+        reloaded = local_app._load_config()
+
+    assert reloaded is not first
+    assert reloaded.repo_order == ["outside"]
+
+
+def test_validate_thread_path_requires_a_threads_repo_under_the_base(tmp_path):
+    base = tmp_path / "work-threads" / "nested"
+    (base / "alpha-threads").mkdir(parents=True)
+    (base / "loose").mkdir()
+    inside = base / "alpha-threads" / "t.md"
+    loose = base / "loose" / "t.md"
+    inside.write_text("# t\n", encoding="utf-8")
+    loose.write_text("# t\n", encoding="utf-8")
+    local_app._real_threads_base.cache_clear()
+
+    try:
+        assert local_app._validate_thread_path(str(inside), str(base)) == inside.resolve()
+        # The nearest repository is an ancestor of the base, not inside it
+        try:
+            local_app._validate_thread_path(str(loose), str(base))
+        except local_app.HTTPException as exc:
+            assert exc.detail == "Thread file is outside the configured threads base"
+        else:
+            raise AssertionError("expected the path to be rejected")
+    finally:
+        local_app._real_threads_base.cache_clear()
+
+
+def test_data_endpoint_gzips_large_payloads(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    for index in range(20):
+        (threads_root / "alpha-threads" / f"thread-{index}.md").write_text(
+            f"# thread-{index}\nStatus: OPEN\n\n---\n", encoding="utf-8"
+        )
+
+    client = TestClient(local_app.app)
+    plain = client.get("/api/data", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    refused = client.get("/api/data", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+    compressed = client.get("/api/data", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == "W/" + plain.headers["etag"]
+    assert compressed.json() == plain.json()
+
+    cached = client.get(
+        "/api/data",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_data_stream_skips_catch_up_for_weak_etag_from_gzip(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    for index in range(20):
+        (threads_root / "alpha-threads" / f"thread-{index}.md").write_text(
+            f"# thread-{index}\nStatus: OPEN\n\n---\n", encoding="utf-8"
+        )
+    monkeypatch.setattr(local_app, "DATA_STREAM_INTERVAL", 0.01)
+    monkeypatch.setattr(local_app, "DATA_STREAM_KEEPALIVE", 0.02)
+
+    etag = TestClient(local_app.app).get("/api/data", headers={"Accept-Encoding": "gzip"})
+    etag = etag.headers["etag"]
+    assert etag.startswith("W/")
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def frames_until_keepalive() -> list[bytes]:
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/data/stream",
+            "query_string": b"since=" + etag.encode(),
+            "headers": [],
+        }
+        response = await local_app.data_stream(Request(scope, receive))
+        stream = response.body_iterator
+        frames: list[bytes] = []
+        try:
+            while not frames or frames[-1] != local_app._SSE_KEEPALIVE:
+                frames.append(await asyncio.wait_for(stream.__anext__(), timeout=2.0))
+        finally:
+            await stream.aclose()
+        return frames
+
+    frames = asyncio.run(frames_until_keepalive())
+    assert not any(b"event: change" in frame for frame in frames)
+
+
+def test_parse_cache_is_saved_for_the_configured_threads_base(monkeypatch, tmp_path):
+    threads_root = _setup_config(tmp_path, monkeypatch)
+    (threads_root / "alpha-threads" / "sample.md").write_text(
+        "# sample\nStatus: OPEN\n\n---\n", encoding="utf-8"
+    )
+    cache_file = tmp_path / "cache" / "threads.json"
+    monkeypatch.setenv(local_app.PARSE_CACHE_ENV_VAR, str(cache_file))
+    local_app._get_parser.cache_clear()
+    try:
+        local_app._get_parser(str(threads_root)).get_threads_by_repo()
+        local_app._save_parse_cache()
+    finally:
+        local_app._get_parser.cache_clear()
+
+    assert local_app.ThreadParser(str(threads_root)).load_cache(cache_file) == 1
@@ -1,5 +1,8 @@
 """Tests for thread parser."""
 
+import os
+import time
+
 import pytest
 from pathlib import Path
 from watercooler_dashboard.thread_parser import ThreadParser
@@ -46,7 +49,8 @@ Type: Note
 Title: Initial note
 
 Body
-"""
+""",
+        encoding="utf-8",
     )
 
     (repo_b / "thread-two.md").write_text(
@@ -62,7 +66,8 @@ Type: Note
 Title: Planning
 
 Body
-"""
+""",
+        encoding="utf-8",
     )
 
     parser = ThreadParser(threads_base=str(tmp_path))
@@ -97,7 +102,8 @@ First paragraph before rule.
 ---
 
 Second paragraph after rule.
-"""
+""",
+        encoding="utf-8",
     )
 
     parser = ThreadParser(threads_base=str(tmp_path))
@@ -174,3 +180,347 @@ All good.
     assert data is not None
     assert data["has_new"] is False
     assert not data["entries"][-1]["is_new"]
+
+
+def test_parallel_grouping_keeps_repo_order(tmp_path):
+    """Concurrent parsing should still return repos in sorted order."""
+
+    names = ["delta", "Alpha", "charlie", "bravo", "echo"]
+    for name in names:
+        repo = tmp_path / f"{name}-threads"
+        repo.mkdir()
+        (repo / f"{name}.md").write_text(f"# {name}\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    grouped = ThreadParser(threads_base=str(tmp_path)).get_threads_by_repo()
+
+    assert list(grouped) == ["Alpha", "bravo", "charlie", "delta", "echo"]
+    assert all(len(threads) == 1 for threads in grouped.values())
+
+
+def test_archived_threads_are_flagged(tmp_path):
+    """Threads under an _archive directory carry is_archived."""
+
+    repo = tmp_path / "alpha-threads"
+    (repo / "_archive").mkdir(parents=True)
+    (repo / "live.md").write_text("# live\nStatus: OPEN\n\n---\n", encoding="utf-8")
+    (repo / "_archive" / "old.md").write_text("# old\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+
+    threads = ThreadParser(threads_base=str(tmp_path)).get_threads_by_repo()["alpha"]
+
+    assert {thread["topic"]: thread["is_archived"] for thread in threads} == {
+        "live": False,
+        "old": True,
+    }
+
+
+def test_split_header_and_body_handles_crlf_and_repeated_separators():
+    """Header/body splitting should treat CRLF like LF and skip doubled separators."""
+
+    parser = ThreadParser(threads_base="/nonexistent/path")
+    lf = "# Title\nStatus: OPEN\n\n---\n---\nEntry: Bob 2025-01-01T00:00:00Z\nTitle: One\n\nBody\n"
+    crlf = lf.replace("\n", "\r\n")
+
+    header, body = parser._split_header_and_body(lf)
+    assert header == ["# Title", "Status: OPEN"]
+    assert body == "Entry: Bob 2025-01-01T00:00:00Z\nTitle: One\n\nBody"
+    assert parser._split_header_and_body(crlf) == (header, body)
+
+    entries = list(parser._parse_entries(body))
+    assert entries[0]["title"] == "One"
+    assert entries[0]["body"] == "Body"
+
+
+def test_thread_file_walk_matches_rglob(tmp_path):
+    """The scandir walker should find the same thread files as rglob."""
+
+    from watercooler_dashboard.thread_parser import _iter_thread_files
+
+    repo = tmp_path / "alpha-threads"
+    (repo / "nested" / "deeper").mkdir(parents=True)
+    (repo / "dir.md").mkdir()
+    for relative in (
+        "a.md",
+        "README.md",
+        "notes.txt",
+        "nested/b.md",
+        "nested/deeper/c.md",
+        "dir.md/d.md",
+    ):
+        (repo / relative).write_text("# t\n", encoding="utf-8")
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "e.md").write_text("# t\n", encoding="utf-8")
+    (repo / "linked").symlink_to(tmp_path / "outside", target_is_directory=True)
+
+    expected = {
+        str(path)
+        for path in repo.rglob("*.md")
+        if path.name not in {"README.md", "INDEX.md"} and path.is_file()
+    }
+    assert {entry.path for entry in _iter_thread_files(repo)} == expected
+    assert len(expected) == 4
+
+
+def test_read_file_handles_files_that_changed_size(tmp_path):
+    """Files that grew or shrank since their stat are still read in full."""
+
+    from watercooler_dashboard.thread_parser import _read_file
+
+    path = tmp_path / "thread.md"
+    data = b"x" * 100_000
+    path.write_bytes(data)
+
+    assert _read_file(str(path), len(data)) == data
+    assert _read_file(str(path), 10) == data
+    assert _read_file(str(path), 200_000) == data
+
+
+def test_read_file_keeps_reading_after_short_reads(tmp_path, monkeypatch):
+    """A read returning fewer bytes than asked for is not taken as end of file."""
+
+    from watercooler_dashboard.thread_parser import _read_file
+
+    path = tmp_path / "thread.md"
+    data = bytes(range(256)) * 40
+    path.write_bytes(data)
+    real_read = os.read
+    monkeypatch.setattr(os, "read", lambda fd, count: real_read(fd, min(count, 100)))
+
+    assert _read_file(str(path), len(data)) == data
+
+
+def test_crlf_thread_file_parses_like_lf(tmp_path):
+    """Thread files with Windows line endings should parse the same as LF files."""
+
+    repo = tmp_path / "alpha-threads"
+    repo.mkdir()
+    text = "# t\nStatus: OPEN\n\n---\nEntry: Bob 2025-01-01T00:00:00Z\nTitle: One\n\nBody\n"
+    (repo / "lf.md").write_bytes(text.encode("utf-8"))
+    (repo / "crlf.md").write_bytes(text.replace("\n", "\r\n").encode("utf-8"))
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    lf = parser._parse_thread_file(repo / "lf.md")
+    crlf = parser._parse_thread_file(repo / "crlf.md")
+    for key in ("title", "status", "entries", "last_update", "metadata"):
+        assert lf[key] == crlf[key]
+
+
+def test_pooled_parsing_regroups_files_per_repo(tmp_path):
+    """Files parsed through the shared pool land back in their own repository."""
+
+    for repo_name, count in (("alpha", 7), ("bravo", 0), ("charlie", 3)):
+        repo = tmp_path / f"{repo_name}-threads"
+        repo.mkdir()
+        for index in range(count):
+            (repo / f"{repo_name}-{index}.md").write_text(
+                "# t\nStatus: OPEN\n\n---\n", encoding="utf-8"
+            )
+
+    grouped = ThreadParser(threads_base=str(tmp_path)).get_threads_by_repo()
+
+    assert list(grouped) == ["alpha", "bravo", "charlie"]
+    assert [thread["topic"] for thread in grouped["alpha"]] == [f"alpha-{i}" for i in range(7)]
+    assert grouped["bravo"] == []
+    assert all(thread["repo"] == "charlie" for thread in grouped["charlie"])
+    assert len(grouped["charlie"]) == 3
+
+
+def test_unchanged_thread_files_are_not_reparsed(tmp_path):
+    """Only files whose mtime or size changed are parsed again."""
+
+    repo = tmp_path / "alpha-threads"
+    repo.mkdir()
+    (repo / "one.md").write_text("# one\nStatus: OPEN\n\n---\n", encoding="utf-8")
+    (repo / "two.md").write_text("# two\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    parsed: list[str] = []
+    original = parser._parse_thread_file
+
+    def counting_parse(file_path, *args):
+        parsed.append(file_path.name)
+        return original(file_path, *args)
+
+    parser._parse_thread_file = counting_parse
+
+    parser.get_threads_by_repo()
+    assert sorted(parsed) == ["one.md", "two.md"]
+
+    parsed.clear()
+    parser.get_threads_by_repo()
+    assert parsed == []
+
+    (repo / "two.md").write_text("# two\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+    threads = parser.get_threads_by_repo()["alpha"]
+    assert parsed == ["two.md"]
+    assert {thread["topic"]: thread["status"] for thread in threads} == {
+        "one": "OPEN",
+        "two": "CLOSED",
+    }
+
+    parsed.clear()
+    updated = parser.update_thread_metadata(repo / "one.md", {"Status": "DONE"})
+    assert updated["status"] == "DONE"
+    assert [thread["status"] for thread in parser.get_threads_by_repo()["alpha"]] == [
+        "DONE",
+        "CLOSED",
+    ]
+    # The update parsed the text it wrote, so neither it nor the walk read the file back
+    assert parsed == []
+    assert "git_status" not in parser.get_threads_by_repo()["alpha"][0]
+
+
+def test_parse_cache_evicts_least_recently_used_files(tmp_path, monkeypatch):
+    """The parse cache stays bounded and drops the least recently used file first."""
+
+    from watercooler_dashboard import thread_parser
+
+    monkeypatch.setattr(thread_parser, "MAX_CACHED_THREADS", 2)
+    repo = tmp_path / "alpha-threads"
+    repo.mkdir()
+    for name in ("one", "two", "three"):
+        (repo / f"{name}.md").write_text(f"# {name}\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    snapshot = dict(parser.fingerprint())["alpha"]
+    stamps = {Path(stamp[0]).stem: stamp for stamp in snapshot}
+
+    parser._load_stamped(stamps["one"])
+    parser._load_stamped(stamps["two"])
+    parser._load_stamped(stamps["one"])
+    parser._load_stamped(stamps["three"])
+
+    assert [Path(path).stem for path in parser._cache] == ["one", "three"]
+
+
+def test_grouping_from_a_fingerprint_does_not_walk_again(tmp_path, monkeypatch):
+    """A fingerprint snapshot is parsed directly, without a second walk or stat."""
+
+    from watercooler_dashboard import thread_parser
+
+    repo = tmp_path / "alpha-threads"
+    repo.mkdir()
+    (repo / "b.md").write_text("# bravo\nStatus: OPEN\n\n---\n", encoding="utf-8")
+    (repo / "a.md").write_text("# alpha\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    snapshot = parser.fingerprint()
+
+    def no_walk(repo_path):
+        raise AssertionError("snapshot should be reused")
+
+    monkeypatch.setattr(thread_parser, "_iter_thread_files", no_walk)
+    grouped = parser.get_threads_by_repo(snapshot)
+
+    assert [thread["topic"] for thread in grouped["alpha"]] == ["a", "b"]
+
+
+def test_enum_like_fields_share_one_string_across_threads(tmp_path):
+    """Repeated status, ball and author values are interned, not copied per thread."""
+
+    repo = tmp_path / "alpha-threads"
+    repo.mkdir()
+    for name in ("one", "two"):
+        (repo / f"{name}.md").write_text(
+            f"# {name}\nStatus: IN_REVIEW\nBall: Codex\n\n---\n\n"
+            "Entry: Claude (agent) 2025-01-01T00:00:00Z\nRole: planner\n\nBody\n",
+            encoding="utf-8",
+        )
+
+    one, two = ThreadParser(threads_base=str(tmp_path)).get_threads_by_repo()["alpha"]
+
+    assert one["status"] is two["status"]
+    assert one["ball_owner"] is two["ball_owner"]
+    assert one["entries"][0]["author"] is two["entries"][0]["author"]
+    assert one["entries"][0]["role"] is two["entries"][0]["role"]
+
+
+def test_saved_parse_cache_warms_a_new_parser(tmp_path):
+    """A saved cache is reused for unchanged files and ignored for other bases."""
+
+    base = tmp_path / "base"
+    repo = base / "alpha-threads"
+    repo.mkdir(parents=True)
+    (repo / "one.md").write_text("# one\nStatus: OPEN\n\n---\n", encoding="utf-8")
+    (repo / "two.md").write_text("# two\nStatus: OPEN\n\n---\n", encoding="utf-8")
+    cache_file = tmp_path / "cache" / "threads.json"
+
+    first = ThreadParser(threads_base=str(base))
+    first.get_threads_by_repo()
+    assert first.save_cache(cache_file) == 2
+
+    (repo / "two.md").write_text("# two\nStatus: CLOSED\n\n---\n", encoding="utf-8")
+    second = ThreadParser(threads_base=str(base))
+    assert second.load_cache(cache_file) == 2
+
+    parsed: list[str] = []
+    original = second._parse_thread_file
+
+    def counting_parse(file_path, *args):
+        parsed.append(file_path.name)
+        return original(file_path, *args)
+
+    second._parse_thread_file = counting_parse
+    threads = second.get_threads_by_repo()["alpha"]
+
+    assert parsed == ["two.md"]
+    assert [thread["status"] for thread in threads] == ["OPEN", "CLOSED"]
+
+    assert ThreadParser(threads_base=str(tmp_path)).load_cache(cache_file) == 0
+    cache_file.write_text("{not json", encoding="utf-8")
+    assert ThreadParser(threads_base=str(base)).load_cache(cache_file) == 0
+
+
+def test_render_header_keeps_order_then_preferred_then_rest():
+    """Header rendering dedupes keys and skips empty values."""
+
+    parser = ThreadParser(threads_base="/nonexistent/path")
+    metadata = {"Custom": "x", "Ball": "Bob", "Status": "OPEN", "Empty": " ", "Spec": "s"}
+    order = ["Spec", "Custom", "Spec"]
+
+    assert parser._render_header("T", metadata, order) == (
+        "# T\nSpec: s\nCustom: x\nStatus: OPEN\nBall: Bob"
+    )
+
+
+def test_repo_listing_is_reused_until_the_base_changes(tmp_path, monkeypatch):
+    """The base is rescanned only when its mtime moves, and a fresh mtime is not trusted."""
+
+    (tmp_path / "alpha-threads").mkdir()
+    settled = time.time_ns() - 10_000_000_000
+    os.utime(tmp_path, ns=(settled, settled))
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    assert [path.name for path in parser.list_repositories()] == ["alpha-threads"]
+
+    scans: list[str] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(str(path)) or real_scandir(path))
+
+    assert parser.get_threads_for_repo("alpha") == []
+    assert str(tmp_path) not in scans
+
+    # Adding a repo moves the base mtime; the new, still-recent listing is rescanned
+    (tmp_path / "beta-threads").mkdir()
+    assert [path.name for path in parser.list_repositories()] == ["alpha-threads", "beta-threads"]
+    parser.list_repositories()
+    assert scans.count(str(tmp_path)) == 2
+
+
+def test_iter_all_threads_streams_in_get_all_threads_order(tmp_path):
+    """Threads are yielded lazily, repo by repo, in the same order as the list API."""
+
+    for repo_name in ("beta", "alpha"):
+        repo = tmp_path / f"{repo_name}-threads"
+        repo.mkdir()
+        for topic in ("two", "one"):
+            (repo / f"{topic}.md").write_text(f"# {topic}\nStatus: OPEN\n\n---\n", encoding="utf-8")
+
+    parser = ThreadParser(threads_base=str(tmp_path))
+    stream = parser.iter_all_threads()
+
+    assert not isinstance(stream, list)
+    assert (
+        [(thread["repo"], thread["topic"]) for thread in stream]
+        == [(thread["repo"], thread["topic"]) for thread in parser.get_all_threads()]
+        == [("alpha", "one"), ("alpha", "two"), ("beta", "one"), ("beta", "two")]
+    )